@@ -1,14 +1,234 @@
+import bisect
+import codecs
+from contextlib import contextmanager, nullcontext
+from decimal import Decimal, ROUND_HALF_UP
+import heapq
 import json
-from typing import List, Optional
+import re
+import sqlite3
+import sys
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import os
 
 
+def a_centavos(monto: Union[int, float, str]) -> int:
+    """
+    Convierte un monto a centavos enteros, redondeando la mitad hacia arriba (1.005 -> 101).
+    Los precios y el dinero en caja se guardan en centavos para que las sumas sean exactas.
+    """
+    if isinstance(monto, int):
+        return monto * 100
+    if isinstance(monto, float):
+        escalado = monto * 100
+        centavos = round(escalado)
+        # Solo los valores cercanos a medio centavo necesitan el cálculo decimal exacto
+        if abs(abs(escalado - centavos) - 0.5) > 1e-6:
+            return int(centavos)
+        monto = repr(monto)
+    return int(Decimal(monto).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+def a_monto(centavos: int) -> float:
+    """Convierte centavos a un monto con decimales para mostrarlo o devolverlo."""
+    return centavos / 100
+
+
+def escribir_snapshot_atomico(ruta: str, datos, generaciones: int = 3, **opciones_json) -> None:
+    """
+    Escribe `datos` como JSON en `ruta` sin riesgo de dejar el archivo truncado.
+    Escribe primero en un archivo temporal, lo sincroniza con fsync y lo renombra
+    sobre `ruta`. Las versiones anteriores se conservan como ruta.1 ... ruta.N.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, **opciones_json)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+
+    # Rotar generaciones: ruta.(N-1) -> ruta.N, ..., ruta -> ruta.1
+    for i in range(generaciones - 1, 0, -1):
+        if os.path.exists(f"{ruta}.{i}"):
+            os.replace(f"{ruta}.{i}", f"{ruta}.{i + 1}")
+    if generaciones > 0 and os.path.exists(ruta):
+        os.replace(ruta, f"{ruta}.1")
+    os.replace(temporal, ruta)
+
+    # Sincronizar el directorio para que el renombrado sobreviva a un corte de energía
+    if os.name != 'nt':
+        descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+# Caracteres que pueden continuar un número JSON (o espacios) al final de un bloque leído
+_CONTINUACION_JSON = re.compile(r'[ \t\r\n0-9.eE+-]*')
+
+
+def iterar_json(archivo, progreso: Optional[Callable[[int, int], None]] = None,
+                tamano_bloque: int = 1 << 16) -> Iterator:
+    """
+    Recorre un arreglo JSON (o un objeto JSON) leyendo el archivo binario por bloques.
+    Genera cada elemento del arreglo, o cada par (clave, valor) del objeto, sin cargar
+    el archivo completo en memoria. Si se indica `progreso`, se llama con
+    (bytes_leidos, bytes_totales) después de leer cada bloque.
+    Lanza json.JSONDecodeError si el contenido está incompleto o mal formado.
+    """
+    decodificador = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    total = os.fstat(archivo.fileno()).st_size
+    leidos = 0
+    texto = ""
+    pos = 0
+    fin_archivo = False
+
+    def leer_bloque() -> bool:
+        # Añade el siguiente bloque al texto pendiente; False si ya no hay más datos
+        nonlocal texto, pos, leidos, fin_archivo
+        if fin_archivo:
+            return False
+        bloque = archivo.read(tamano_bloque)
+        leidos += len(bloque)
+        fin_archivo = not bloque
+        texto = texto[pos:] + utf8.decode(bloque, final=fin_archivo)
+        pos = 0
+        if progreso is not None and bloque:
+            progreso(leidos, total)
+        return bool(bloque)
+
+    def saltar_espacios() -> str:
+        # Avanza hasta el siguiente carácter significativo ("" al final del archivo)
+        nonlocal pos
+        while True:
+            while pos < len(texto) and texto[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(texto) or not leer_bloque():
+                return texto[pos:pos + 1]
+
+    def leer_valor():
+        # Decodifica el siguiente valor; si queda cortado al final del bloque, lee más y reintenta
+        nonlocal pos
+        while True:
+            try:
+                valor, fin = decodificador.raw_decode(texto, pos)
+                # Un número al final del bloque podría continuar en el siguiente ("2" de "2.5")
+                if fin_archivo or _CONTINUACION_JSON.match(texto, fin).end() < len(texto):
+                    pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if fin_archivo:
+                    raise
+            leer_bloque()
+
+    def esperar(caracter: str) -> None:
+        nonlocal pos
+        if saltar_espacios() != caracter:
+            raise json.JSONDecodeError(f"Se esperaba '{caracter}'", texto, pos)
+        pos += 1
+
+    apertura = saltar_espacios()
+    if apertura not in ("[", "{"):
+        raise json.JSONDecodeError("Se esperaba un arreglo u objeto JSON", texto, pos)
+    cierre = "]" if apertura == "[" else "}"
+    pos += 1
+    if saltar_espacios() == cierre:
+        return
+    while True:
+        saltar_espacios()
+        if apertura == "[":
+            yield leer_valor()
+        else:
+            clave = leer_valor()
+            esperar(":")
+            saltar_espacios()
+            yield clave, leer_valor()
+        siguiente = saltar_espacios()
+        pos += 1
+        if siguiente == cierre:
+            return
+        if siguiente != ",":
+            raise json.JSONDecodeError(f"Se esperaba ',' o '{cierre}'", texto, pos - 1)
+
+
+def cargar_snapshot(ruta: str, generaciones: int = 3, leer: Callable = json.load):
+    """
+    Lee el snapshot JSON más reciente que sea válido: ruta, ruta.1, ..., ruta.N.
+    `leer` recibe el archivo abierto en modo binario y devuelve los datos (json.load por defecto).
+    Una generación con JSON mal formado o con registros inválidos (KeyError, TypeError o
+    ValueError al construirlos) se trata como corrupta y se prueba la siguiente.
+    Lanza FileNotFoundError si no existe ninguna generación y, si todas las existentes
+    están corruptas, el error de la última que se intentó.
+    """
+    error = None
+    for candidato in [ruta] + [f"{ruta}.{i}" for i in range(1, generaciones + 1)]:
+        if not os.path.exists(candidato):
+            continue
+        try:
+            with open(candidato, 'rb') as archivo:
+                datos = leer(archivo)
+        except (ValueError, KeyError, TypeError) as e:  # ValueError incluye JSONDecodeError y UnicodeDecodeError
+            error = e
+            continue
+        if candidato != ruta:
+            print(f"Advertencia: no se pudo leer {ruta}, se recuperó la copia {candidato}.")
+        return datos
+    if error is not None:
+        raise error
+    raise FileNotFoundError(ruta)
+
+
+def escribir_en_bloques(lineas: Iterable[str], salida=None, lineas_por_bloque: int = 1000) -> int:
+    """
+    Escribe las líneas en `salida` (la consola por defecto) juntando `lineas_por_bloque`
+    líneas en cada escritura, en lugar de hacer un print por línea.
+    Retorna la cantidad de líneas escritas.
+    """
+    salida = salida if salida is not None else sys.stdout
+    escritas = 0
+    bloque: List[str] = []
+    for linea in lineas:
+        bloque.append(linea)
+        if len(bloque) == lineas_por_bloque:
+            salida.write("\n".join(bloque) + "\n")
+            escritas += len(bloque)
+            bloque.clear()
+    if bloque:
+        salida.write("\n".join(bloque) + "\n")
+        escritas += len(bloque)
+    return escritas
+
+
+def paginar(elementos: Iterable, clave: Callable, tamano: int, cursor=None) -> Tuple[list, Optional[tuple]]:
+    """
+    Devuelve los `tamano` primeros elementos en el orden de `clave` que van después de `cursor`,
+    junto con el cursor de la página siguiente (None si no quedan más).
+    Usa un montículo de `tamano` elementos en lugar de ordenar todo: O(n log tamano).
+    """
+    if cursor is not None:
+        elementos = (e for e in elementos if clave(e) > cursor)
+    pagina = heapq.nsmallest(tamano + 1, elementos, key=clave)
+    if len(pagina) > tamano:
+        return pagina[:tamano], clave(pagina[tamano - 1])
+    return pagina, None
+
+
+def mostrar_progreso_carga(leidos: int, total: int) -> None:
+    """Muestra el porcentaje cargado en una sola línea de la consola."""
+    if total:
+        print(f"\rCargando inventario: {leidos * 100 // total}%", end="" if leidos < total else "\n")
+
+
 class Producto:
+    # __slots__ evita el __dict__ de cada instancia y reduce la memoria por producto
+    __slots__ = ('_id', '_nombre', '_cantidad', '_precio_centavos')
+
     def __init__(self, id_producto: str, nombre: str, cantidad: int, precio: float):
         self._id = id_producto
         self._nombre = nombre
         self._cantidad = cantidad
-        self._precio = precio
+        self._precio_centavos = a_centavos(precio)
 
     def to_dict(self) -> dict:
         """Convierte el producto a un diccionario para almacenamiento."""
@@ -16,7 +236,7 @@ class Producto:
             'id': self._id,
             'nombre': self._nombre,
             'cantidad': self._cantidad,
-            'precio': self._precio
+            'precio': self.get_precio()
         }
 
     @classmethod
@@ -40,7 +260,10 @@ class Producto:
         return self._cantidad
 
     def get_precio(self) -> float:
-        return self._precio
+        return a_monto(self._precio_centavos)
+
+    def get_precio_centavos(self) -> int:
+        return self._precio_centavos
 
     def set_nombre(self, nombre: str) -> None:
         self._nombre = nombre
@@ -49,132 +272,918 @@ class Producto:
         self._cantidad = cantidad
 
     def set_precio(self, precio: float) -> None:
-        self._precio = precio
+        self._precio_centavos = a_centavos(precio)
 
+    def __str__(self) -> str:
+        return (f"ID: {self._id}, Nombre: {self._nombre}, "
+                f"Cantidad: {self._cantidad}, Precio: {self.get_precio()}")
 
-class Inventario:
-    ARCHIVO_INVENTARIO = "inventario.json"
+
+# Criterios de orden para listar y paginar productos
+CLAVES_ORDEN: Dict[str, Callable[[Producto], object]] = {
+    'id': Producto.get_id,
+    'nombre': Producto.get_nombre,
+    'cantidad': Producto.get_cantidad,
+    'precio': Producto.get_precio_centavos,
+}
+
+
+def clave_orden(orden: str) -> Callable[[Producto], tuple]:
+    """Clave (valor, id) para ordenar por `orden`; el id desempata y hace de cursor de paginación."""
+    try:
+        obtener = CLAVES_ORDEN[orden]
+    except KeyError:
+        raise ValueError(f"Orden no válido: {orden}. Opciones: {', '.join(CLAVES_ORDEN)}") from None
+    return lambda producto: (obtener(producto), producto.get_id())
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas sobre los nombres de los productos.
+    Cada trigrama del nombre en minúsculas apunta a los IDs que lo contienen, lo que
+    permite responder búsquedas de subcadenas sin recorrer todo el inventario.
+    """
 
     def __init__(self):
-        self._productos: List[Producto] = []
-        self.cargar_inventario()
+        self._ids_por_trigrama: Dict[str, Dict[str, None]] = {}
 
-    def guardar_inventario(self) -> bool:
+    @staticmethod
+    def trigramas(texto: str) -> set:
+        """Devuelve los trigramas distintos del texto en minúsculas."""
+        texto = texto.lower()
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+    def agregar(self, id_producto: str, nombre: str) -> None:
+        """Registra el nombre de un producto en el índice."""
+        for trigrama in self.trigramas(nombre):
+            self._ids_por_trigrama.setdefault(trigrama, {})[id_producto] = None
+
+    def eliminar(self, id_producto: str, nombre: str) -> None:
+        """Quita el nombre de un producto del índice."""
+        for trigrama in self.trigramas(nombre):
+            ids = self._ids_por_trigrama.get(trigrama)
+            if ids is not None:
+                ids.pop(id_producto, None)
+                if not ids:
+                    del self._ids_por_trigrama[trigrama]
+
+    def candidatos(self, consulta: str) -> List[str]:
+        """
+        Devuelve los IDs cuyos nombres contienen todos los trigramas de la consulta.
+        La consulta debe tener al menos 3 caracteres; el llamador confirma la subcadena.
+        """
+        conjuntos = []
+        for trigrama in self.trigramas(consulta):
+            ids = self._ids_por_trigrama.get(trigrama)
+            if ids is None:
+                return []
+            conjuntos.append(ids)
+        conjuntos.sort(key=len)
+        return [id_producto for id_producto in conjuntos[0]
+                if all(id_producto in ids for ids in conjuntos[1:])]
+
+
+class CandadosPorFranja:
+    """
+    Candados repartidos por franjas (lock striping) para el modo concurrente.
+    Cada ID de producto cae en una franja según su hash, de modo que cajas que venden
+    productos distintos rara vez esperan por el mismo candado.
+    """
+
+    def __init__(self, franjas: int = 64):
+        self._candados = [threading.Lock() for _ in range(franjas)]
+
+    def de(self, id_producto: str) -> threading.Lock:
+        """Devuelve el candado de la franja del producto."""
+        return self._candados[hash(id_producto) % len(self._candados)]
+
+    @contextmanager
+    def varios(self, ids_producto: Optional[Iterable[str]] = None) -> Iterator[None]:
+        """
+        Toma los candados de varios productos, o todos si `ids_producto` es None.
+        Se adquieren siempre en orden de franja para evitar bloqueos mutuos.
+        """
+        if ids_producto is None:
+            franjas = range(len(self._candados))
+        else:
+            franjas = sorted({hash(id_producto) % len(self._candados) for id_producto in ids_producto})
+        for franja in franjas:
+            self._candados[franja].acquire()
+        try:
+            yield
+        finally:
+            for franja in reversed(franjas):
+                self._candados[franja].release()
+
+
+class AlmacenJSON:
+    """
+    Almacenamiento del inventario en memoria, persistido en un archivo JSON.
+    Con modo_diario=True cada cambio se añade como un registro al diario
+    en lugar de reescribir el archivo completo del inventario.
+    """
+    ARCHIVO_INVENTARIO = "inventario.json"
+    ARCHIVO_DIARIO = "inventario.log"
+    UMBRAL_COMPACTACION = 1000  # Registros del diario antes de compactar en el snapshot
+    GENERACIONES_SNAPSHOT = 3  # Copias anteriores del snapshot que se conservan
+
+    def __init__(self, modo_diario: bool = False):
+        self._productos: Dict[str, Producto] = {}
+        self._modo_diario = modo_diario
+        self._registros_diario = 0
+        self._candado_archivos = threading.RLock()  # Serializa las escrituras en disco
+        self._indice_nombres = IndiceTrigramas()
+
+    def guardar(self) -> bool:
         """
         Guarda el inventario actual en un archivo JSON.
+        En modo diario, además vacía el diario porque el snapshot ya contiene sus cambios.
         Retorna True si la operación fue exitosa, False en caso contrario.
         """
-        try:
-            datos = [producto.to_dict() for producto in self._productos]
-            with open(self.ARCHIVO_INVENTARIO, 'w', encoding='utf-8') as archivo:
-                json.dump(datos, archivo, indent=2)
-            return True
-        except (PermissionError, OSError) as e:
-            print(f"Error al guardar el inventario: {str(e)}")
-            return False
+        with self._candado_archivos:
+            try:
+                datos = [producto.to_dict() for producto in list(self._productos.values())]
+                escribir_snapshot_atomico(self.ARCHIVO_INVENTARIO, datos,
+                                          self.GENERACIONES_SNAPSHOT, indent=2)
+                if self._modo_diario:
+                    # El diario se vacía solo después de escribir el snapshot completo
+                    open(self.ARCHIVO_DIARIO, 'w', encoding='utf-8').close()
+                    self._registros_diario = 0
+                return True
+            except (PermissionError, OSError) as e:
+                print(f"Error al guardar el inventario: {str(e)}")
+                return False
 
-    def cargar_inventario(self) -> None:
+    def cargar(self, progreso: Optional[Callable[[int, int], None]] = None) -> None:
         """
-        Carga el inventario desde el archivo JSON.
+        Carga el inventario desde el archivo JSON, construyendo los productos
+        uno a uno mientras se lee el archivo.
+        Si el archivo está dañado, usa la copia anterior válida más reciente.
+        En modo diario, aplica después los cambios registrados en el diario.
         Si el archivo no existe, crea un inventario vacío.
         """
         try:
-            if os.path.exists(self.ARCHIVO_INVENTARIO):
-                with open(self.ARCHIVO_INVENTARIO, 'r', encoding='utf-8') as archivo:
-                    datos = json.load(archivo)
-                    self._productos = [Producto.from_dict(item) for item in datos]
-            else:
-                self._productos = []
-                # Crear el archivo vacío
-                self.guardar_inventario()
-        except json.JSONDecodeError:
+            self._productos = cargar_snapshot(self.ARCHIVO_INVENTARIO, self.GENERACIONES_SNAPSHOT,
+                                              lambda archivo: self._leer_productos(archivo, progreso))
+            if self._modo_diario:
+                self._reproducir_diario()
+        except FileNotFoundError:
+            self._productos = {}
+            if self._modo_diario:
+                self._reproducir_diario()
+            # Crear el archivo vacío
+            self.guardar()
+        except (ValueError, KeyError, TypeError):
             print("Error: El archivo de inventario está corrupto. Creando nuevo inventario.")
-            self._productos = []
-            self.guardar_inventario()
+            self._productos = {}
+            if self._modo_diario:
+                # guardar() vacía el diario: antes se recuperan los cambios que solo están en él
+                self._reproducir_diario()
+            self.guardar()
         except Exception as e:
             print(f"Error al cargar el inventario: {str(e)}")
-            self._productos = []
+            self._productos = {}
+        self._reconstruir_indice()
+
+    def _reconstruir_indice(self) -> None:
+        """Construye el índice de nombres a partir de los productos cargados."""
+        self._indice_nombres = IndiceTrigramas()
+        for p in self._productos.values():
+            self._indice_nombres.agregar(p.get_id(), p.get_nombre())
+
+    @staticmethod
+    def _leer_productos(archivo, progreso: Optional[Callable[[int, int], None]] = None) -> Dict[str, Producto]:
+        """Construye el diccionario de productos registro a registro desde el archivo abierto."""
+        productos = {}
+        for item in iterar_json(archivo, progreso):
+            productos[item['id']] = Producto.from_dict(item)
+        return productos
+
+    def _reproducir_diario(self) -> None:
+        """
+        Aplica sobre el inventario cargado los registros del diario, en orden.
+        Una última línea sin salto de línea que no se puede leer es una escritura
+        interrumpida: se descarta y se recorta del archivo para que los registros
+        siguientes no queden pegados a ella. Cualquier otro registro ilegible o mal
+        formado se salta con una advertencia, sin tocar los que le siguen.
+        """
+        if not os.path.exists(self.ARCHIVO_DIARIO):
+            return
+        with open(self.ARCHIVO_DIARIO, 'rb+') as archivo:
+            posicion = 0
+            linea = b"\n"
+            for linea in archivo:
+                inicio_linea = posicion
+                posicion += len(linea)
+                try:
+                    self._aplicar_registro(json.loads(linea))
+                except (ValueError, KeyError, TypeError):  # ValueError incluye JSONDecodeError
+                    if not linea.endswith(b"\n"):
+                        print("Advertencia: Se descartó un registro incompleto al final del diario.")
+                        archivo.truncate(inicio_linea)
+                        return
+                    print("Advertencia: Se descartó un registro ilegible del diario.")
+                    continue
+                self._registros_diario += 1
+            # Sin salto de línea al final, el próximo registro quedaría pegado al último
+            if not linea.endswith(b"\n"):
+                archivo.seek(0, os.SEEK_END)
+                archivo.write(b"\n")
+
+    def _aplicar_registro(self, registro: dict) -> None:
+        """Aplica un registro del diario; los productos se construyen antes de modificar nada."""
+        if registro['op'] == 'poner':
+            producto = Producto.from_dict(registro['producto'])
+            self._productos[producto.get_id()] = producto
+        elif registro['op'] == 'lote':
+            productos = [Producto.from_dict(datos) for datos in registro['productos']]
+            self._productos.update((producto.get_id(), producto) for producto in productos)
+        elif registro['op'] == 'eliminar':
+            self._productos.pop(registro['id'], None)
+        else:
+            raise ValueError(f"Operación desconocida en el diario: {registro['op']!r}")
+
+    def _registrar_en_diario(self, registro: dict) -> bool:
+        """
+        Añade un registro compacto al final del diario y compacta si se alcanzó el umbral.
+        Retorna True si la operación fue exitosa, False en caso contrario.
+        """
+        with self._candado_archivos:
+            try:
+                with open(self.ARCHIVO_DIARIO, 'a', encoding='utf-8') as archivo:
+                    archivo.write(json.dumps(registro, separators=(',', ':')) + "\n")
+            except (PermissionError, OSError) as e:
+                print(f"Error al escribir en el diario: {str(e)}")
+                return False
+            self._registros_diario += 1
+            if self._registros_diario >= self.UMBRAL_COMPACTACION:
+                return self.compactar()
+            return True
+
+    def compactar(self) -> bool:
+        """Pliega el diario en el snapshot del inventario (solo tiene efecto en modo diario)."""
+        if not self._modo_diario:
+            return True
+        return self.guardar()
+
+    def _persistir_producto(self, producto: Producto) -> bool:
+        """Persiste el estado actual de un producto añadido o modificado."""
+        if self._modo_diario:
+            return self._registrar_en_diario({'op': 'poner', 'producto': producto.to_dict()})
+        return self.guardar()
+
+    def _persistir_lote(self, productos: List[Producto]) -> bool:
+        """Persiste de una sola vez el estado de varios productos modificados."""
+        if self._modo_diario:
+            return self._registrar_en_diario({'op': 'lote', 'productos': [p.to_dict() for p in productos]})
+        return self.guardar()
+
+    def _persistir_eliminacion(self, id_producto: str) -> bool:
+        """Persiste la eliminación de un producto."""
+        if self._modo_diario:
+            return self._registrar_en_diario({'op': 'eliminar', 'id': id_producto})
+        return self.guardar()
+
+    def obtener(self, id_producto: str) -> Optional[Producto]:
+        return self._productos.get(id_producto)
+
+    def __contains__(self, id_producto: str) -> bool:
+        return id_producto in self._productos
+
+    def __len__(self) -> int:
+        return len(self._productos)
+
+    def __iter__(self) -> Iterator[Producto]:
+        return iter(self._productos.values())
+
+    def recorrer(self, orden: Optional[str] = None, cursor: Optional[tuple] = None) -> Iterator[Producto]:
+        """
+        Recorre los productos en el orden indicado (None = orden de inserción) después de `cursor`.
+        Recorre una copia de las referencias, así los cambios posteriores no interrumpen el recorrido.
+        """
+        productos = list(self._productos.values())
+        if orden is None and cursor is None:
+            return iter(productos)
+        clave = clave_orden(orden or 'id')
+        if cursor is not None:
+            productos = [p for p in productos if clave(p) > cursor]
+        productos.sort(key=clave)
+        return iter(productos)
+
+    def pagina(self, orden: str, tamano: int, cursor: Optional[tuple] = None) -> Tuple[List[Producto], Optional[tuple]]:
+        """Página de `tamano` productos después de `cursor` y el cursor de la siguiente."""
+        return paginar(self._productos.values(), clave_orden(orden), tamano, cursor)
+
+    def agregar(self, producto: Producto) -> bool:
+        """Añade un producto nuevo y lo persiste."""
+        self._productos[producto.get_id()] = producto
+        self._indice_nombres.agregar(producto.get_id(), producto.get_nombre())
+        return self._persistir_producto(producto)
+
+    def agregar_lote(self, productos: List[Producto]) -> bool:
+        """Añade varios productos nuevos y los persiste de una sola vez."""
+        for producto in productos:
+            self._productos[producto.get_id()] = producto
+            self._indice_nombres.agregar(producto.get_id(), producto.get_nombre())
+        return self._persistir_lote(productos)
+
+    def actualizar(self, producto: Producto) -> bool:
+        """Persiste los cambios de un producto ya almacenado."""
+        return self._persistir_producto(producto)
+
+    def actualizar_lote(self, productos: List[Producto]) -> bool:
+        """Persiste de una sola vez los cambios de varios productos ya almacenados."""
+        return self._persistir_lote(productos)
+
+    def eliminar(self, id_producto: str) -> bool:
+        """Elimina un producto y persiste la eliminación. Retorna False si no existe."""
+        p = self._productos.pop(id_producto, None)
+        if p is None:
+            return False
+        self._indice_nombres.eliminar(id_producto, p.get_nombre())
+        return self._persistir_eliminacion(id_producto)
+
+    def renombrar(self, producto: Producto, nombre: str) -> None:
+        """Cambia el nombre de un producto manteniendo el índice (se persiste con actualizar)."""
+        self._indice_nombres.eliminar(producto.get_id(), producto.get_nombre())
+        producto.set_nombre(nombre)
+        self._indice_nombres.agregar(producto.get_id(), nombre)
+
+    def buscar(self, consulta: str) -> List[Producto]:
+        """
+        Productos cuyo nombre contiene `consulta` (ya en minúsculas).
+        Usa el índice de trigramas; las consultas de menos de 3 caracteres recorren el inventario.
+        """
+        if len(consulta) < 3:
+            return [p for p in self._productos.values() if consulta in p.get_nombre().lower()]
+        candidatos = (self._productos[id_producto] for id_producto in self._indice_nombres.candidatos(consulta))
+        return [p for p in candidatos if consulta in p.get_nombre().lower()]
+
+
+class AlmacenSQLite:
+    """
+    Almacenamiento del inventario en una base de datos SQLite (módulo sqlite3 de la biblioteca estándar).
+    Los productos viven en la tabla `productos`, indexada por id y por nombre, y un objeto
+    Producto solo se construye al leer su fila: el arranque y la memoria no dependen
+    del tamaño del catálogo. Cada operación usa una sentencia SQL fija, que sqlite3 prepara
+    una vez y reutiliza, y los lotes se escriben en una sola transacción.
+    La búsqueda por nombre usa la tabla FTS5 `productos_nombres`, con el tokenizador de
+    trigramas sobre el nombre en minúsculas (columna `nombre_min`, que se escribe desde
+    Python con str.lower); los disparadores la mantienen al día con la tabla de productos.
+    """
+    ARCHIVO_BASE_DATOS = "inventario.db"
+    TAMANO_PAGINA = 1000  # Filas leídas por consulta al recorrer el inventario
+
+    _CREAR_ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS productos (
+            id TEXT PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            cantidad INTEGER NOT NULL,
+            precio_centavos INTEGER NOT NULL,
+            nombre_min TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS productos_nombre ON productos (nombre);
+    """
+    _CREAR_BUSQUEDA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS productos_nombres
+            USING fts5(nombre_min, tokenize = 'trigram case_sensitive 1');
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_insertar AFTER INSERT ON productos BEGIN
+            INSERT INTO productos_nombres (rowid, nombre_min) VALUES (new.rowid, new.nombre_min);
+        END;
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_actualizar AFTER UPDATE OF nombre_min ON productos BEGIN
+            UPDATE productos_nombres SET nombre_min = new.nombre_min WHERE rowid = old.rowid;
+        END;
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_eliminar AFTER DELETE ON productos BEGIN
+            DELETE FROM productos_nombres WHERE rowid = old.rowid;
+        END;
+    """
+    _COLUMNAS = "SELECT id, nombre, cantidad, precio_centavos FROM productos"
+    _INSERTAR = "INSERT INTO productos (id, nombre, cantidad, precio_centavos, nombre_min) VALUES (?, ?, ?, ?, ?)"
+    _ACTUALIZAR = "UPDATE productos SET nombre = ?, cantidad = ?, precio_centavos = ?, nombre_min = ? WHERE id = ?"
+    _ELIMINAR = "DELETE FROM productos WHERE id = ?"
+    _COLUMNAS_ORDEN = {'id': 'id', 'nombre': 'nombre', 'cantidad': 'cantidad', 'precio': 'precio_centavos'}
+
+    def __init__(self, ruta: str = ARCHIVO_BASE_DATOS):
+        # Una sola conexión compartida por los hilos; el candado serializa su uso
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._conexion.execute("PRAGMA journal_mode = WAL")
+        self._conexion.execute("PRAGMA synchronous = NORMAL")
+        self._conexion.executescript(self._CREAR_ESQUEMA)
+        if not self._conexion.execute("SELECT 1 FROM sqlite_master WHERE name = 'productos_nombres'").fetchone():
+            self._crear_busqueda()
+        self._candado = threading.RLock()
+
+    def _crear_busqueda(self) -> None:
+        """
+        Crea la tabla de búsqueda y la llena con los productos que ya estén en la base, en una
+        sola transacción. Una base anterior a la búsqueda recibe antes la columna `nombre_min`.
+        """
+        columnas = [fila[1] for fila in self._conexion.execute("PRAGMA table_info(productos)")]
+        agregar_columna = ("" if 'nombre_min' in columnas
+                           else "ALTER TABLE productos ADD COLUMN nombre_min TEXT NOT NULL DEFAULT '';")
+        # str.lower solo se registra para llenar la columna: los disparadores no lo necesitan
+        self._conexion.create_function('minusculas', 1, str.lower, deterministic=True)
+        self._conexion.executescript(f"""
+            BEGIN;
+            {agregar_columna}
+            UPDATE productos SET nombre_min = minusculas(nombre);
+            {self._CREAR_BUSQUEDA}
+            INSERT INTO productos_nombres (rowid, nombre_min) SELECT rowid, nombre_min FROM productos;
+            COMMIT;
+        """)
+
+    @staticmethod
+    def _a_producto(fila: tuple) -> Producto:
+        return Producto(fila[0], fila[1], fila[2], a_monto(fila[3]))
+
+    def _ejecutar(self, sentencia: str, filas: List[tuple]) -> bool:
+        """
+        Ejecuta la sentencia con cada fila dentro de una sola transacción.
+        Si algo falla se deshace la transacción completa.
+        Retorna True si la operación fue exitosa, False en caso contrario.
+        """
+        with self._candado:
+            try:
+                with self._conexion:
+                    self._conexion.executemany(sentencia, filas)
+                return True
+            except sqlite3.Error as e:
+                print(f"Error al guardar en la base de datos: {str(e)}")
+                return False
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        with self._candado:
+            self._conexion.close()
+
+    def cargar(self, progreso: Optional[Callable[[int, int], None]] = None) -> None:
+        """No carga nada por adelantado: las filas se leen cuando se necesitan."""
+
+    def guardar(self) -> bool:
+        """Cada cambio ya se confirma en su propia transacción."""
+        return True
+
+    def compactar(self) -> bool:
+        """Vuelca el registro WAL en la base de datos."""
+        with self._candado:
+            try:
+                self._conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                return True
+            except sqlite3.Error as e:
+                print(f"Error al compactar la base de datos: {str(e)}")
+                return False
+
+    def obtener(self, id_producto: str) -> Optional[Producto]:
+        with self._candado:
+            fila = self._conexion.execute(self._COLUMNAS + " WHERE id = ?", (id_producto,)).fetchone()
+        return self._a_producto(fila) if fila is not None else None
+
+    def __contains__(self, id_producto: str) -> bool:
+        with self._candado:
+            return self._conexion.execute("SELECT 1 FROM productos WHERE id = ?",
+                                          (id_producto,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._candado:
+            return self._conexion.execute("SELECT COUNT(*) FROM productos").fetchone()[0]
+
+    def __iter__(self) -> Iterator[Producto]:
+        return self.recorrer()
+
+    def _leer_filas(self, orden: str, limite: int, cursor: Optional[tuple]) -> List[tuple]:
+        """
+        Lee hasta `limite` filas ordenadas por (columna, id) después de `cursor`.
+        La comparación de filas (columna, id) > (?, ?) permite usar los índices sin OFFSET.
+        """
+        clave_orden(orden)  # Valida el criterio de orden
+        columna = self._COLUMNAS_ORDEN[orden]
+        with self._candado:
+            if cursor is None:
+                return self._conexion.execute(self._COLUMNAS + f" ORDER BY {columna}, id LIMIT ?",
+                                              (limite,)).fetchall()
+            return self._conexion.execute(self._COLUMNAS + f" WHERE ({columna}, id) > (?, ?) ORDER BY {columna}, id LIMIT ?",
+                                          (*cursor, limite)).fetchall()
+
+    def recorrer(self, orden: Optional[str] = None, cursor: Optional[tuple] = None) -> Iterator[Producto]:
+        """
+        Recorre los productos en el orden indicado (None = por id) después de `cursor`,
+        leyendo la tabla por páginas en lugar de cargarla completa.
+        """
+        orden = orden or 'id'
+        filas = self._leer_filas(orden, self.TAMANO_PAGINA, cursor)
+        return self._recorrer_paginas(orden, filas)
+
+    def _recorrer_paginas(self, orden: str, filas: List[tuple]) -> Iterator[Producto]:
+        clave = clave_orden(orden)
+        while True:
+            for fila in filas:
+                yield self._a_producto(fila)
+            if len(filas) < self.TAMANO_PAGINA:
+                return
+            filas = self._leer_filas(orden, self.TAMANO_PAGINA, clave(self._a_producto(filas[-1])))
+
+    def pagina(self, orden: str, tamano: int, cursor: Optional[tuple] = None) -> Tuple[List[Producto], Optional[tuple]]:
+        """Página de `tamano` productos después de `cursor` y el cursor de la siguiente."""
+        productos = [self._a_producto(fila) for fila in self._leer_filas(orden, tamano + 1, cursor)]
+        if len(productos) > tamano:
+            return productos[:tamano], clave_orden(orden)(productos[tamano - 1])
+        return productos, None
+
+    @staticmethod
+    def _a_fila(producto: Producto) -> tuple:
+        return (producto.get_id(), producto.get_nombre(), producto.get_cantidad(), producto.get_precio_centavos(),
+                producto.get_nombre().lower())
+
+    @staticmethod
+    def _a_fila_actualizacion(producto: Producto) -> tuple:
+        return (producto.get_nombre(), producto.get_cantidad(), producto.get_precio_centavos(),
+                producto.get_nombre().lower(), producto.get_id())
+
+    def agregar(self, producto: Producto) -> bool:
+        """Inserta un producto nuevo."""
+        return self._ejecutar(self._INSERTAR, [self._a_fila(producto)])
+
+    def agregar_lote(self, productos: List[Producto]) -> bool:
+        """Inserta varios productos nuevos en una sola transacción."""
+        return self._ejecutar(self._INSERTAR, [self._a_fila(p) for p in productos])
+
+    def actualizar(self, producto: Producto) -> bool:
+        """Escribe el estado actual de un producto (también se usa al vender)."""
+        return self._ejecutar(self._ACTUALIZAR, [self._a_fila_actualizacion(producto)])
+
+    def actualizar_lote(self, productos: List[Producto]) -> bool:
+        """Escribe el estado de varios productos en una sola transacción."""
+        return self._ejecutar(self._ACTUALIZAR, [self._a_fila_actualizacion(p) for p in productos])
+
+    def eliminar(self, id_producto: str) -> bool:
+        """Elimina un producto. Retorna False si no existe o no se pudo guardar."""
+        with self._candado:
+            try:
+                with self._conexion:
+                    return self._conexion.execute(self._ELIMINAR, (id_producto,)).rowcount > 0
+            except sqlite3.Error as e:
+                print(f"Error al guardar en la base de datos: {str(e)}")
+                return False
+
+    def renombrar(self, producto: Producto, nombre: str) -> None:
+        """Cambia el nombre del producto (se escribe en la tabla con actualizar)."""
+        producto.set_nombre(nombre)
+
+    def buscar(self, consulta: str) -> List[Producto]:
+        """
+        Productos cuyo nombre contiene `consulta` (ya en minúsculas).
+        Usa el índice de trigramas; las consultas de menos de 3 caracteres recorren la tabla.
+        """
+        with self._candado:
+            if len(consulta) < 3:
+                filas = self._conexion.execute(self._COLUMNAS + " WHERE instr(nombre_min, ?) > 0",
+                                               (consulta,)).fetchall()
+            else:
+                # Entre comillas, la consulta es una frase: sus trigramas seguidos, es decir, la subcadena
+                frase = '"' + consulta.replace('"', '""') + '"'
+                filas = self._conexion.execute(self._COLUMNAS + " WHERE rowid IN (SELECT rowid FROM "
+                                               "productos_nombres WHERE productos_nombres MATCH ?)",
+                                               (frase,)).fetchall()
+        return [self._a_producto(fila) for fila in filas]
+
+
+class ResumenStock:
+    """
+    Totales del inventario que se actualizan con cada cambio de un producto: unidades,
+    valor en centavos, productos por tramo de precio y productos bajo el umbral de
+    reposición, para consultarlos sin recorrer todo el inventario.
+    """
+    TRAMOS_PRECIO = (1000, 5000, 10000, 50000)  # Límites de los tramos de precio, en centavos
+
+    def __init__(self, umbral_reposicion: int = 5):
+        self.umbral_reposicion = umbral_reposicion  # Con menos unidades, el producto está bajo stock
+        self.total_unidades = 0
+        self.total_centavos = 0
+        self._por_tramo = [0] * (len(self.TRAMOS_PRECIO) + 1)
+        self._bajo_stock: List[Tuple[int, str]] = []  # (cantidad, id) ordenados, solo bajo el umbral
+        self._candado = threading.Lock()  # Las ventas de distintas franjas actualizan los mismos totales
+
+    @staticmethod
+    def estado(producto: Producto) -> Tuple[str, int, int]:
+        """Valores del producto que intervienen en los totales."""
+        return producto.get_id(), producto.get_cantidad(), producto.get_precio_centavos()
+
+    def actualizar(self, anterior: Optional[Tuple[str, int, int]] = None,
+                   nuevo: Optional[Tuple[str, int, int]] = None) -> None:
+        """Quita el estado anterior de un producto y suma el nuevo (None al añadir o al eliminar)."""
+        with self._candado:
+            if anterior is not None:
+                self._aplicar(anterior, -1)
+            if nuevo is not None:
+                self._aplicar(nuevo, 1)
+
+    def _aplicar(self, estado: Tuple[str, int, int], signo: int) -> None:
+        id_producto, cantidad, precio_centavos = estado
+        self.total_unidades += signo * cantidad
+        self.total_centavos += signo * cantidad * precio_centavos
+        self._por_tramo[bisect.bisect_right(self.TRAMOS_PRECIO, precio_centavos)] += signo
+        if cantidad < self.umbral_reposicion:
+            if signo > 0:
+                bisect.insort(self._bajo_stock, (cantidad, id_producto))
+            else:
+                del self._bajo_stock[bisect.bisect_left(self._bajo_stock, (cantidad, id_producto))]
+
+    def productos_por_tramo(self) -> Dict[str, int]:
+        """Cantidad de productos en cada tramo de precio, por ejemplo {"10.00-50.00": 3, ...}."""
+        limites = (0,) + self.TRAMOS_PRECIO
+        conteo = {}
+        for i, cantidad in enumerate(self._por_tramo):
+            if i < len(self.TRAMOS_PRECIO):
+                conteo[f"{a_monto(limites[i]):.2f}-{a_monto(limites[i + 1]):.2f}"] = cantidad
+            else:
+                conteo[f"{a_monto(limites[i]):.2f}+"] = cantidad
+        return conteo
+
+    def bajo_stock(self, limite: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(id, cantidad) de los productos bajo el umbral, de menos a más unidades."""
+        with self._candado:
+            seleccion = self._bajo_stock if limite is None else self._bajo_stock[:limite]
+            return [(id_producto, cantidad) for cantidad, id_producto in seleccion]
+
+
+class Inventario:
+    def __init__(self, modo_diario: bool = False,
+                 progreso: Optional[Callable[[int, int], None]] = None,
+                 concurrente: bool = False,
+                 almacen: Optional[Union[AlmacenJSON, AlmacenSQLite]] = None,
+                 umbral_reposicion: int = 5):
+        """
+        Crea el inventario y lo carga desde disco.
+        `almacen` decide dónde viven los productos: por defecto un AlmacenJSON en memoria,
+        que con modo_diario=True añade cada cambio al diario en lugar de reescribir el
+        archivo completo; un AlmacenSQLite los mantiene en una base de datos SQLite.
+        `progreso` recibe (bytes_leidos, bytes_totales) durante la carga.
+        Con concurrente=True varias cajas (hilos) pueden compartir el inventario: las ventas
+        toman el candado de la franja del producto y los cambios de estructura los toman todos.
+        Los totales (valor, unidades, bajo stock) se calculan en la primera consulta y desde
+        entonces se actualizan con cada cambio; `umbral_reposicion` define el bajo stock.
+        """
+        self._almacen = almacen if almacen is not None else AlmacenJSON(modo_diario)
+        self._candados = CandadosPorFranja() if concurrente else None
+        self._umbral_reposicion = umbral_reposicion
+        self._resumen: Optional[ResumenStock] = None
+        self.cargar_inventario(progreso)
+
+    def guardar_inventario(self) -> bool:
+        """
+        Guarda el inventario actual en el almacenamiento.
+        Retorna True si la operación fue exitosa, False en caso contrario.
+        """
+        return self._almacen.guardar()
+
+    def cargar_inventario(self, progreso: Optional[Callable[[int, int], None]] = None) -> None:
+        """Carga el inventario desde el almacenamiento."""
+        self._almacen.cargar(progreso)
+        self._resumen = None
+
+    def compactar(self) -> bool:
+        """Pliega los cambios acumulados (diario o WAL) en el almacenamiento principal."""
+        return self._almacen.compactar()
+
+    def _candado(self, id_producto: str):
+        """Candado para operar sobre un solo producto (sin efecto si no es concurrente)."""
+        return self._candados.de(id_producto) if self._candados else nullcontext()
+
+    def _candado_global(self, ids_producto: Optional[Iterable[str]] = None):
+        """Candados de varios productos, o de todo el inventario (sin efecto si no es concurrente)."""
+        return self._candados.varios(ids_producto) if self._candados else nullcontext()
+
+    def _obtener_resumen(self) -> ResumenStock:
+        """Devuelve el resumen de totales, calculándolo desde el almacenamiento la primera vez."""
+        with self._candado_global():
+            if self._resumen is None:
+                resumen = ResumenStock(self._umbral_reposicion)
+                for p in self._almacen:
+                    resumen.actualizar(nuevo=ResumenStock.estado(p))
+                self._resumen = resumen
+            return self._resumen
+
+    def _registrar_cambio(self, exito: bool, anterior: Optional[Tuple[str, int, int]] = None,
+                          nuevo: Optional[Tuple[str, int, int]] = None) -> bool:
+        """
+        Lleva al resumen el cambio de un producto. Si el cambio no se pudo guardar, el resumen
+        se descarta y se recalcula desde el almacenamiento en la próxima consulta.
+        Retorna `exito` para poder usarse directamente en los return.
+        """
+        resumen = self._resumen
+        if resumen is not None:
+            if exito:
+                resumen.actualizar(anterior, nuevo)
+            else:
+                self._resumen = None
+        return exito
 
     def anadir_producto(self, producto: Producto) -> bool:
         """
         Añade un nuevo producto al inventario y actualiza el archivo.
         Retorna True si la operación fue exitosa, False en caso contrario.
         """
-        if not any(p.get_id() == producto.get_id() for p in self._productos):
-            self._productos.append(producto)
-            if self.guardar_inventario():
-                return True
-        return False
+        with self._candado_global():
+            if producto.get_id() not in self._almacen:
+                return self._registrar_cambio(self._almacen.agregar(producto),
+                                              nuevo=ResumenStock.estado(producto))
+            return False
+
+    def anadir_lote(self, productos: List[Producto]) -> bool:
+        """
+        Añade varios productos nuevos en una sola operación y los guarda una sola vez.
+        Si algún ID ya existe o se repite en el lote, no se añade ninguno.
+        Retorna True si la operación fue exitosa, False en caso contrario.
+        """
+        ids = [p.get_id() for p in productos]
+        with self._candado_global():
+            if len(set(ids)) != len(ids) or any(id_producto in self._almacen for id_producto in ids):
+                return False
+            if not self._almacen.agregar_lote(productos):
+                return self._registrar_cambio(False)
+            for producto in productos:
+                self._registrar_cambio(True, nuevo=ResumenStock.estado(producto))
+            return True
 
     def eliminar_producto(self, id_producto: str) -> bool:
         """
         Elimina un producto del inventario y actualiza el archivo.
         Retorna True si la operación fue exitosa, False en caso contrario.
         """
-        longitud_anterior = len(self._productos)
-        self._productos = [p for p in self._productos if p.get_id() != id_producto]
-        if len(self._productos) < longitud_anterior:
-            return self.guardar_inventario()
-        return False
+        with self._candado_global():
+            if self._resumen is None:
+                return self._almacen.eliminar(id_producto)
+            p = self._almacen.obtener(id_producto)
+            if p is None:
+                return False
+            return self._registrar_cambio(self._almacen.eliminar(id_producto), anterior=ResumenStock.estado(p))
 
     def actualizar_producto(self, id_producto: str, cantidad: Optional[int] = None,
-                            precio: Optional[float] = None) -> bool:
+                            precio: Optional[float] = None, nombre: Optional[str] = None) -> bool:
         """
-        Actualiza un producto en el inventario y en el archivo.
+        Actualiza la cantidad, el precio o el nombre de un producto en el inventario y en el archivo.
+        Renombrar modifica el índice compartido, por eso en modo concurrente toma todos los candados.
         Retorna True si la operación fue exitosa, False en caso contrario.
         """
-        for p in self._productos:
-            if p.get_id() == id_producto:
-                if cantidad is not None:
-                    p.set_cantidad(cantidad)
-                if precio is not None:
-                    p.set_precio(precio)
-                return self.guardar_inventario()
-        return False
+        with self._candado_global() if nombre is not None else self._candado(id_producto):
+            p = self._almacen.obtener(id_producto)
+            if p is None:
+                return False
+            anterior = ResumenStock.estado(p)
+            if nombre is not None:
+                self._almacen.renombrar(p, nombre)
+            if cantidad is not None:
+                p.set_cantidad(cantidad)
+            if precio is not None:
+                p.set_precio(precio)
+            return self._registrar_cambio(self._almacen.actualizar(p), anterior, ResumenStock.estado(p))
 
     def buscar_productos(self, nombre: str) -> List[Producto]:
         """Busca productos por nombre (puede haber nombres similares)."""
-        return [p for p in self._productos if nombre.lower() in p.get_nombre().lower()]
+        with self._candado_global():
+            return self._almacen.buscar(nombre.lower())
 
-    def mostrar_productos(self) -> None:
-        """Muestra todos los productos en el inventario."""
-        if not self._productos:
-            print("El inventario está vacío.")
-            return
-        for p in self._productos:
-            print(f"ID: {p.get_id()}, Nombre: {p.get_nombre()}, "
-                  f"Cantidad: {p.get_cantidad()}, Precio: {p.get_precio()}")
+    def listar_productos(self, orden: Optional[str] = None, cursor: Optional[tuple] = None) -> Iterator[Producto]:
+        """
+        Recorre los productos uno a uno, sin armar una lista para el llamador.
+        `orden` es 'id', 'nombre', 'cantidad' o 'precio' (None = orden del almacenamiento)
+        y `cursor`, obtenido de pagina_productos, continúa el recorrido desde ese punto.
+        """
+        with self._candado_global():
+            return self._almacen.recorrer(orden, cursor)
+
+    def pagina_productos(self, tamano: int = 50, cursor: Optional[tuple] = None,
+                         orden: str = 'id') -> Tuple[List[Producto], Optional[tuple]]:
+        """
+        Devuelve una página de `tamano` productos y el cursor para pedir la siguiente
+        (None si es la última). El cursor es la clave del último producto de la página,
+        así las páginas siguen siendo correctas aunque se añadan o eliminen productos.
+        """
+        with self._candado_global():
+            return self._almacen.pagina(orden, tamano, cursor)
+
+    def mostrar_productos(self, orden: Optional[str] = None, salida=None) -> None:
+        """Muestra todos los productos en el inventario, escribiendo las líneas en bloques."""
+        if not escribir_en_bloques(map(str, self.listar_productos(orden)), salida):
+            print("El inventario está vacío.", file=salida)
 
     def vender_producto(self, id_producto: str, cantidad: int) -> float:
         """
         Vende un producto y actualiza el inventario.
+        La comprobación de stock, el descuento y el guardado se hacen bajo el candado
+        del producto, así dos cajas no pueden vender la misma unidad.
         Retorna el total de la venta si es exitosa, 0 en caso contrario.
         """
-        for p in self._productos:
-            if p.get_id() == id_producto:
-                if p.get_cantidad() >= cantidad:
-                    p.set_cantidad(p.get_cantidad() - cantidad)
-                    if self.guardar_inventario():
-                        return p.get_precio() * cantidad
-                    else:
-                        print("Error: No se pudo actualizar el inventario después de la venta.")
-                        return 0
+        with self._candado(id_producto):
+            p = self._almacen.obtener(id_producto)
+            if p is None:
+                print("Error: Producto no encontrado.")
+                return 0
+            if p.get_cantidad() >= cantidad:
+                anterior = ResumenStock.estado(p)
+                p.set_cantidad(p.get_cantidad() - cantidad)
+                if self._registrar_cambio(self._almacen.actualizar(p), anterior, ResumenStock.estado(p)):
+                    return a_monto(p.get_precio_centavos() * cantidad)
                 else:
-                    print("Error: Cantidad insuficiente en el inventario.")
+                    print("Error: No se pudo actualizar el inventario después de la venta.")
+                    return 0
+            else:
+                print("Error: Cantidad insuficiente en el inventario.")
+                return 0
+
+    def vender_lote(self, lineas: List[Tuple[str, int]]) -> float:
+        """
+        Vende varios productos en una sola operación, por ejemplo una canasta de compra.
+        `lineas` es una lista de tuplas (id_producto, cantidad); un mismo producto puede repetirse.
+        Se valida el stock de todas las líneas antes de modificar nada, de modo que se venden
+        todas o ninguna, y el inventario se guarda una sola vez.
+        Retorna el total de la venta si es exitosa, 0 en caso contrario.
+        """
+        # Una canasta vacía no vende nada: no se toman candados ni se guarda el inventario
+        if not lineas:
+            return 0
+
+        # Acumular las cantidades por producto para validar líneas repetidas
+        solicitado: Dict[str, int] = {}
+        for id_producto, cantidad in lineas:
+            if cantidad <= 0:
+                print(f"Error: La cantidad del producto {id_producto} debe ser mayor que cero.")
+                return 0
+            solicitado[id_producto] = solicitado.get(id_producto, 0) + cantidad
+
+        with self._candado_global(solicitado):
+            productos: Dict[str, Producto] = {}
+            for id_producto, cantidad in solicitado.items():
+                p = self._almacen.obtener(id_producto)
+                if p is None:
+                    print(f"Error: Producto {id_producto} no encontrado.")
                     return 0
-        print("Error: Producto no encontrado.")
-        return 0
+                if p.get_cantidad() < cantidad:
+                    print(f"Error: Cantidad insuficiente en el inventario para el producto {id_producto}.")
+                    return 0
+                productos[id_producto] = p
+
+            cantidades_anteriores = {}
+            estados_anteriores = {}
+            total_centavos = 0
+            for id_producto, cantidad in solicitado.items():
+                p = productos[id_producto]
+                cantidades_anteriores[id_producto] = p.get_cantidad()
+                estados_anteriores[id_producto] = ResumenStock.estado(p)
+                p.set_cantidad(p.get_cantidad() - cantidad)
+                total_centavos += p.get_precio_centavos() * cantidad
+
+            if not self._almacen.actualizar_lote(list(productos.values())):
+                # Deshacer la venta completa si no se pudo guardar
+                for id_producto, cantidad in cantidades_anteriores.items():
+                    productos[id_producto].set_cantidad(cantidad)
+                print("Error: No se pudo actualizar el inventario después de la venta.")
+                return 0
+            for id_producto, p in productos.items():
+                self._registrar_cambio(True, estados_anteriores[id_producto], ResumenStock.estado(p))
+            return a_monto(total_centavos)
+
+    def total_unidades(self) -> int:
+        """Unidades en stock de todos los productos."""
+        return self._obtener_resumen().total_unidades
+
+    def valor_total(self) -> float:
+        """Valor del stock completo (cantidad por precio de cada producto)."""
+        return a_monto(self._obtener_resumen().total_centavos)
+
+    def productos_por_tramo_precio(self) -> Dict[str, int]:
+        """Cantidad de productos en cada tramo de precio."""
+        return self._obtener_resumen().productos_por_tramo()
+
+    def productos_bajo_stock(self, limite: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(id, cantidad) de los productos bajo el umbral de reposición, de menos a más unidades."""
+        return self._obtener_resumen().bajo_stock(limite)
 
 
 class Caja:
     def __init__(self):
-        self._dinero = 0.0
+        self._centavos = 0  # Dinero en caja en centavos enteros
+        self._candado = threading.Lock()  # Hace atómica la suma cuando varias cajas comparten la instancia
 
     def agregar_dinero(self, cantidad: float) -> None:
-        self._dinero += cantidad
+        centavos = a_centavos(cantidad)
+        with self._candado:
+            self._centavos += centavos
+
+    def agregar_lote(self, montos: Iterable[float]) -> None:
+        """Suma varios montos de una vez: se convierten a centavos y se suman como enteros."""
+        centavos = sum(map(a_centavos, montos))
+        with self._candado:
+            self._centavos += centavos
+
+    def get_dinero(self) -> float:
+        return a_monto(self._centavos)
+
+    def get_centavos(self) -> int:
+        return self._centavos
 
     def mostrar_dinero(self) -> None:
-        print(f"Dinero en caja: {self._dinero:.2f}")
+        print(f"Dinero en caja: {a_monto(self._centavos):.2f}")
 
 
 def validar_entrada_numerica(prompt: str, tipo: type) -> Optional[type]:
@@ -195,7 +1204,7 @@ def validar_entrada_numerica(prompt: str, tipo: type) -> Optional[type]:
 def menu():
     """Función principal que maneja el menú interactivo."""
     try:
-        inventario = Inventario()
+        inventario = Inventario(modo_diario=True, progreso=mostrar_progreso_carga)
         caja = Caja()
 
         while True:
@@ -248,9 +1257,7 @@ def menu():
                 productos = inventario.buscar_productos(nombre)
                 if productos:
                     print("\nProductos encontrados:")
-                    for p in productos:
-                        print(f"ID: {p.get_id()}, Nombre: {p.get_nombre()}, "
-                              f"Cantidad: {p.get_cantidad()}, Precio: {p.get_precio()}")
+                    escribir_en_bloques(map(str, productos))
                 else:
                     print("No se encontraron productos con ese nombre.")
 
@@ -0,0 +1,90 @@
+"""
+Benchmark de almacenamiento del inventario de la Semana 10.
+Compara el AlmacenJSON (en memoria, con diario) contra el AlmacenSQLite con 10k, 100k
+y 1M productos: tiempo de arranque, memoria máxima (RSS) y costo de una venta y de una
+búsqueda por nombre.
+Cada medición se ejecuta en un proceso aparte para que el pico de RSS sea independiente.
+
+Uso: python benchmark_almacenes.py
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from Semana10_Inventario import AlmacenSQLite, Inventario, Producto
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+ALMACENES = ["json", "sqlite"]
+VENTAS = 1_000  # Ventas medidas por tamaño y almacenamiento
+BUSQUEDAS = 100  # Búsquedas por nombre medidas por tamaño y almacenamiento
+
+
+def crear_almacen(tipo):
+    """Crea el almacenamiento indicado en el directorio actual."""
+    return AlmacenSQLite() if tipo == "sqlite" else None
+
+
+def generar_datos(tipo, tamano):
+    """Llena el almacenamiento indicado con `tamano` productos en el directorio actual (proceso hijo)."""
+    inventario = Inventario(almacen=crear_almacen(tipo))
+    inventario.anadir_lote([Producto(str(i), f"Producto {i}", 1_000_000, round(1 + i % 997 / 10, 2))
+                            for i in range(tamano)])
+    inventario.compactar()
+
+
+def medir(tipo, tamano):
+    """Abre el inventario, vende VENTAS productos al azar e imprime los resultados (proceso hijo)."""
+    inicio = time.perf_counter()
+    inventario = Inventario(modo_diario=True, almacen=crear_almacen(tipo))
+    arranque = time.perf_counter() - inicio
+    generador = random.Random(0)
+    inicio = time.perf_counter()
+    for _ in range(VENTAS):
+        inventario.vender_producto(str(generador.randrange(tamano)), 1)
+    ms_venta = (time.perf_counter() - inicio) / VENTAS * 1000
+    inicio = time.perf_counter()
+    for _ in range(BUSQUEDAS):
+        inventario._almacen.buscar(f"ucto {generador.randrange(tamano)}")
+    ms_busqueda = (time.perf_counter() - inicio) / BUSQUEDAS * 1000
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # ru_maxrss está en KB en Linux
+    print(json.dumps({'arranque': arranque, 'ms_venta': ms_venta, 'ms_busqueda': ms_busqueda,
+                      'rss_mb': rss_mb}))
+
+
+def ejecutar_hijo(accion, tipo, tamano, directorio):
+    """Ejecuta este script en un proceso aparte dentro de `directorio` y devuelve su salida."""
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), accion, tipo, str(tamano)],
+                            capture_output=True, text=True, check=True, cwd=directorio,
+                            env={**os.environ, 'PYTHONPATH': os.path.dirname(os.path.abspath(__file__))})
+    return salida.stdout
+
+
+def ejecutar_benchmark():
+    """Genera los datos de cada almacenamiento en un directorio temporal y compara los resultados."""
+    print(f"{'Productos':>10} | {'Almacén':>7} | {'Arranque s':>10} | {'ms/venta':>8} | {'ms/búsqueda':>11} | "
+          f"{'RSS máx MB':>10}")
+    print("-" * 72)
+    for tamano in TAMANOS:
+        for tipo in ALMACENES:
+            with tempfile.TemporaryDirectory() as directorio:
+                # Los datos también se generan en otro proceso: así este proceso no crece
+                # y el RSS máximo de la medición no hereda su memoria
+                ejecutar_hijo("--generar", tipo, tamano, directorio)
+                resultado = json.loads(ejecutar_hijo("--medir", tipo, tamano, directorio))
+                print(f"{tamano:>10} | {tipo:>7} | {resultado['arranque']:>10.2f} | "
+                      f"{resultado['ms_venta']:>8.3f} | {resultado['ms_busqueda']:>11.3f} | "
+                      f"{resultado['rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--generar":
+        generar_datos(sys.argv[2], int(sys.argv[3]))
+    elif len(sys.argv) == 4 and sys.argv[1] == "--medir":
+        medir(sys.argv[2], int(sys.argv[3]))
+    else:
+        ejecutar_benchmark()
@@ -0,0 +1,66 @@
+"""
+Benchmark de carga del inventario de la Semana 10.
+Compara el tiempo y la memoria máxima (RSS) de cargar el archivo con json.load
+completo contra el cargador por bloques que construye los productos uno a uno.
+Cada medición se ejecuta en un proceso aparte para que el pico de RSS sea independiente.
+
+Uso: python benchmark_carga.py
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from Semana10_Inventario import AlmacenJSON, Producto
+
+TAMANOS = [100_000, 1_000_000]
+MODOS = ["json.load", "por bloques"]
+
+
+def generar_archivo(ruta, tamano):
+    """Escribe un archivo de inventario con `tamano` productos, con el mismo formato que guardar_inventario."""
+    datos = [Producto(str(i), f"Producto {i}", i % 500, round(1 + i % 997 / 10, 2)).to_dict()
+             for i in range(tamano)]
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(datos, archivo, indent=2)
+
+
+def medir(modo, ruta):
+    """Carga el archivo con el modo indicado e imprime segundos y RSS máximo en MB (proceso hijo)."""
+    inicio = time.perf_counter()
+    with open(ruta, 'rb') as archivo:
+        if modo == "json.load":
+            productos = {item['id']: Producto.from_dict(item) for item in json.load(archivo)}
+        else:
+            productos = AlmacenJSON._leer_productos(archivo)
+    segundos = time.perf_counter() - inicio
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # ru_maxrss está en KB en Linux
+    print(json.dumps({'segundos': segundos, 'rss_mb': rss_mb, 'productos': len(productos)}))
+
+
+def ejecutar_benchmark():
+    """Genera archivos de prueba y compara ambos modos de carga."""
+    print(f"{'Productos':>10} | {'Archivo MB':>10} | {'Modo':>12} | {'Segundos':>9} | {'RSS máx MB':>10}")
+    print("-" * 64)
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamano in TAMANOS:
+            ruta = os.path.join(directorio, f"inventario_{tamano}.json")
+            generar_archivo(ruta, tamano)
+            tamano_mb = os.path.getsize(ruta) / (1024 * 1024)
+            for modo in MODOS:
+                salida = subprocess.run([sys.executable, __file__, "--medir", modo, ruta],
+                                        capture_output=True, text=True, check=True,
+                                        cwd=os.path.dirname(os.path.abspath(__file__)))
+                resultado = json.loads(salida.stdout)
+                print(f"{tamano:>10} | {tamano_mb:>10.1f} | {modo:>12} | "
+                      f"{resultado['segundos']:>9.2f} | {resultado['rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--medir":
+        medir(sys.argv[2], sys.argv[3])
+    else:
+        ejecutar_benchmark()
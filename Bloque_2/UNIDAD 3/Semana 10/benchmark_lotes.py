@@ -0,0 +1,63 @@
+"""
+Benchmark de ventas por lote del inventario de la Semana 10.
+Compara vender una canasta de 1, 10 y 100 líneas con vender_lote (un solo guardado)
+contra llamar a vender_producto en un bucle (un guardado por línea).
+
+Uso: python benchmark_lotes.py
+"""
+import os
+import tempfile
+import time
+
+from Semana10_Inventario import Inventario, Producto
+
+PRODUCTOS = 10_000
+CANASTAS = [1, 10, 100]
+REPETICIONES = 5  # Canastas vendidas por medición
+
+
+def crear_inventario(modo_diario):
+    """Crea un inventario con PRODUCTOS productos y lo deja guardado en disco."""
+    for archivo in os.listdir("."):  # Directorio temporal: se borran snapshots, copias y diario anteriores
+        os.remove(archivo)
+    inventario = Inventario(modo_diario=modo_diario)
+    inventario.anadir_lote([Producto(str(i), f"Producto {i}", 1_000_000, 1.5) for i in range(PRODUCTOS)])
+    inventario.compactar()
+    return inventario
+
+
+def medir(vender, lineas):
+    """Devuelve los milisegundos promedio por canasta."""
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        vender(lineas)
+    return (time.perf_counter() - inicio) / REPETICIONES * 1000
+
+
+def ejecutar_benchmark():
+    """Ejecuta el benchmark en un directorio temporal e imprime una tabla de resultados."""
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)
+        try:
+            print(f"{'Modo':>16} | {'Líneas':>6} | {'bucle ms':>10} | {'lote ms':>10}")
+            print("-" * 52)
+            for modo_diario in (False, True):
+                inventario = crear_inventario(modo_diario)
+
+                def en_bucle(lineas):
+                    for id_producto, cantidad in lineas:
+                        inventario.vender_producto(id_producto, cantidad)
+
+                for tamano in CANASTAS:
+                    lineas = [(str(i * 37 % PRODUCTOS), 1) for i in range(tamano)]
+                    t_bucle = medir(en_bucle, lineas)
+                    t_lote = medir(inventario.vender_lote, lineas)
+                    modo = "diario" if modo_diario else "archivo completo"
+                    print(f"{modo:>16} | {tamano:>6} | {t_bucle:>10.2f} | {t_lote:>10.2f}")
+        finally:
+            os.chdir(directorio_original)
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
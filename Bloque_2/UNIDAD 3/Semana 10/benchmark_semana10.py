@@ -0,0 +1,55 @@
+"""
+Benchmark de persistencia del inventario de la Semana 10.
+Compara el costo de una venta cuando se reescribe el archivo completo
+contra el modo diario, que añade un registro por operación.
+
+Uso: python benchmark_semana10.py
+"""
+import os
+import tempfile
+import time
+
+from Semana10_Inventario import Inventario, Producto
+
+TAMANOS = [1_000, 10_000, 100_000]
+VENTAS = 50  # Ventas medidas por tamaño y modo
+
+
+def crear_inventario(tamano, modo_diario):
+    """Crea un inventario con `tamano` productos y lo deja guardado en disco."""
+    inventario = Inventario(modo_diario=modo_diario)
+    inventario.anadir_lote([Producto(str(i), f"Producto {i}", 1_000_000, 1.5) for i in range(tamano)])
+    inventario.compactar()
+    return inventario
+
+
+def medir_ventas(inventario, tamano):
+    """Devuelve los milisegundos promedio por venta."""
+    inicio = time.perf_counter()
+    for i in range(VENTAS):
+        inventario.vender_producto(str(i % tamano), 1)
+    return (time.perf_counter() - inicio) / VENTAS * 1000
+
+
+def ejecutar_benchmark():
+    """Ejecuta el benchmark en un directorio temporal e imprime una tabla de resultados."""
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)
+        try:
+            print(f"{'Productos':>10} | {'archivo completo':>16} | {'diario':>10}  (ms/venta)")
+            print("-" * 50)
+            for tamano in TAMANOS:
+                resultados = []
+                for modo_diario in (False, True):
+                    for archivo in os.listdir("."):  # Se borran snapshots, copias y diario anteriores
+                        os.remove(archivo)
+                    inventario = crear_inventario(tamano, modo_diario)
+                    resultados.append(medir_ventas(inventario, tamano))
+                print(f"{tamano:>10} | {resultados[0]:>16.3f} | {resultados[1]:>10.3f}")
+        finally:
+            os.chdir(directorio_original)
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
@@ -1,13 +1,170 @@
 import json  # Importamos el módulo json para manejar la serialización y deserialización de datos.
+import os  # Importamos el módulo os para las operaciones de archivos (renombrado atómico, fsync).
+import re  # Importamos el módulo re para detectar números cortados entre bloques.
+import codecs  # Importamos el módulo codecs para decodificar UTF-8 por bloques.
+import bisect  # Importamos el módulo bisect para buscar rangos de fechas en listas ordenadas.
+import time  # Importamos el módulo time para registrar la fecha de cada venta.
+from decimal import Decimal, ROUND_HALF_UP  # Importamos Decimal para redondear montos a centavos sin error.
+import heapq  # Importamos el módulo heapq para obtener una página sin ordenar todo el inventario.
+import sys  # Importamos el módulo sys para escribir los listados en la consola por bloques.
+import sqlite3  # Importamos el módulo sqlite3 para el almacenamiento opcional en una base de datos.
+
+# Caracteres (o espacios) con los que un número JSON podría continuar en el bloque siguiente.
+CONTINUACION_NUMERO = re.compile(r'[ \t\r\n0-9.eE+-]*')
+
+
+# Función para convertir un monto a centavos enteros, redondeando la mitad hacia arriba (1.005 -> 101).
+# Los precios y los importes del libro de ventas se guardan en centavos para que las sumas sean exactas.
+def a_centavos(monto):
+    if isinstance(monto, int):
+        return monto * 100
+    if isinstance(monto, float):
+        escalado = monto * 100
+        centavos = round(escalado)
+        # Solo los valores cercanos a medio centavo necesitan el cálculo decimal exacto
+        if abs(abs(escalado - centavos) - 0.5) > 1e-6:
+            return int(centavos)
+        monto = repr(monto)
+    return int(Decimal(monto).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+# Función para convertir centavos a un monto con decimales.
+def a_monto(centavos):
+    return centavos / 100
+
+
+# Función para escribir un archivo JSON de forma atómica.
+# Escribe en un archivo temporal, lo sincroniza con fsync y lo renombra sobre el destino,
+# conservando las versiones anteriores como archivo.1 ... archivo.N.
+def escribir_snapshot_atomico(ruta, datos, generaciones=3):
+    temporal = ruta + ".tmp"
+    with open(temporal, 'w') as f:
+        json.dump(datos, f)
+        f.flush()
+        os.fsync(f.fileno())  # Nos aseguramos de que los datos lleguen al disco
+
+    # Rotamos las generaciones: archivo.(N-1) -> archivo.N, ..., archivo -> archivo.1
+    for i in range(generaciones - 1, 0, -1):
+        if os.path.exists(f"{ruta}.{i}"):
+            os.replace(f"{ruta}.{i}", f"{ruta}.{i + 1}")
+    if generaciones > 0 and os.path.exists(ruta):
+        os.replace(ruta, f"{ruta}.1")
+    os.replace(temporal, ruta)  # El renombrado es atómico: el archivo nunca queda a medias
+
+    # Sincronizamos el directorio para que el renombrado sobreviva a un corte de energía.
+    if os.name != 'nt':
+        descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+# Función generadora que recorre un objeto JSON (o un arreglo) leyendo el archivo binario por bloques.
+# Entrega cada par (clave, valor) del objeto, o cada elemento del arreglo, sin cargar todo el archivo.
+# Si se indica progreso, se llama con (bytes_leidos, bytes_totales) después de cada bloque.
+def iterar_json(f, progreso=None, tamano_bloque=1 << 16):
+    decodificador = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()  # Decodifica aunque un carácter quede partido
+    total = os.fstat(f.fileno()).st_size
+    estado = {'texto': "", 'pos': 0, 'leidos': 0, 'fin': False}
+
+    def leer_bloque():
+        # Añadimos el siguiente bloque al texto pendiente; devolvemos False si ya no hay datos.
+        if estado['fin']:
+            return False
+        bloque = f.read(tamano_bloque)
+        estado['leidos'] += len(bloque)
+        estado['fin'] = not bloque
+        estado['texto'] = estado['texto'][estado['pos']:] + utf8.decode(bloque, final=estado['fin'])
+        estado['pos'] = 0
+        if progreso is not None and bloque:
+            progreso(estado['leidos'], total)
+        return bool(bloque)
+
+    def siguiente_caracter():
+        # Saltamos los espacios y devolvemos el siguiente carácter ("" al final del archivo).
+        while True:
+            texto, pos = estado['texto'], estado['pos']
+            while pos < len(texto) and texto[pos] in " \t\r\n":
+                pos += 1
+            estado['pos'] = pos
+            if pos < len(texto) or not leer_bloque():
+                return estado['texto'][estado['pos']:estado['pos'] + 1]
+
+    def leer_valor():
+        # Decodificamos el siguiente valor; si quedó cortado al final del bloque, leemos más y reintentamos.
+        while True:
+            texto = estado['texto']
+            try:
+                valor, fin = decodificador.raw_decode(texto, estado['pos'])
+                if estado['fin'] or CONTINUACION_NUMERO.match(texto, fin).end() < len(texto):
+                    estado['pos'] = fin
+                    return valor
+            except json.JSONDecodeError:
+                if estado['fin']:
+                    raise
+            leer_bloque()
+
+    def consumir(esperados):
+        # Consumimos el siguiente carácter, que debe ser uno de los esperados.
+        caracter = siguiente_caracter()
+        if not caracter or caracter not in esperados:
+            raise json.JSONDecodeError(f"Se esperaba uno de {esperados!r}", estado['texto'], estado['pos'])
+        estado['pos'] += 1
+        return caracter
+
+    apertura = consumir("[{")
+    cierre = "]" if apertura == "[" else "}"
+    if siguiente_caracter() == cierre:
+        return
+    while True:
+        siguiente_caracter()
+        if apertura == "{":
+            clave = leer_valor()
+            consumir(":")
+            siguiente_caracter()
+            yield clave, leer_valor()
+        else:
+            yield leer_valor()
+        if consumir("," + cierre) == cierre:
+            return
+
+
+# Función para leer el archivo JSON válido más reciente entre archivo, archivo.1 ... archivo.N.
+# La función leer recibe el archivo abierto en modo binario (por defecto json.load).
+# Un archivo con JSON mal formado o con registros inválidos (KeyError, TypeError o ValueError
+# al construir los productos) se considera dañado y se prueba con la generación anterior.
+# Lanza FileNotFoundError si no existe ninguno y, si todos están dañados, el error del último.
+def cargar_snapshot(ruta, generaciones=3, leer=json.load):
+    error = None
+    for candidato in [ruta] + [f"{ruta}.{i}" for i in range(1, generaciones + 1)]:
+        if not os.path.exists(candidato):
+            continue
+        try:
+            with open(candidato, 'rb') as f:
+                datos = leer(f)
+        except (ValueError, KeyError, TypeError) as e:  # ValueError incluye JSONDecodeError
+            error = e  # Este archivo está dañado, probamos con la generación anterior
+            continue
+        if candidato != ruta:
+            print(f"Advertencia: no se pudo leer {ruta}, se recuperó la copia {candidato}.")
+        return datos
+    if error is not None:
+        raise error
+    raise FileNotFoundError(ruta)
 
 
 # Clase que representa un producto en el inventario.
 class Producto:
+    # __slots__ evita el __dict__ de cada instancia y reduce la memoria por producto
+    __slots__ = ('id_producto', 'nombre', 'cantidad', 'precio_centavos')
+
     def __init__(self, id_producto, nombre, cantidad, precio):
         self.id_producto = id_producto  # ID único del producto
         self.nombre = nombre  # Nombre del producto
         self.cantidad = cantidad  # Cantidad disponible del producto
-        self.precio = precio  # Precio del producto
+        self.precio_centavos = a_centavos(precio)  # Precio del producto en centavos
 
     # Métodos para obtener los atributos del producto.
     def obtener_id(self):
@@ -20,14 +177,20 @@ class Producto:
         return self.cantidad
 
     def obtener_precio(self):
-        return self.precio
+        return a_monto(self.precio_centavos)
+
+    def obtener_precio_centavos(self):
+        return self.precio_centavos
 
     # Métodos para establecer los atributos del producto.
+    def establecer_nombre(self, nombre):
+        self.nombre = nombre
+
     def establecer_cantidad(self, cantidad):
         self.cantidad = cantidad
 
     def establecer_precio(self, precio):
-        self.precio = precio
+        self.precio_centavos = a_centavos(precio)
 
     # Método para convertir el objeto Producto a un diccionario.
     def to_dict(self):
@@ -35,118 +198,900 @@ class Producto:
             'id_producto': self.id_producto,
             'nombre': self.nombre,
             'cantidad': self.cantidad,
-            'precio': self.precio
+            'precio': self.obtener_precio()
         }
 
+    # Método que devuelve la línea con los datos del producto, como se muestra en los listados.
+    def __str__(self):
+        return f"ID: {self.id_producto}, Nombre: {self.nombre}, Cantidad: {self.cantidad}, Precio: {self.obtener_precio()}"
+
+
+# Criterios de orden para recorrer y paginar los productos.
+CLAVES_ORDEN = {
+    'id': lambda producto: producto.id_producto,
+    'nombre': lambda producto: producto.nombre,
+    'cantidad': lambda producto: producto.cantidad,
+    'precio': lambda producto: producto.precio_centavos,
+}
+
+
+# Función que devuelve la clave (valor, id) para ordenar por `orden`.
+# El id desempata productos con el mismo valor y hace de cursor para pedir la página siguiente.
+def clave_orden(orden):
+    try:
+        obtener = CLAVES_ORDEN[orden]
+    except KeyError:
+        raise ValueError(f"Orden no válido: {orden}. Opciones: {', '.join(CLAVES_ORDEN)}") from None
+    return lambda producto: (obtener(producto), producto.id_producto)
+
+
+# Función que devuelve los `tamano` primeros elementos en el orden de `clave` que van después de `cursor`,
+# junto con el cursor de la página siguiente (None si no quedan más).
+# Usa un montículo de `tamano` elementos en lugar de ordenar todos: O(n log tamano).
+def paginar(elementos, clave, tamano, cursor=None):
+    if cursor is not None:
+        elementos = (elemento for elemento in elementos if clave(elemento) > cursor)
+    pagina = heapq.nsmallest(tamano + 1, elementos, key=clave)
+    if len(pagina) > tamano:
+        return pagina[:tamano], clave(pagina[tamano - 1])
+    return pagina, None
+
+
+# Función que escribe las líneas en `salida` (la consola por defecto) juntando `lineas_por_bloque`
+# líneas en cada escritura, en lugar de hacer un print por línea. Devuelve cuántas líneas escribió.
+def escribir_en_bloques(lineas, salida=None, lineas_por_bloque=1000):
+    salida = salida if salida is not None else sys.stdout
+    escritas = 0
+    bloque = []
+    for linea in lineas:
+        bloque.append(linea)
+        if len(bloque) == lineas_por_bloque:
+            salida.write("\n".join(bloque) + "\n")
+            escritas += len(bloque)
+            bloque.clear()
+    if bloque:
+        salida.write("\n".join(bloque) + "\n")
+        escritas += len(bloque)
+    return escritas
+
+
+# Clase que representa un índice invertido de trigramas sobre los nombres de los productos.
+# Cada trigrama (tres caracteres seguidos del nombre en minúsculas) apunta a los IDs que lo contienen,
+# así una búsqueda por subcadena no necesita recorrer todo el inventario.
+class IndiceTrigramas:
+    def __init__(self):
+        self.ids_por_trigrama = {}  # Trigrama -> diccionario de IDs (conjunto que conserva el orden)
+
+    # Método que devuelve los trigramas distintos de un texto en minúsculas.
+    @staticmethod
+    def trigramas(texto):
+        texto = texto.lower()
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+    # Método para registrar el nombre de un producto en el índice.
+    def agregar(self, id_producto, nombre):
+        for trigrama in self.trigramas(nombre):
+            self.ids_por_trigrama.setdefault(trigrama, {})[id_producto] = None
+
+    # Método para quitar el nombre de un producto del índice.
+    def eliminar(self, id_producto, nombre):
+        for trigrama in self.trigramas(nombre):
+            ids = self.ids_por_trigrama.get(trigrama)
+            if ids is not None:
+                ids.pop(id_producto, None)
+                if not ids:
+                    del self.ids_por_trigrama[trigrama]  # No dejamos trigramas vacíos
+
+    # Método que devuelve los IDs cuyos nombres contienen todos los trigramas de la consulta.
+    # Recorremos el conjunto más pequeño y comprobamos los demás (intersección).
+    def candidatos(self, consulta):
+        conjuntos = []
+        for trigrama in self.trigramas(consulta):
+            ids = self.ids_por_trigrama.get(trigrama)
+            if ids is None:
+                return []  # Algún trigrama no aparece en ningún nombre
+            conjuntos.append(ids)
+        conjuntos.sort(key=len)
+        return [id_producto for id_producto in conjuntos[0]
+                if all(id_producto in ids for ids in conjuntos[1:])]
+
+
+# Clase que guarda una serie de importes (en centavos) ordenada por fecha con sus sumas acumuladas.
+# Permite sumar los importes de cualquier rango de fechas con dos búsquedas binarias,
+# sin recorrer toda la historia.
+class SerieAcumulada:
+    def __init__(self):
+        self.fechas = []  # Fechas (marcas de tiempo) en orden no decreciente
+        self.acumulados = []  # acumulados[i] es la suma de los importes hasta la posición i
+
+    # Método para añadir un importe al final de la serie.
+    def agregar(self, fecha, importe):
+        if self.fechas and fecha < self.fechas[-1]:
+            fecha = self.fechas[-1]  # Mantenemos el orden aunque el reloj retroceda
+        anterior = self.acumulados[-1] if self.acumulados else 0
+        self.fechas.append(fecha)
+        self.acumulados.append(anterior + importe)
+
+    # Método para sumar los importes con fecha entre desde y hasta (ambos incluidos, None = sin límite).
+    def suma(self, desde=None, hasta=None):
+        inicio = 0 if desde is None else bisect.bisect_left(self.fechas, desde)
+        fin = len(self.fechas) if hasta is None else bisect.bisect_right(self.fechas, hasta)
+        if fin <= inicio:
+            return 0
+        return self.acumulados[fin - 1] - (self.acumulados[inicio - 1] if inicio > 0 else 0)
+
+
+# Clase que representa una venta registrada en el libro de ventas.
+class Venta:
+    __slots__ = ('codigo', 'id_producto', 'cantidad', 'precio_centavos', 'fecha', 'cantidad_devuelta')
+
+    def __init__(self, codigo, id_producto, cantidad, precio_centavos, fecha):
+        self.codigo = codigo  # Código único de la venta
+        self.id_producto = id_producto  # ID del producto vendido
+        self.cantidad = cantidad  # Cantidad vendida
+        self.precio_centavos = precio_centavos  # Precio unitario en centavos al momento de la venta
+        self.fecha = fecha  # Marca de tiempo de la venta
+        self.cantidad_devuelta = 0  # Unidades ya devueltas de esta venta
+
+
+# Clase que representa el libro de ventas: guarda cada venta por su código y la indexa por producto.
+# En disco se escribe en segmentos de solo añadir (ventas_000001.log, ventas_000002.log, ...),
+# una línea JSON por venta o devolución; al iniciar se leen los segmentos en orden.
+class LibroVentas:
+    REGISTROS_POR_SEGMENTO = 10000  # Registros por archivo de segmento antes de empezar uno nuevo
+
+    def __init__(self, directorio=None):
+        self.ventas = {}  # Diccionario con el código de venta como clave y el objeto Venta como valor
+        self.codigos_por_producto = {}  # ID del producto -> lista de códigos de venta
+        self.ingresos_totales = SerieAcumulada()  # Ventas y devoluciones de todos los productos
+        self.ingresos_por_producto = {}  # ID del producto -> SerieAcumulada
+        self.directorio = directorio  # Directorio de los segmentos (None = solo en memoria)
+        self.segmento = 1  # Número del segmento donde se añaden los registros
+        self.registros_segmento = 0  # Registros escritos en el segmento actual
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+            self.cargar()
+
+    # Método que devuelve la ruta del archivo de un segmento.
+    def ruta_segmento(self, numero):
+        return os.path.join(self.directorio, f"ventas_{numero:06d}.log")
+
+    # Método para añadir un registro al segmento actual (solo añadir, nunca reescribir).
+    def escribir_registro(self, registro):
+        if self.directorio is None:
+            return
+        if self.registros_segmento >= self.REGISTROS_POR_SEGMENTO:
+            self.segmento += 1  # El segmento está lleno: empezamos uno nuevo
+            self.registros_segmento = 0
+        with open(self.ruta_segmento(self.segmento), 'a') as f:
+            f.write(json.dumps(registro, separators=(',', ':')) + "\n")
+        self.registros_segmento += 1
+
+    # Método que devuelve los números de los segmentos que hay en el directorio, en orden.
+    def numeros_segmento(self):
+        if self.directorio is None:
+            return []
+        return sorted(int(nombre[7:13]) for nombre in os.listdir(self.directorio)
+                      if nombre.startswith("ventas_") and nombre.endswith(".log"))
+
+    # Generador que entrega los registros de un segmento en orden, uno por línea.
+    # Por una línea ilegible entrega None (así las posiciones no se desplazan) y, salvo que sea
+    # la última sin salto de línea, que es una escritura interrumpida, muestra un aviso.
+    def leer_segmento(self, numero):
+        with open(self.ruta_segmento(numero), 'r') as f:
+            for linea in f:
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    if linea.endswith("\n"):
+                        print("Advertencia: se descartó un registro ilegible del libro de ventas.")
+                    registro = None
+                yield registro
+
+    # Método que indica si el segmento termina en un salto de línea (su último registro está completo).
+    def segmento_completo(self, numero):
+        with open(self.ruta_segmento(numero), 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    # Método para leer todos los segmentos en orden y reconstruir el libro en memoria.
+    # Los registros mal formados se saltan con un aviso en lugar de impedir el inicio.
+    def cargar(self):
+        numeros = self.numeros_segmento()
+        for numero in numeros:
+            self.segmento = numero
+            self.registros_segmento = 0
+            for registro in self.leer_segmento(numero):
+                self.registros_segmento += 1
+                if registro is None:
+                    continue
+                try:
+                    self.aplicar_registro(registro)
+                except (KeyError, TypeError, ValueError):
+                    print("Advertencia: se descartó un registro mal formado del libro de ventas.")
+        if numeros and not self.segmento_completo(numeros[-1]):
+            # El último registro quedó cortado: seguimos en un segmento nuevo para no pegarnos a él.
+            self.segmento += 1
+            self.registros_segmento = 0
+
+    # Método que aplica un registro leído del disco. Una devolución cuya venta no está en el libro
+    # (por ejemplo, porque la línea de la venta se perdió) se descarta con un aviso.
+    def aplicar_registro(self, registro):
+        if registro['tipo'] == 'venta':
+            # Los registros antiguos guardaban el precio con decimales en lugar de centavos
+            precio_centavos = registro.get('precio_centavos')
+            if precio_centavos is None:
+                precio_centavos = a_centavos(registro['precio'])
+            self.aplicar_venta(Venta(registro['codigo'], registro['id_producto'],
+                                     registro['cantidad'], precio_centavos, registro['fecha']))
+        else:
+            venta = self.ventas.get(registro['codigo'])
+            if venta is None:
+                print(f"Advertencia: se descartó una devolución de la venta {registro['codigo']}, que no está en el libro.")
+                return
+            self.aplicar_devolucion(venta, registro['cantidad'], registro['fecha'])
+
+    # Método que devuelve la posición del próximo registro: (segmento, registros ya escritos en él).
+    def posicion(self):
+        return [self.segmento, self.registros_segmento]
+
+    # Generador que entrega los registros escritos desde una posición devuelta por posicion().
+    # Solo lee los segmentos a partir de esa posición.
+    def registros_desde(self, posicion):
+        segmento, registros = posicion
+        for numero in self.numeros_segmento():
+            if numero < segmento:
+                continue
+            for indice, registro in enumerate(self.leer_segmento(numero)):
+                if registro is not None and (numero > segmento or indice >= registros):
+                    yield registro
+
+    # Método que actualiza los índices y las sumas con una venta nueva.
+    def aplicar_venta(self, venta):
+        self.ventas[venta.codigo] = venta
+        self.codigos_por_producto.setdefault(venta.id_producto, []).append(venta.codigo)
+        importe = venta.cantidad * venta.precio_centavos
+        self.ingresos_totales.agregar(venta.fecha, importe)
+        self.ingresos_por_producto.setdefault(venta.id_producto, SerieAcumulada()).agregar(venta.fecha, importe)
+
+    # Método que actualiza la venta y las sumas con una devolución (importe negativo).
+    def aplicar_devolucion(self, venta, cantidad, fecha):
+        venta.cantidad_devuelta += cantidad
+        importe = -cantidad * venta.precio_centavos
+        self.ingresos_totales.agregar(fecha, importe)
+        self.ingresos_por_producto[venta.id_producto].agregar(fecha, importe)
+
+    # Método para registrar una venta nueva en memoria y en disco (precio unitario en centavos).
+    def registrar_venta(self, codigo, id_producto, cantidad, precio_centavos, fecha=None):
+        venta = Venta(codigo, id_producto, cantidad, precio_centavos, time.time() if fecha is None else fecha)
+        self.aplicar_venta(venta)
+        self.escribir_registro({'tipo': 'venta', 'codigo': codigo, 'id_producto': id_producto,
+                                'cantidad': cantidad, 'precio_centavos': precio_centavos, 'fecha': venta.fecha})
+        return venta
+
+    # Método que comprueba que una devolución corresponde a una venta registrada.
+    # Devuelve la venta original si es válida, o None (mostrando el motivo) si no lo es.
+    def validar_devolucion(self, codigo_venta, id_producto, cantidad):
+        try:
+            venta = self.ventas.get(int(codigo_venta))  # Búsqueda directa por código: O(1)
+        except ValueError:
+            venta = None
+        if venta is None:
+            print("No existe una venta con ese código.")
+            return None
+        if venta.id_producto != id_producto:
+            print("El producto no corresponde a esa venta.")
+            return None
+        if cantidad <= 0 or cantidad > venta.cantidad - venta.cantidad_devuelta:
+            print(f"Cantidad no válida: se pueden devolver hasta {venta.cantidad - venta.cantidad_devuelta} unidades.")
+            return None
+        return venta
+
+    # Método para registrar una devolución ya validada en memoria y en disco.
+    def registrar_devolucion(self, venta, cantidad, fecha=None):
+        fecha = time.time() if fecha is None else fecha
+        self.aplicar_devolucion(venta, cantidad, fecha)
+        self.escribir_registro({'tipo': 'devolucion', 'codigo': venta.codigo, 'cantidad': cantidad, 'fecha': fecha})
+        return a_monto(cantidad * venta.precio_centavos)
+
+    # Método que devuelve las ventas de un producto usando el índice por producto.
+    def ventas_de_producto(self, id_producto):
+        return [self.ventas[codigo] for codigo in self.codigos_por_producto.get(id_producto, [])]
+
+    # Método que suma los ingresos netos (ventas menos devoluciones) de un producto o de todos,
+    # opcionalmente entre dos fechas, usando las sumas acumuladas en centavos.
+    def ingresos(self, id_producto=None, desde=None, hasta=None):
+        if id_producto is None:
+            return a_monto(self.ingresos_totales.suma(desde, hasta))
+        serie = self.ingresos_por_producto.get(id_producto)
+        return a_monto(serie.suma(desde, hasta)) if serie is not None else 0
+
+    # Método que devuelve el código más alto registrado (0 si no hay ventas).
+    def ultimo_codigo(self):
+        return max(self.ventas, default=0)
+
+
+# Clase que mantiene los totales del inventario al día con cada cambio de un producto:
+# unidades, valor en centavos, productos por tramo de precio y productos bajo el umbral
+# de reposición. Así las consultas no tienen que recorrer todo el inventario.
+class ResumenStock:
+    TRAMOS_PRECIO = (1000, 5000, 10000, 50000)  # Límites de los tramos de precio, en centavos
+
+    def __init__(self, umbral_reposicion=5):
+        self.umbral_reposicion = umbral_reposicion  # Con menos unidades, el producto está bajo stock
+        self.total_unidades = 0  # Unidades en stock de todos los productos
+        self.total_centavos = 0  # Valor del stock (cantidad por precio) en centavos
+        self.por_tramo = [0] * (len(self.TRAMOS_PRECIO) + 1)  # Productos en cada tramo de precio
+        self.bajo_stock = []  # Lista ordenada de (cantidad, id) de los productos bajo el umbral
+
+    # Método que devuelve los valores del producto que intervienen en los totales.
+    @staticmethod
+    def estado(producto):
+        return producto.id_producto, producto.cantidad, producto.precio_centavos
+
+    # Método que quita el estado anterior de un producto y suma el nuevo (None al añadir o al eliminar).
+    def actualizar(self, anterior=None, nuevo=None):
+        if anterior is not None:
+            self.aplicar(anterior, -1)
+        if nuevo is not None:
+            self.aplicar(nuevo, 1)
+
+    # Método que suma (signo 1) o resta (signo -1) un estado de los totales.
+    def aplicar(self, estado, signo):
+        id_producto, cantidad, precio_centavos = estado
+        self.total_unidades += signo * cantidad
+        self.total_centavos += signo * cantidad * precio_centavos
+        self.por_tramo[bisect.bisect_right(self.TRAMOS_PRECIO, precio_centavos)] += signo
+        if cantidad < self.umbral_reposicion:
+            if signo > 0:
+                bisect.insort(self.bajo_stock, (cantidad, id_producto))
+            else:
+                del self.bajo_stock[bisect.bisect_left(self.bajo_stock, (cantidad, id_producto))]
+
+    # Método que devuelve cuántos productos hay en cada tramo de precio, por ejemplo {"10.00-50.00": 3, ...}.
+    def productos_por_tramo(self):
+        limites = (0,) + self.TRAMOS_PRECIO
+        conteo = {}
+        for i, cantidad in enumerate(self.por_tramo):
+            if i < len(self.TRAMOS_PRECIO):
+                conteo[f"{a_monto(limites[i]):.2f}-{a_monto(limites[i + 1]):.2f}"] = cantidad
+            else:
+                conteo[f"{a_monto(limites[i]):.2f}+"] = cantidad
+        return conteo
+
+    # Método que devuelve (id, cantidad) de los productos bajo el umbral, de menos a más unidades.
+    def productos_bajo_stock(self, limite=None):
+        seleccion = self.bajo_stock if limite is None else self.bajo_stock[:limite]
+        return [(id_producto, cantidad) for cantidad, id_producto in seleccion]
+
+
+# Clase que guarda los productos en memoria y los escribe como un archivo JSON completo al guardar
+# (el almacenamiento de siempre del inventario). Mantiene también el índice de trigramas de los nombres.
+# Todos los almacenamientos ofrecen los mismos métodos, así Inventario puede usar cualquiera.
+class AlmacenJSON:
+    GENERACIONES = 3  # Copias anteriores del archivo de inventario que se conservan
+    # Clave del archivo con la posición del libro de ventas que ya está reflejada en el stock.
+    CLAVE_POSICION_VENTAS = '__posicion_libro_ventas__'
 
-# Clase que representa el inventario de productos.
-class Inventario:
     def __init__(self):
         self.productos = {}  # Diccionario para almacenar productos, donde la clave es el ID del producto
-        self.total_ventas = 0  # Total de ventas realizadas
-        self.codigo_venta = 1  # Código de venta autogenerado
+        self.indice_nombres = IndiceTrigramas()  # Índice de trigramas para buscar por nombre
+
+    # Método para leer el archivo JSON válido más reciente. Los productos se construyen uno a uno
+    # mientras se lee, sin cargar el archivo completo en memoria; si se indica progreso, se llama
+    # con (bytes_leidos, bytes_totales). Devuelve la posición del libro de ventas guardada con
+    # el archivo (None en los archivos anteriores, que no la guardaban).
+    def cargar(self, archivo, progreso=None):
+        posicion_ventas = None
+
+        def leer_productos(f):
+            nonlocal posicion_ventas
+            productos = {}
+            for id, producto in iterar_json(f, progreso):
+                if id == self.CLAVE_POSICION_VENTAS:
+                    posicion_ventas = producto
+                    continue
+                productos[id] = Producto(**producto)  # Creamos cada objeto Producto al leerlo
+            return productos
+
+        self.productos = cargar_snapshot(archivo, self.GENERACIONES, leer_productos)
+        # Reconstruimos el índice de nombres con los productos cargados.
+        self.indice_nombres = IndiceTrigramas()
+        for id, producto in self.productos.items():
+            self.indice_nombres.agregar(id, producto.obtener_nombre())
+        return posicion_ventas
+
+    # Método para escribir el archivo de forma atómica junto con la posición del libro de ventas.
+    def guardar(self, archivo, posicion_ventas):
+        datos = {id: producto.to_dict() for id, producto in self.productos.items()}
+        datos[self.CLAVE_POSICION_VENTAS] = posicion_ventas
+        escribir_snapshot_atomico(archivo, datos, self.GENERACIONES)
+        return True
+
+    def obtener(self, id_producto):
+        return self.productos.get(id_producto)
+
+    def __contains__(self, id_producto):
+        return id_producto in self.productos
+
+    def __len__(self):
+        return len(self.productos)
+
+    def __iter__(self):
+        return iter(list(self.productos.values()))
+
+    def agregar(self, producto):
+        self.productos[producto.obtener_id()] = producto
+        self.indice_nombres.agregar(producto.obtener_id(), producto.obtener_nombre())
+        return True
+
+    def agregar_lote(self, productos):
+        for producto in productos:
+            self.agregar(producto)
+        return True
+
+    # En memoria el cambio ya está hecho sobre el objeto: se escribe en disco al guardar.
+    def actualizar(self, producto, posicion_ventas=None):
+        return True
+
+    def actualizar_lote(self, productos, posicion_ventas=None):
+        return True
+
+    def eliminar(self, id_producto):
+        producto = self.productos.pop(id_producto, None)
+        if producto is None:
+            return False
+        self.indice_nombres.eliminar(id_producto, producto.obtener_nombre())
+        return True
+
+    # Método para renombrar un producto manteniendo el índice de búsqueda al día.
+    def renombrar(self, producto, nombre):
+        self.indice_nombres.eliminar(producto.obtener_id(), producto.obtener_nombre())
+        producto.establecer_nombre(nombre)
+        self.indice_nombres.agregar(producto.obtener_id(), nombre)
+
+    # Método que devuelve los productos cuyo nombre contiene la consulta (ya en minúsculas).
+    # Usa el índice de trigramas; las consultas de menos de 3 caracteres recorren todo el inventario.
+    def buscar(self, consulta):
+        if len(consulta) < 3:
+            candidatos = self.productos.values()
+        else:
+            candidatos = [self.productos[id] for id in self.indice_nombres.candidatos(consulta)]
+        # Confirmamos la subcadena completa (los trigramas podrían aparecer separados en el nombre).
+        return [producto for producto in candidatos if consulta in producto.obtener_nombre().lower()]
+
+    # Método generador que recorre los productos en el orden indicado (None = orden en que se añadieron)
+    # después de `cursor`. Recorre una copia de las referencias, así los cambios no interrumpen el recorrido.
+    def recorrer(self, orden=None, cursor=None):
+        if orden is None and cursor is None:
+            yield from list(self.productos.values())
+            return
+        clave = clave_orden(orden or 'id')
+        productos = self.productos.values()
+        if cursor is not None:
+            productos = (producto for producto in productos if clave(producto) > cursor)
+        yield from sorted(productos, key=clave)
+
+    def pagina(self, tamano, cursor, orden):
+        return paginar(self.productos.values(), clave_orden(orden), tamano, cursor)
+
+
+# Clase que guarda los productos en una base de datos SQLite (módulo sqlite3 de la biblioteca estándar).
+# Los productos viven en la tabla productos, indexada por id y por nombre, y un objeto Producto solo se
+# construye al leer su fila: el arranque y la memoria no dependen del tamaño del catálogo.
+# Cada operación usa una sentencia SQL fija, que sqlite3 prepara una vez y reutiliza, y cada cambio
+# (o lote de cambios) se confirma en su propia transacción. Junto con el stock de una venta o devolución
+# se guarda, en la misma transacción, la posición del libro de ventas que ya está reflejada en él.
+# La búsqueda por nombre usa la tabla FTS5 productos_nombres, con el tokenizador de trigramas sobre el
+# nombre en minúsculas (columna nombre_min, escrita desde Python con str.lower); los disparadores la
+# mantienen al día con la tabla de productos.
+class AlmacenSQLite:
+    ARCHIVO_BASE_DATOS = "inventario.db"
+    TAMANO_PAGINA = 1000  # Filas leídas por consulta al recorrer el inventario
+
+    CREAR_ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS productos (
+            id TEXT PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            cantidad INTEGER NOT NULL,
+            precio_centavos INTEGER NOT NULL,
+            nombre_min TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS productos_nombre ON productos (nombre);
+        CREATE TABLE IF NOT EXISTS estado (
+            clave TEXT PRIMARY KEY,
+            valor TEXT NOT NULL
+        );
+    """
+    CREAR_BUSQUEDA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS productos_nombres
+            USING fts5(nombre_min, tokenize = 'trigram case_sensitive 1');
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_insertar AFTER INSERT ON productos BEGIN
+            INSERT INTO productos_nombres (rowid, nombre_min) VALUES (new.rowid, new.nombre_min);
+        END;
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_actualizar AFTER UPDATE OF nombre_min ON productos BEGIN
+            UPDATE productos_nombres SET nombre_min = new.nombre_min WHERE rowid = old.rowid;
+        END;
+        CREATE TRIGGER IF NOT EXISTS productos_nombres_eliminar AFTER DELETE ON productos BEGIN
+            DELETE FROM productos_nombres WHERE rowid = old.rowid;
+        END;
+    """
+    COLUMNAS = "SELECT id, nombre, cantidad, precio_centavos FROM productos"
+    INSERTAR = "INSERT INTO productos (id, nombre, cantidad, precio_centavos, nombre_min) VALUES (?, ?, ?, ?, ?)"
+    ACTUALIZAR = "UPDATE productos SET nombre = ?, cantidad = ?, precio_centavos = ?, nombre_min = ? WHERE id = ?"
+    ELIMINAR = "DELETE FROM productos WHERE id = ?"
+    GUARDAR_POSICION = "INSERT OR REPLACE INTO estado (clave, valor) VALUES ('posicion_libro_ventas', ?)"
+    LEER_POSICION = "SELECT valor FROM estado WHERE clave = 'posicion_libro_ventas'"
+    COLUMNAS_ORDEN = {'id': 'id', 'nombre': 'nombre', 'cantidad': 'cantidad', 'precio': 'precio_centavos'}
+
+    def __init__(self, ruta=ARCHIVO_BASE_DATOS):
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute("PRAGMA journal_mode = WAL")
+        self.conexion.execute("PRAGMA synchronous = NORMAL")
+        self.conexion.executescript(self.CREAR_ESQUEMA)
+        if not self.conexion.execute("SELECT 1 FROM sqlite_master WHERE name = 'productos_nombres'").fetchone():
+            self.crear_busqueda()
+
+    # Método que crea la tabla de búsqueda y la llena con los productos que ya estén en la base, en una
+    # sola transacción. Una base anterior a la búsqueda recibe antes la columna nombre_min.
+    def crear_busqueda(self):
+        columnas = [fila[1] for fila in self.conexion.execute("PRAGMA table_info(productos)")]
+        agregar_columna = ("" if 'nombre_min' in columnas
+                           else "ALTER TABLE productos ADD COLUMN nombre_min TEXT NOT NULL DEFAULT '';")
+        # str.lower solo se registra para llenar la columna: los disparadores no lo necesitan
+        self.conexion.create_function('minusculas', 1, str.lower, deterministic=True)
+        self.conexion.executescript(f"""
+            BEGIN;
+            {agregar_columna}
+            UPDATE productos SET nombre_min = minusculas(nombre);
+            {self.CREAR_BUSQUEDA}
+            INSERT INTO productos_nombres (rowid, nombre_min) SELECT rowid, nombre_min FROM productos;
+            COMMIT;
+        """)
+
+    # Método que construye un Producto a partir de una fila de la tabla.
+    @staticmethod
+    def a_producto(fila):
+        producto = Producto(fila[0], fila[1], fila[2], 0)
+        producto.precio_centavos = fila[3]  # La tabla ya guarda el precio en centavos
+        return producto
+
+    @staticmethod
+    def a_fila(producto):
+        return (producto.id_producto, producto.nombre, producto.cantidad, producto.precio_centavos,
+                producto.nombre.lower())
+
+    @staticmethod
+    def a_fila_actualizacion(producto):
+        return (producto.nombre, producto.cantidad, producto.precio_centavos, producto.nombre.lower(),
+                producto.id_producto)
+
+    # Método que ejecuta la sentencia con cada fila en una sola transacción y, si se indica,
+    # guarda en la misma transacción la posición del libro de ventas. Si algo falla, no se
+    # aplica nada. Devuelve True si la operación fue exitosa.
+    def ejecutar(self, sentencia, filas, posicion_ventas=None):
+        try:
+            with self.conexion:
+                cursor = self.conexion.executemany(sentencia, filas)
+                if posicion_ventas is not None:
+                    self.conexion.execute(self.GUARDAR_POSICION, (json.dumps(posicion_ventas),))
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            print(f"Error al guardar en la base de datos: {e}")
+            return False
+
+    def cerrar(self):
+        self.conexion.close()
+
+    # No carga productos por adelantado: las filas se leen cuando se necesitan.
+    # El archivo JSON no se usa; devuelve la posición del libro de ventas guardada en la base.
+    def cargar(self, archivo=None, progreso=None):
+        fila = self.conexion.execute(self.LEER_POSICION).fetchone()
+        return json.loads(fila[0]) if fila is not None else None
+
+    # Cada cambio ya está confirmado: solo se guarda la posición y se vuelca el registro WAL en la base.
+    def guardar(self, archivo=None, posicion_ventas=None):
+        try:
+            with self.conexion:
+                self.conexion.execute(self.GUARDAR_POSICION, (json.dumps(posicion_ventas),))
+            self.conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return True
+        except sqlite3.Error as e:
+            print(f"Error al guardar en la base de datos: {e}")
+            return False
+
+    def obtener(self, id_producto):
+        fila = self.conexion.execute(self.COLUMNAS + " WHERE id = ?", (id_producto,)).fetchone()
+        return self.a_producto(fila) if fila is not None else None
+
+    def __contains__(self, id_producto):
+        return self.conexion.execute("SELECT 1 FROM productos WHERE id = ?", (id_producto,)).fetchone() is not None
+
+    def __len__(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM productos").fetchone()[0]
+
+    def __iter__(self):
+        return self.recorrer()
+
+    def agregar(self, producto):
+        return self.ejecutar(self.INSERTAR, [self.a_fila(producto)])
+
+    def agregar_lote(self, productos):
+        return self.ejecutar(self.INSERTAR, [self.a_fila(p) for p in productos])
+
+    def actualizar(self, producto, posicion_ventas=None):
+        return self.ejecutar(self.ACTUALIZAR, [self.a_fila_actualizacion(producto)], posicion_ventas)
+
+    def actualizar_lote(self, productos, posicion_ventas=None):
+        return self.ejecutar(self.ACTUALIZAR, [self.a_fila_actualizacion(p) for p in productos], posicion_ventas)
+
+    def eliminar(self, id_producto):
+        return self.ejecutar(self.ELIMINAR, [(id_producto,)])
+
+    # El nombre nuevo se escribe en la tabla con actualizar; los índices se mantienen solos.
+    def renombrar(self, producto, nombre):
+        producto.establecer_nombre(nombre)
+
+    # Método que devuelve los productos cuyo nombre contiene la consulta (ya en minúsculas).
+    # Usa el índice de trigramas; las consultas de menos de 3 caracteres recorren toda la tabla.
+    def buscar(self, consulta):
+        if len(consulta) < 3:
+            filas = self.conexion.execute(self.COLUMNAS + " WHERE instr(nombre_min, ?) > 0", (consulta,)).fetchall()
+        else:
+            # Entre comillas, la consulta es una frase: sus trigramas seguidos, es decir, la subcadena
+            frase = '"' + consulta.replace('"', '""') + '"'
+            filas = self.conexion.execute(self.COLUMNAS + " WHERE rowid IN (SELECT rowid FROM productos_nombres "
+                                          "WHERE productos_nombres MATCH ?)", (frase,)).fetchall()
+        return [self.a_producto(fila) for fila in filas]
+
+    # Método que lee hasta `limite` filas ordenadas por (columna, id) después de `cursor`.
+    # La comparación de filas (columna, id) > (?, ?) usa los índices sin necesidad de OFFSET.
+    def leer_filas(self, orden, limite, cursor):
+        clave_orden(orden)  # Valida el criterio de orden
+        columna = self.COLUMNAS_ORDEN[orden]
+        if cursor is None:
+            return self.conexion.execute(self.COLUMNAS + f" ORDER BY {columna}, id LIMIT ?", (limite,)).fetchall()
+        return self.conexion.execute(self.COLUMNAS + f" WHERE ({columna}, id) > (?, ?) ORDER BY {columna}, id LIMIT ?",
+                                     (*cursor, limite)).fetchall()
+
+    # Método generador que recorre los productos en el orden indicado (None = por id) después de `cursor`,
+    # leyendo la tabla por páginas en lugar de cargarla completa.
+    def recorrer(self, orden=None, cursor=None):
+        orden = orden or 'id'
+        clave = clave_orden(orden)
+        while True:
+            filas = self.leer_filas(orden, self.TAMANO_PAGINA, cursor)
+            productos = [self.a_producto(fila) for fila in filas]
+            yield from productos
+            if len(filas) < self.TAMANO_PAGINA:
+                return
+            cursor = clave(productos[-1])
+
+    def pagina(self, tamano, cursor, orden):
+        productos = [self.a_producto(fila) for fila in self.leer_filas(orden, tamano + 1, cursor)]
+        if len(productos) > tamano:
+            return productos[:tamano], clave_orden(orden)(productos[tamano - 1])
+        return productos, None
+
+
+# Clase que representa el inventario de productos.
+# Los productos viven en un almacenamiento intercambiable: por defecto un AlmacenJSON en memoria
+# que se escribe completo al guardar; un AlmacenSQLite los mantiene en una base de datos SQLite.
+# El libro de ventas se escribe con cada venta y devolución. Al cargar, el inventario aplica al stock
+# los registros del libro posteriores a la posición guardada con él (ver reconciliar_con_libro).
+class Inventario:
+    # directorio_ventas es la carpeta de los segmentos del libro de ventas (None = solo en memoria).
+    # umbral_reposicion es la cantidad por debajo de la cual un producto se considera bajo stock.
+    # almacen decide dónde viven los productos (None = AlmacenJSON).
+    def __init__(self, directorio_ventas=None, umbral_reposicion=5, almacen=None):
+        self.almacen = almacen if almacen is not None else AlmacenJSON()
+        self.libro_ventas = LibroVentas(directorio_ventas)  # Historial de ventas y devoluciones
+        self.codigo_venta = self.libro_ventas.ultimo_codigo() + 1  # Código de venta autogenerado
+        self.umbral_reposicion = umbral_reposicion
+        self._resumen_stock = None  # Totales del inventario, se calculan en la primera consulta
+
+    # Total de ventas realizadas: se obtiene de las sumas exactas en centavos del libro de ventas.
+    @property
+    def total_ventas(self):
+        return self.libro_ventas.ingresos()
+
+    # Totales que se mantienen con cada cambio. Se calculan recorriendo el almacenamiento la primera
+    # vez que se consultan, así el arranque no depende del tamaño del catálogo.
+    @property
+    def resumen_stock(self):
+        if self._resumen_stock is None:
+            resumen = ResumenStock(self.umbral_reposicion)
+            for producto in self.almacen:
+                resumen.actualizar(nuevo=ResumenStock.estado(producto))
+            self._resumen_stock = resumen
+        return self._resumen_stock
+
+    # Método que lleva un cambio de un producto a los totales (si ya se calcularon).
+    def actualizar_resumen(self, anterior=None, nuevo=None):
+        if self._resumen_stock is not None:
+            self._resumen_stock.actualizar(anterior, nuevo)
+
+    # Método que escribe el stock de un producto tras una venta o devolución, con la posición del libro
+    # de ventas que ya refleja. Si no se pudo escribir, el registro del libro se vuelve a aplicar al cargar.
+    def guardar_cambio_stock(self, producto, anterior):
+        if self.almacen.actualizar(producto, self.libro_ventas.posicion()):
+            self.actualizar_resumen(anterior, ResumenStock.estado(producto))
+        else:
+            self._resumen_stock = None  # Se recalcula desde el almacenamiento en la próxima consulta
 
     # Método para añadir un nuevo producto al inventario.
     def añadir_producto(self, producto):
-        if producto.obtener_id() in self.productos:
+        if producto.obtener_id() in self.almacen:
             print("El producto ya existe en el inventario.")
-        else:
-            self.productos[producto.obtener_id()] = producto  # Añadimos el producto al diccionario
+        elif self.almacen.agregar(producto):
+            self.actualizar_resumen(nuevo=ResumenStock.estado(producto))
             print("Producto añadido al inventario.")
 
     # Método para eliminar un producto del inventario por su ID.
     def eliminar_producto(self, id_producto):
-        if id_producto in self.productos:
-            del self.productos[id_producto]  # Eliminamos el producto del diccionario
-            print("Producto eliminado del inventario.")
-        else:
+        producto = self.almacen.obtener(id_producto)
+        if producto is None:
             print("Producto no encontrado.")
+        elif self.almacen.eliminar(id_producto):
+            self.actualizar_resumen(anterior=ResumenStock.estado(producto))
+            print("Producto eliminado del inventario.")
 
-    # Método para actualizar la cantidad o el precio de un producto.
-    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
-        if id_producto in self.productos:
-            if cantidad is not None:
-                self.productos[id_producto].establecer_cantidad(cantidad)  # Actualizamos la cantidad
-            if precio is not None:
-                self.productos[id_producto].establecer_precio(precio)  # Actualizamos el precio
+    # Método para actualizar la cantidad, el precio o el nombre de un producto.
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None, nombre=None):
+        producto = self.almacen.obtener(id_producto)
+        if producto is None:
+            print("Producto no encontrado.")
+            return
+        anterior = ResumenStock.estado(producto)
+        if nombre is not None:
+            self.almacen.renombrar(producto, nombre)  # El almacenamiento mantiene su índice de nombres
+        if cantidad is not None:
+            producto.establecer_cantidad(cantidad)  # Actualizamos la cantidad
+        if precio is not None:
+            producto.establecer_precio(precio)  # Actualizamos el precio
+        if self.almacen.actualizar(producto):
+            self.actualizar_resumen(anterior, ResumenStock.estado(producto))
             print("Producto actualizado.")
         else:
-            print("Producto no encontrado.")
+            self._resumen_stock = None  # Se recalcula desde el almacenamiento en la próxima consulta
 
     # Método para buscar productos por nombre.
     def buscar_producto(self, nombre):
-        encontrados = [producto for producto in self.productos.values() if
-                       nombre.lower() in producto.obtener_nombre().lower()]
+        encontrados = self.almacen.buscar(nombre.lower())
         if encontrados:
-            for producto in encontrados:
-                # Mostramos los detalles de los productos encontrados.
-                print(
-                    f"ID: {producto.obtener_id()}, Nombre: {producto.obtener_nombre()}, Cantidad: {producto.obtener_cantidad()}, Precio: {producto.obtener_precio()}")
+            escribir_en_bloques(map(str, encontrados))  # Mostramos los detalles de los productos encontrados.
         else:
             print("No se encontraron productos con ese nombre.")
 
-    # Método para mostrar todos los productos en el inventario.
-    def mostrar_productos(self):
-        if not self.productos:
-            print("El inventario está vacío.")
-        else:
-            for producto in self.productos.values():
-                # Mostramos los detalles de cada producto en el inventario.
-                print(
-                    f"ID: {producto.obtener_id()}, Nombre: {producto.obtener_nombre()}, Cantidad: {producto.obtener_cantidad()}, Precio: {producto.obtener_precio()}")
+    # Método generador que recorre los productos uno a uno.
+    # orden puede ser 'id', 'nombre', 'cantidad' o 'precio' (None = orden del almacenamiento),
+    # y cursor (obtenido de pagina_productos) continúa el recorrido desde ese punto.
+    def listar_productos(self, orden=None, cursor=None):
+        yield from self.almacen.recorrer(orden, cursor)
+
+    # Método que devuelve una página de `tamano` productos y el cursor para pedir la siguiente
+    # (None si es la última). El cursor es la clave del último producto de la página, así las
+    # páginas siguen siendo correctas aunque entre una y otra se añadan o eliminen productos.
+    def pagina_productos(self, tamano=50, cursor=None, orden='id'):
+        return self.almacen.pagina(tamano, cursor, orden)
+
+    # Método para mostrar todos los productos en el inventario, escribiendo las líneas por bloques.
+    def mostrar_productos(self, orden=None, salida=None):
+        if not escribir_en_bloques(map(str, self.listar_productos(orden)), salida):
+            print("El inventario está vacío.", file=salida)
 
     # Método para registrar una venta de un producto.
+    # La venta se escribe primero en el libro y después el stock, con la posición del libro ya
+    # reflejada: si el programa se interrumpe entre ambos, la venta se aplica al cargar.
     def registrar_venta(self, id_producto, cantidad_vendida):
-        if id_producto in self.productos and self.productos[id_producto].obtener_cantidad() >= cantidad_vendida:
-            total_venta = cantidad_vendida * self.productos[
-                id_producto].obtener_precio()  # Calculamos el total de la venta
-            self.productos[id_producto].establecer_cantidad(self.productos[
-                                                                id_producto].obtener_cantidad() - cantidad_vendida)  # Actualizamos la cantidad en el inventario
-            self.total_ventas += total_venta  # Actualizamos el total de ventas
+        producto = self.almacen.obtener(id_producto)
+        if producto is not None and producto.obtener_cantidad() >= cantidad_vendida:
+            precio_centavos = producto.obtener_precio_centavos()
+            total_venta = a_monto(cantidad_vendida * precio_centavos)  # Calculamos el total de la venta
             codigo = self.codigo_venta  # Guardamos el código de la venta
             self.codigo_venta += 1  # Incrementamos el código de venta para la próxima transacción
+            # Guardamos la venta en el libro con el precio unitario del momento.
+            self.libro_ventas.registrar_venta(codigo, id_producto, cantidad_vendida, precio_centavos)
+            anterior = ResumenStock.estado(producto)
+            producto.establecer_cantidad(producto.obtener_cantidad() - cantidad_vendida)  # Actualizamos la cantidad en el inventario
+            self.guardar_cambio_stock(producto, anterior)
             print(
-                f"Venta registrada: Código {codigo}, Producto: {self.productos[id_producto].obtener_nombre()}, Cantidad: {cantidad_vendida}, Total: {total_venta}")
+                f"Venta registrada: Código {codigo}, Producto: {producto.obtener_nombre()}, Cantidad: {cantidad_vendida}, Total: {total_venta}")
+            return codigo
         else:
             print("No hay suficiente stock para realizar la venta.")
 
     # Método para procesar una devolución de un producto.
+    # La devolución se valida contra la venta original (producto y unidades pendientes de devolver)
+    # y se reembolsa al precio de esa venta, no al precio actual.
     def procesar_devolucion(self, codigo_venta, id_producto, cantidad_devuelta):
-        if id_producto in self.productos:
-            self.productos[id_producto].establecer_cantidad(self.productos[
-                                                                id_producto].obtener_cantidad() + cantidad_devuelta)  # Aumentamos la cantidad en el inventario
-            total_devolucion = cantidad_devuelta * self.productos[
-                id_producto].obtener_precio()  # Calculamos el total de la devolución
-            self.total_ventas -= total_devolucion  # Actualizamos el total de ventas
+        producto = self.almacen.obtener(id_producto)
+        if producto is not None:
+            venta = self.libro_ventas.validar_devolucion(codigo_venta, id_producto, cantidad_devuelta)
+            if venta is None:
+                return
+            total_devolucion = self.libro_ventas.registrar_devolucion(
+                venta, cantidad_devuelta)  # Calculamos el total de la devolución con el precio original
+            anterior = ResumenStock.estado(producto)
+            producto.establecer_cantidad(producto.obtener_cantidad() + cantidad_devuelta)  # Aumentamos la cantidad en el inventario
+            self.guardar_cambio_stock(producto, anterior)
             print(
-                f"Devolución procesada: Código {codigo_venta}, Producto: {self.productos[id_producto].obtener_nombre()}, Cantidad: {cantidad_devuelta}, Total: {total_devolucion}")
+                f"Devolución procesada: Código {codigo_venta}, Producto: {producto.obtener_nombre()}, Cantidad: {cantidad_devuelta}, Total: {total_devolucion}")
         else:
             print("El producto no existe en el inventario.")
 
-    # Método para guardar el inventario en un archivo JSON.
+    # Métodos de consulta sobre los totales del resumen: no recorren el inventario.
+    def total_unidades(self):
+        return self.resumen_stock.total_unidades
+
+    def valor_total(self):
+        return a_monto(self.resumen_stock.total_centavos)
+
+    def productos_por_tramo_precio(self):
+        return self.resumen_stock.productos_por_tramo()
+
+    def productos_bajo_stock(self, limite=None):
+        return self.resumen_stock.productos_bajo_stock(limite)
+
+    # Método para guardar el inventario en un archivo JSON (en SQLite cada cambio ya está guardado),
+    # junto con la posición del libro de ventas que ya está reflejada en el stock.
     def guardar_inventario(self, archivo):
-        with open(archivo, 'w') as f:
-            json.dump({id: producto.to_dict() for id, producto in self.productos.items()},
-                      f)  # Serializamos el diccionario de productos a formato JSON
-        print("Inventario guardado en el archivo.")
+        if self.almacen.guardar(archivo, self.libro_ventas.posicion()):
+            print("Inventario guardado en el archivo.")
+
+    # Método que aplica al stock los registros del libro de ventas escritos desde la posición dada:
+    # una venta descuenta unidades y una devolución las repone. Los registros mal formados,
+    # las devoluciones sin venta y los productos que ya no existen se saltan.
+    # Los productos cambiados se escriben de una vez, junto con la posición final del libro.
+    def reconciliar_con_libro(self, posicion):
+        cambiados = {}
+        aplicados = 0
+        for registro in self.libro_ventas.registros_desde(posicion):
+            try:
+                if registro['tipo'] == 'venta':
+                    id_producto, unidades = registro['id_producto'], -registro['cantidad']
+                else:
+                    venta = self.libro_ventas.ventas.get(registro['codigo'])
+                    if venta is None:
+                        continue
+                    id_producto, unidades = venta.id_producto, registro['cantidad']
+            except (KeyError, TypeError):
+                continue
+            producto = cambiados.get(id_producto)
+            if producto is None:
+                producto = self.almacen.obtener(id_producto)
+            if producto is not None:
+                producto.establecer_cantidad(producto.obtener_cantidad() + unidades)
+                cambiados[id_producto] = producto
+                aplicados += 1
+        if cambiados:
+            self.almacen.actualizar_lote(list(cambiados.values()), self.libro_ventas.posicion())
+        if aplicados:
+            print(f"Se aplicaron al stock {aplicados} ventas y devoluciones registradas después del último guardado.")
 
-    # Método para cargar el inventario desde un archivo JSON.
-    def cargar_inventario(self, archivo):
+    # Método para cargar el inventario desde el almacenamiento (el archivo JSON, o nada en SQLite,
+    # que lee las filas cuando se necesitan). Los archivos anteriores no guardaban la posición
+    # del libro de ventas: su stock se toma tal cual.
+    # Si se indica progreso, se llama con (bytes_leidos, bytes_totales) durante la lectura.
+    def cargar_inventario(self, archivo, progreso=None):
         try:
-            with open(archivo, 'r') as f:
-                data = json.load(f)  # Deserializamos el contenido del archivo JSON a un diccionario de productos
-                self.productos = {id: Producto(**producto) for id, producto in
-                                  data.items()}  # Creamos objetos Producto a partir del diccionario
+            posicion_ventas = self.almacen.cargar(archivo, progreso)
+            # Aplicamos al stock las ventas y devoluciones registradas después del último guardado.
+            if posicion_ventas is not None:
+                self.reconciliar_con_libro(posicion_ventas)
+            self._resumen_stock = None  # Los totales se recalculan en la próxima consulta
             print("Inventario cargado desde el archivo.")
         except FileNotFoundError:
             print("El archivo no existe.")
-        except json.JSONDecodeError:
+        except (ValueError, KeyError, TypeError):
             print("Error al leer el archivo.")
 
 
 # Función que muestra un menú interactivo para gestionar el inventario.
 def menu():
-    inventario = Inventario()  # Creamos una instancia de la clase Inventario.
+    inventario = Inventario('ventas')  # Creamos una instancia de la clase Inventario con su libro de ventas.
     inventario.cargar_inventario('inventario.json')  # Cargamos el inventario desde un archivo JSON.
 
     while True:  # Bucle infinito para mostrar el menú hasta que el usuario decida salir.
@@ -1,10 +1,95 @@
+from array import array
+import bisect
+from contextlib import contextmanager, nullcontext
+from decimal import Decimal, ROUND_HALF_UP
+import heapq
+import sys
+import threading
+
+
+# Motor de dinero: los precios y el dinero en caja se guardan como enteros en centavos,
+# así las sumas son exactas y no acumulan el error de los flotantes.
+def a_centavos(monto):
+    # Convertir un monto (int, float o str) a centavos, redondeando la mitad hacia arriba
+    if isinstance(monto, int):
+        return monto * 100
+    if isinstance(monto, float):
+        escalado = monto * 100
+        centavos = round(escalado)
+        # Solo los casos cercanos a medio centavo (p. ej. 1.005) necesitan el cálculo decimal exacto
+        if abs(abs(escalado - centavos) - 0.5) > 1e-6:
+            return int(centavos)
+        monto = repr(monto)
+    return int(Decimal(monto).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+def a_monto(centavos):
+    # Convertir centavos a un monto con decimales (para mostrar o devolver a la API existente)
+    return centavos / 100
+
+
+# Listados: criterios de orden para recorrer y paginar productos (sirven para Producto y ProductoColumnar)
+CLAVES_ORDEN = {
+    'id': lambda p: p.get_id(),
+    'nombre': lambda p: p.get_nombre(),
+    'cantidad': lambda p: p.get_cantidad(),
+    'precio': lambda p: p.get_precio_centavos(),
+}
+
+
+def clave_orden(orden):
+    # Clave (valor, id) para ordenar por `orden`; el id desempata y hace de cursor de paginación
+    try:
+        obtener = CLAVES_ORDEN[orden]
+    except KeyError:
+        raise ValueError(f"Orden no válido: {orden}. Opciones: {', '.join(CLAVES_ORDEN)}") from None
+    return lambda p: (obtener(p), p.get_id())
+
+
+def paginar(elementos, clave, tamano, cursor=None):
+    # Los `tamano` primeros elementos en el orden de `clave` que van después de `cursor`, y el cursor
+    # de la página siguiente (None si no quedan más). Un montículo evita ordenar todo: O(n log tamano).
+    if cursor is not None:
+        elementos = (e for e in elementos if clave(e) > cursor)
+    pagina = heapq.nsmallest(tamano + 1, elementos, key=clave)
+    if len(pagina) > tamano:
+        return pagina[:tamano], clave(pagina[tamano - 1])
+    return pagina, None
+
+
+def escribir_en_bloques(lineas, salida=None, lineas_por_bloque=1000):
+    # Escribir las líneas juntando `lineas_por_bloque` en cada escritura en lugar de un print por línea.
+    # Retorna la cantidad de líneas escritas.
+    salida = salida if salida is not None else sys.stdout
+    escritas = 0
+    bloque = []
+    for linea in lineas:
+        bloque.append(linea)
+        if len(bloque) == lineas_por_bloque:
+            salida.write("\n".join(bloque) + "\n")
+            escritas += len(bloque)
+            bloque.clear()
+    if bloque:
+        salida.write("\n".join(bloque) + "\n")
+        escritas += len(bloque)
+    return escritas
+
+
+def formatear_producto(p):
+    # Línea con los datos de un producto, como se muestra en los listados
+    return f"ID: {p.get_id()}, Nombre: {p.get_nombre()}, Cantidad: {p.get_cantidad()}, Precio: {p.get_precio()}"
+
+
 class Producto:
+    # __slots__ evita el __dict__ de cada instancia y reduce la memoria por producto
+    __slots__ = ('_id', '_nombre', '_cantidad', '_precio_centavos')
+
     def __init__(self, id_producto, nombre, cantidad, precio):
         # Constructor que inicializa los atributos del producto
         self._id = id_producto  # ID único del producto
         self._nombre = nombre  # Nombre del producto
         self._cantidad = cantidad  # Cantidad disponible del producto
-        self._precio = precio  # Precio del producto
+        self._precio_centavos = a_centavos(precio)  # Precio del producto en centavos
 
     # Métodos getter para acceder a los atributos
     def get_id(self):
@@ -17,7 +102,10 @@ class Producto:
         return self._cantidad
 
     def get_precio(self):
-        return self._precio
+        return a_monto(self._precio_centavos)
+
+    def get_precio_centavos(self):
+        return self._precio_centavos
 
     # Métodos setter para modificar los atributos
     def set_nombre(self, nombre):
@@ -27,69 +115,439 @@ class Producto:
         self._cantidad = cantidad
 
     def set_precio(self, precio):
-        self._precio = precio
+        self._precio_centavos = a_centavos(precio)
 
 
-class Inventario:
+class AlmacenProductos:
+    """
+    Capa de almacenamiento del inventario.
+    Usa un diccionario indexado por el ID del producto; como los diccionarios
+    conservan el orden de inserción, se mantiene el orden estable de los productos
+    y las operaciones de añadir, buscar por ID y eliminar cuestan O(1).
+    """
+
+    def __init__(self):
+        self._por_id = {}  # Diccionario con el ID como clave y el Producto como valor
+
+    def agregar(self, producto):
+        # Añadir un producto solo si su ID no existe todavía
+        if producto.get_id() in self._por_id:
+            return False
+        self._por_id[producto.get_id()] = producto
+        return True
+
+    def obtener(self, id_producto):
+        # Obtener un producto por su ID (None si no existe)
+        return self._por_id.get(id_producto)
+
+    def eliminar(self, id_producto):
+        # Eliminar un producto por su ID y devolverlo (None si no existe)
+        return self._por_id.pop(id_producto, None)
+
+    def __contains__(self, id_producto):
+        return id_producto in self._por_id
+
+    def __iter__(self):
+        # Recorre los productos en el orden en que fueron añadidos
+        return iter(self._por_id.values())
+
+    def __len__(self):
+        return len(self._por_id)
+
+
+class ProductoColumnar:
+    """
+    Vista de una fila del AlmacenColumnar con la misma API de getters y setters que Producto.
+    No guarda datos propios: lee y escribe directamente en las columnas del almacén.
+    Guarda el ID y no el número de fila, porque la compactación del almacén mueve las filas;
+    usar la vista de un producto ya eliminado lanza KeyError.
+    """
+    __slots__ = ('_almacen', '_id')
+
+    def __init__(self, almacen, id_producto):
+        self._almacen = almacen
+        self._id = id_producto
+
+    def _fila(self):
+        # Fila actual del producto, buscada por ID en cada acceso
+        return self._almacen._fila_por_id[self._id]
+
+    def get_id(self):
+        return self._id
+
+    def get_nombre(self):
+        return self._almacen._nombres[self._fila()]
+
+    def get_cantidad(self):
+        return self._almacen._cantidades[self._fila()]
+
+    def get_precio(self):
+        return a_monto(self._almacen._precios[self._fila()])
+
+    def get_precio_centavos(self):
+        return self._almacen._precios[self._fila()]
+
+    def set_nombre(self, nombre):
+        self._almacen._nombres[self._fila()] = nombre
+
+    def set_cantidad(self, cantidad):
+        self._almacen._cantidades[self._fila()] = cantidad
+
+    def set_precio(self, precio):
+        self._almacen._precios[self._fila()] = a_centavos(precio)
+
+
+class AlmacenColumnar:
+    """
+    Almacenamiento opcional por columnas para catálogos muy grandes.
+    Cada producto ocupa una fila: los IDs y nombres van en listas, y las cantidades
+    y precios (en centavos) en arreglos tipados de enteros de 64 bits, sin crear
+    un objeto por producto. Ofrece la misma interfaz que AlmacenProductos.
+    """
+
     def __init__(self):
-        self._productos = []  # Lista para almacenar los productos
+        self._fila_por_id = {}  # Diccionario con el ID como clave y el número de fila como valor
+        self._ids = []
+        self._nombres = []
+        self._cantidades = array('q')
+        self._precios = array('q')  # Precios en centavos
+
+    def agregar(self, producto):
+        # Copiar los datos del producto en una nueva fila si su ID no existe todavía
+        if producto.get_id() in self._fila_por_id:
+            return False
+        self._fila_por_id[producto.get_id()] = len(self._ids)
+        self._ids.append(producto.get_id())
+        self._nombres.append(producto.get_nombre())
+        self._cantidades.append(producto.get_cantidad())
+        self._precios.append(a_centavos(producto.get_precio()))
+        return True
+
+    def obtener(self, id_producto):
+        # Obtener una vista de la fila del producto (None si no existe)
+        return ProductoColumnar(self, id_producto) if id_producto in self._fila_por_id else None
+
+    def eliminar(self, id_producto):
+        # Marcar la fila como eliminada; las filas se compactan cuando la mitad están vacías
+        fila = self._fila_por_id.pop(id_producto, None)
+        if fila is None:
+            return None
+        eliminado = Producto(id_producto, self._nombres[fila], self._cantidades[fila],
+                             a_monto(self._precios[fila]))
+        self._ids[fila] = None
+        self._nombres[fila] = None
+        if len(self._fila_por_id) * 2 < len(self._ids):
+            self._compactar()
+        return eliminado
+
+    def _compactar(self):
+        # Reconstruir las columnas sin las filas eliminadas, conservando el orden de inserción.
+        # Las vistas ProductoColumnar ya entregadas siguen siendo válidas: buscan su fila por ID
+        filas = [fila for fila, id_producto in enumerate(self._ids) if id_producto is not None]
+        self._ids = [self._ids[fila] for fila in filas]
+        self._nombres = [self._nombres[fila] for fila in filas]
+        self._cantidades = array('q', (self._cantidades[fila] for fila in filas))
+        self._precios = array('q', (self._precios[fila] for fila in filas))
+        self._fila_por_id = {id_producto: fila for fila, id_producto in enumerate(self._ids)}
+
+    def __contains__(self, id_producto):
+        return id_producto in self._fila_por_id
+
+    def __iter__(self):
+        # Recorre las filas vivas en el orden en que fueron añadidas
+        return (ProductoColumnar(self, id_producto) for id_producto in self._ids if id_producto is not None)
+
+    def __len__(self):
+        return len(self._fila_por_id)
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas para buscar subcadenas sin distinguir mayúsculas.
+    Cada trigrama (grupo de tres caracteres consecutivos del nombre en minúsculas)
+    apunta al conjunto de IDs cuyos nombres lo contienen. Se mantiene al añadir,
+    renombrar y eliminar productos.
+    """
+
+    def __init__(self):
+        self._ids_por_trigrama = {}  # Trigrama -> diccionario de IDs (conjunto que conserva el orden)
+
+    @staticmethod
+    def trigramas(texto):
+        # Trigramas distintos del texto en minúsculas
+        texto = texto.lower()
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+    def agregar(self, id_producto, nombre):
+        for trigrama in self.trigramas(nombre):
+            self._ids_por_trigrama.setdefault(trigrama, {})[id_producto] = None
+
+    def eliminar(self, id_producto, nombre):
+        for trigrama in self.trigramas(nombre):
+            ids = self._ids_por_trigrama.get(trigrama)
+            if ids is not None:
+                ids.pop(id_producto, None)
+                if not ids:
+                    del self._ids_por_trigrama[trigrama]
+
+    def candidatos(self, consulta):
+        # IDs cuyos nombres contienen todos los trigramas de la consulta (mínimo 3 caracteres).
+        # Se recorre el conjunto más pequeño y se comprueba en los demás.
+        conjuntos = []
+        for trigrama in self.trigramas(consulta):
+            ids = self._ids_por_trigrama.get(trigrama)
+            if ids is None:
+                return []
+            conjuntos.append(ids)
+        conjuntos.sort(key=len)
+        return [id_producto for id_producto in conjuntos[0]
+                if all(id_producto in ids for ids in conjuntos[1:])]
+
+
+class CandadosPorFranja:
+    """
+    Conjunto fijo de candados repartidos por franjas (lock striping).
+    Cada ID de producto se asigna a una franja según su hash, así las ventas de
+    productos distintos casi nunca compiten por el mismo candado.
+    """
+
+    def __init__(self, franjas=64):
+        self._candados = [threading.Lock() for _ in range(franjas)]
+
+    def de(self, id_producto):
+        # Candado de la franja que corresponde al producto
+        return self._candados[hash(id_producto) % len(self._candados)]
+
+    @contextmanager
+    def varios(self, ids_producto=None):
+        # Toma los candados de varios productos (o todos si ids_producto es None).
+        # Se toman siempre en el mismo orden para evitar bloqueos mutuos.
+        if ids_producto is None:
+            franjas = range(len(self._candados))
+        else:
+            franjas = sorted({hash(id_producto) % len(self._candados) for id_producto in ids_producto})
+        for franja in franjas:
+            self._candados[franja].acquire()
+        try:
+            yield
+        finally:
+            for franja in reversed(franjas):
+                self._candados[franja].release()
+
+
+class ResumenStock:
+    """
+    Totales del inventario que se actualizan con cada cambio de un producto: unidades,
+    valor en centavos, productos por tramo de precio y productos bajo el umbral de
+    reposición, para consultarlos sin recorrer todo el inventario.
+    """
+    TRAMOS_PRECIO = (1000, 5000, 10000, 50000)  # Límites de los tramos de precio, en centavos
+
+    def __init__(self, umbral_reposicion=5):
+        self.umbral_reposicion = umbral_reposicion  # Con menos unidades, el producto está bajo stock
+        self.total_unidades = 0
+        self.total_centavos = 0
+        self._por_tramo = [0] * (len(self.TRAMOS_PRECIO) + 1)
+        self._bajo_stock = []  # Lista ordenada de (cantidad, id) de los productos bajo el umbral
+        self._candado = threading.Lock()  # Las ventas de distintas franjas actualizan los mismos totales
+
+    @staticmethod
+    def estado(producto):
+        # Valores del producto que intervienen en los totales
+        return producto.get_id(), producto.get_cantidad(), producto.get_precio_centavos()
+
+    def actualizar(self, anterior=None, nuevo=None):
+        # Quita el estado anterior de un producto y suma el nuevo (None al añadir o al eliminar)
+        with self._candado:
+            if anterior is not None:
+                self._aplicar(anterior, -1)
+            if nuevo is not None:
+                self._aplicar(nuevo, 1)
+
+    def _aplicar(self, estado, signo):
+        id_producto, cantidad, precio_centavos = estado
+        self.total_unidades += signo * cantidad
+        self.total_centavos += signo * cantidad * precio_centavos
+        self._por_tramo[bisect.bisect_right(self.TRAMOS_PRECIO, precio_centavos)] += signo
+        if cantidad < self.umbral_reposicion:
+            if signo > 0:
+                bisect.insort(self._bajo_stock, (cantidad, id_producto))
+            else:
+                del self._bajo_stock[bisect.bisect_left(self._bajo_stock, (cantidad, id_producto))]
+
+    def productos_por_tramo(self):
+        # Cantidad de productos en cada tramo de precio, por ejemplo {"10.00-50.00": 3, ...}
+        limites = (0,) + self.TRAMOS_PRECIO
+        conteo = {}
+        for i, cantidad in enumerate(self._por_tramo):
+            if i < len(self.TRAMOS_PRECIO):
+                conteo[f"{a_monto(limites[i]):.2f}-{a_monto(limites[i + 1]):.2f}"] = cantidad
+            else:
+                conteo[f"{a_monto(limites[i]):.2f}+"] = cantidad
+        return conteo
+
+    def bajo_stock(self, limite=None):
+        # (id, cantidad) de los productos bajo el umbral, de menos a más unidades
+        with self._candado:
+            seleccion = self._bajo_stock if limite is None else self._bajo_stock[:limite]
+            return [(id_producto, cantidad) for cantidad, id_producto in seleccion]
+
+
+class Inventario:
+    def __init__(self, almacen=None, concurrente=False, umbral_reposicion=5):
+        # Almacén indexado por ID; se puede pasar un AlmacenColumnar para catálogos grandes
+        self._productos = almacen if almacen is not None else AlmacenProductos()
+        self._indice_nombres = IndiceTrigramas()  # Índice de trigramas para buscar por nombre
+        self._resumen = ResumenStock(umbral_reposicion)  # Totales que se mantienen con cada cambio
+        for p in self._productos:
+            self._indice_nombres.agregar(p.get_id(), p.get_nombre())
+            self._resumen.actualizar(nuevo=ResumenStock.estado(p))
+        # Con concurrente=True varias cajas (hilos) pueden compartir el inventario:
+        # ventas y actualizaciones toman el candado de la franja del producto, y las operaciones
+        # que cambian la estructura (añadir, eliminar, renombrar, buscar, listar) toman todos.
+        self._candados = CandadosPorFranja() if concurrente else None
+
+    def _candado(self, id_producto):
+        # Candado para operar sobre un solo producto (sin efecto si no es concurrente)
+        return self._candados.de(id_producto) if self._candados else nullcontext()
+
+    def _candado_global(self):
+        # Candado exclusivo sobre todo el inventario (sin efecto si no es concurrente)
+        return self._candados.varios() if self._candados else nullcontext()
 
     def anadir_producto(self, producto):
         # Añadir un nuevo producto asegurándose de que el ID sea único
-        if not any(p.get_id() == producto.get_id() for p in self._productos):
-            self._productos.append(producto)
+        with self._candado_global():
+            if not self._productos.agregar(producto):
+                return False
+            self._indice_nombres.agregar(producto.get_id(), producto.get_nombre())
+            self._resumen.actualizar(nuevo=ResumenStock.estado(producto))
             return True
-        return False
 
     def eliminar_producto(self, id_producto):
         # Eliminar un producto por su ID
-        self._productos = [p for p in self._productos if p.get_id() != id_producto]
+        with self._candado_global():
+            p = self._productos.eliminar(id_producto)
+            if p is not None:
+                self._indice_nombres.eliminar(id_producto, p.get_nombre())
+                self._resumen.actualizar(anterior=ResumenStock.estado(p))
 
-    def actualizar_producto(self, id_producto, cantidad=None, precio=None):
-        # Actualizar la cantidad o el precio de un producto por su ID
-        for p in self._productos:
-            if p.get_id() == id_producto:
-                if cantidad is not None:
-                    p.set_cantidad(cantidad)
-                if precio is not None:
-                    p.set_precio(precio)
-                return True
-        return False
+    def actualizar_producto(self, id_producto, cantidad=None, precio=None, nombre=None):
+        # Actualizar la cantidad, el precio o el nombre de un producto por su ID.
+        # Renombrar modifica el índice compartido, por eso toma el candado global.
+        with self._candado_global() if nombre is not None else self._candado(id_producto):
+            p = self._productos.obtener(id_producto)
+            if p is None:
+                return False
+            anterior = ResumenStock.estado(p)
+            if nombre is not None:
+                # Renombrar: el índice de búsqueda se actualiza con el nombre nuevo
+                self._indice_nombres.eliminar(id_producto, p.get_nombre())
+                p.set_nombre(nombre)
+                self._indice_nombres.agregar(id_producto, nombre)
+            if cantidad is not None:
+                p.set_cantidad(cantidad)
+            if precio is not None:
+                p.set_precio(precio)
+            self._resumen.actualizar(anterior, ResumenStock.estado(p))
+            return True
 
     def buscar_productos(self, nombre):
         # Buscar productos por nombre (puede haber nombres similares)
-        return [p for p in self._productos if nombre.lower() in p.get_nombre().lower()]
+        consulta = nombre.lower()
+        with self._candado_global():
+            if len(consulta) < 3:
+                # Consultas cortas no tienen trigramas: se recorre todo el inventario
+                return [p for p in self._productos if consulta in p.get_nombre().lower()]
+            # Los candidatos del índice contienen todos los trigramas; se confirma la subcadena completa
+            candidatos = (self._productos.obtener(id_producto)
+                          for id_producto in self._indice_nombres.candidatos(consulta))
+            return [p for p in candidatos if consulta in p.get_nombre().lower()]
 
-    def mostrar_productos(self):
-        # Mostrar todos los productos en el inventario
-        for p in self._productos:
-            print(f"ID: {p.get_id()}, Nombre: {p.get_nombre()}, Cantidad: {p.get_cantidad()}, Precio: {p.get_precio()}")
+    def listar_productos(self, orden=None, cursor=None):
+        # Generador de productos en el orden indicado ('id', 'nombre', 'cantidad' o 'precio';
+        # None = orden del almacén), a partir del cursor devuelto por pagina_productos.
+        # Se recorre una copia de las referencias para no bloquear el inventario mientras se consume.
+        with self._candado_global():
+            productos = list(self._productos)
+        if orden is not None or cursor is not None:
+            clave = clave_orden(orden or 'id')
+            if cursor is not None:
+                productos = [p for p in productos if clave(p) > cursor]
+            productos.sort(key=clave)
+        yield from productos
+
+    def pagina_productos(self, tamano=50, cursor=None, orden='id'):
+        # Una página de `tamano` productos y el cursor para pedir la siguiente (None si es la última).
+        # El cursor es la clave del último producto, así la paginación sigue siendo correcta
+        # aunque entre una página y otra se añadan o eliminen productos.
+        with self._candado_global():
+            return paginar(self._productos, clave_orden(orden), tamano, cursor)
+
+    def mostrar_productos(self, orden=None, salida=None):
+        # Mostrar todos los productos en el inventario, escribiendo las líneas en bloques
+        if not escribir_en_bloques(map(formatear_producto, self.listar_productos(orden)), salida):
+            print("El inventario está vacío.", file=salida)
 
     def vender_producto(self, id_producto, cantidad):
-        # Vender un producto y actualizar la cantidad en el inventario
-        for p in self._productos:
-            if p.get_id() == id_producto:
-                if p.get_cantidad() >= cantidad:
-                    p.set_cantidad(p.get_cantidad() - cantidad)
-                    return p.get_precio() * cantidad  # Retorna el total de la venta
-                else:
-                    print("Error: Cantidad insuficiente en el inventario.")
-                    return 0
-        print("Error: Producto no encontrado.")
+        # Vender un producto y actualizar la cantidad en el inventario.
+        # La comprobación de stock y el descuento se hacen bajo el mismo candado,
+        # así dos cajas no pueden vender la misma unidad.
+        with self._candado(id_producto):
+            p = self._productos.obtener(id_producto)
+            if p is None:
+                print("Error: Producto no encontrado.")
+                return 0
+            if p.get_cantidad() >= cantidad:
+                anterior = ResumenStock.estado(p)
+                p.set_cantidad(p.get_cantidad() - cantidad)
+                self._resumen.actualizar(anterior, ResumenStock.estado(p))
+                # Retorna el total de la venta, calculado en centavos para que sea exacto
+                return a_monto(p.get_precio_centavos() * cantidad)
+        print("Error: Cantidad insuficiente en el inventario.")
         return 0
 
+    # Consultas sobre los totales mantenidos por ResumenStock: no recorren el inventario
+    def total_unidades(self):
+        return self._resumen.total_unidades
+
+    def valor_total(self):
+        return a_monto(self._resumen.total_centavos)
+
+    def productos_por_tramo_precio(self):
+        return self._resumen.productos_por_tramo()
+
+    def productos_bajo_stock(self, limite=None):
+        # (id, cantidad) de los productos bajo el umbral de reposición, de menos a más unidades
+        return self._resumen.bajo_stock(limite)
+
 
 class Caja:
     def __init__(self):
-        self._dinero = 0.0  # Inicializar el dinero en caja
+        self._centavos = 0  # Inicializar el dinero en caja (en centavos)
+        self._candado = threading.Lock()  # Protege el dinero cuando varias cajas comparten esta instancia
 
     def agregar_dinero(self, cantidad):
-        # Agregar dinero a la caja
-        self._dinero += cantidad
+        # Agregar dinero a la caja (la suma se hace de forma atómica y exacta en centavos)
+        centavos = a_centavos(cantidad)
+        with self._candado:
+            self._centavos += centavos
+
+    def agregar_lote(self, montos):
+        # Agregar varios montos de una vez: se suman como enteros y la caja se bloquea una sola vez
+        centavos = sum(map(a_centavos, montos))
+        with self._candado:
+            self._centavos += centavos
+
+    def get_dinero(self):
+        return a_monto(self._centavos)
+
+    def get_centavos(self):
+        return self._centavos
 
     def mostrar_dinero(self):
         # Mostrar el dinero en caja
-        print(f"Dinero en caja: {self._dinero}")
+        print(f"Dinero en caja: {a_monto(self._centavos):.2f}")
 
 
 def menu():
@@ -142,9 +600,7 @@ def menu():
             productos = inventario.buscar_productos(nombre)
             if productos:
                 print("Productos encontrados:")
-                for p in productos:
-                    print(
-                        f"ID: {p.get_id()}, Nombre: {p.get_nombre()}, Cantidad: {p.get_cantidad()}, Precio: {p.get_precio()}")
+                escribir_en_bloques(map(formatear_producto, productos))
             else:
                 print("No se encontraron productos con ese nombre.")
         elif opcion == '5':
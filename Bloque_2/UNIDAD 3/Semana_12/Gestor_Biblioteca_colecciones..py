@@ -1,57 +1,477 @@
+import bisect
+import gc
+import heapq
 import json
 import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Libro:
     """
     Clase que representa un libro en la biblioteca digital.
-    Utiliza tuplas para almacenar autor y título ya que son inmutables.
+    Título y autor son inmutables: se exponen como propiedades de solo lectura.
+    Para ocupar poca memoria con catálogos grandes, usa __slots__ (sin __dict__ por instancia)
+    y guarda autor y categoría internados: todos los libros de un mismo autor o categoría
+    comparten una sola cadena en lugar de una copia cada uno (json.load crea una por registro).
     """
 
+    __slots__ = ("_titulo", "_autor", "categoria", "isbn", "disponible")
+
     def __init__(self, titulo, autor, categoria, isbn):
-        self.datos = (titulo, autor)  # Tupla inmutable para título y autor
-        self.categoria = categoria
+        self._titulo = titulo
+        self._autor = sys.intern(autor)
+        self.categoria = sys.intern(categoria)
         self.isbn = isbn
         self.disponible = True
 
     @property
     def titulo(self):
-        return self.datos[0]
+        return self._titulo
 
     @property
     def autor(self):
-        return self.datos[1]
+        return self._autor
+
+    @property
+    def datos(self):
+        """Tupla (título, autor), como se guardaban antes."""
+        return (self._titulo, self._autor)
 
     def __str__(self):
         estado = "Disponible" if self.disponible else "Prestado"
         return f"Libro: {self.titulo} | Autor: {self.autor} | Categoría: {self.categoria} | ISBN: {self.isbn} | Estado: {estado}"
 
 
+# Criterios de orden para recorrer y paginar el catálogo de libros
+CLAVES_ORDEN_LIBRO = {
+    "isbn": lambda libro: libro.isbn,
+    "titulo": lambda libro: libro.titulo,
+    "autor": lambda libro: libro.autor,
+    "categoria": lambda libro: libro.categoria,
+}
+
+
+def clave_orden_libro(orden):
+    """Clave (valor, isbn) para ordenar por `orden`; el ISBN desempata y hace de cursor de paginación."""
+    try:
+        obtener = CLAVES_ORDEN_LIBRO[orden]
+    except KeyError:
+        raise ValueError(f"Orden no válido: {orden}. Opciones: {', '.join(CLAVES_ORDEN_LIBRO)}") from None
+    return lambda libro: (obtener(libro), libro.isbn)
+
+
+def paginar(elementos, clave, tamano, cursor=None):
+    """
+    Devuelve los `tamano` primeros elementos en el orden de `clave` que van después de `cursor`,
+    junto con el cursor de la página siguiente (None si no quedan más).
+    Usa un montículo de `tamano` elementos en lugar de ordenar todo el catálogo.
+    """
+    if cursor is not None:
+        elementos = (e for e in elementos if clave(e) > cursor)
+    pagina = heapq.nsmallest(tamano + 1, elementos, key=clave)
+    if len(pagina) > tamano:
+        return pagina[:tamano], clave(pagina[tamano - 1])
+    return pagina, None
+
+
+def escribir_en_bloques(lineas, salida=None, lineas_por_bloque=1000):
+    """
+    Escribe las líneas en `salida` (la consola por defecto) juntando `lineas_por_bloque`
+    líneas en cada escritura, en lugar de hacer un print por línea.
+    Devuelve la cantidad de líneas escritas.
+    """
+    salida = salida if salida is not None else sys.stdout
+    escritas = 0
+    bloque = []
+    for linea in lineas:
+        bloque.append(linea)
+        if len(bloque) == lineas_por_bloque:
+            salida.write("\n".join(bloque) + "\n")
+            escritas += len(bloque)
+            bloque.clear()
+    if bloque:
+        salida.write("\n".join(bloque) + "\n")
+        escritas += len(bloque)
+    return escritas
+
+
+def escribir_json_atomico(ruta, datos):
+    """
+    Escribe `datos` como JSON en `ruta` sin riesgo de dejar el archivo truncado:
+    escribe en un archivo temporal, lo sincroniza y lo renombra sobre `ruta`.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def normalizar(texto):
+    """Texto en minúsculas y sin tildes, para comparar sin distinguir mayúsculas ni acentos."""
+    texto = texto.strip().lower()
+    if texto.isascii():
+        return texto
+    texto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in texto if not unicodedata.combining(c))
+
+
+def mascaras_caracteres(palabra):
+    """Para cada carácter de la palabra, un entero con un bit encendido en cada posición donde aparece."""
+    mascaras = {}
+    for posicion, caracter in enumerate(palabra):
+        mascaras[caracter] = mascaras.get(caracter, 0) | (1 << posicion)
+    return mascaras
+
+
+def distancia_edicion(palabra, otra, mascaras=None):
+    """
+    Distancia de Levenshtein entre palabra y otra, con el algoritmo de vectores de bits de
+    Myers: cada columna de la tabla de distancias se calcula con unas pocas operaciones sobre
+    enteros en lugar de celda por celda. Las máscaras de `palabra` se pueden calcular una vez
+    con mascaras_caracteres y reutilizar para compararla con muchas otras.
+    """
+    largo = len(palabra)
+    if not largo:
+        return len(otra)
+    if mascaras is None:
+        mascaras = mascaras_caracteres(palabra)
+    todos = (1 << largo) - 1
+    ultimo = 1 << (largo - 1)
+    positivos = todos  # Bits donde la distancia sube respecto de la fila anterior
+    negativos = 0  # Bits donde la distancia baja respecto de la fila anterior
+    distancia = largo
+    for caracter in otra:
+        iguales = mascaras.get(caracter, 0)
+        vertical = iguales | negativos
+        horizontal = (((iguales & positivos) + positivos) ^ positivos) | iguales
+        sube = negativos | (~(horizontal | positivos) & todos)
+        baja = positivos & horizontal
+        if sube & ultimo:
+            distancia += 1
+        elif baja & ultimo:
+            distancia -= 1
+        sube = ((sube << 1) | 1) & todos
+        baja = (baja << 1) & todos
+        positivos = baja | (~(vertical | sube) & todos)
+        negativos = sube & vertical
+    return distancia
+
+
+class IndiceTrigramas:
+    """
+    Índice de trigramas sobre las palabras distintas de un IndiceTexto, para encontrar las
+    parecidas a una palabra mal escrita. Cada edición cambia como mucho tres trigramas, así que
+    una palabra a distancia d comparte al menos (trigramas de la consulta - 3*d) con ella:
+    la distancia exacta solo se calcula para las palabras que pasan ese filtro.
+    """
+
+    def __init__(self):
+        self._palabras_por_trigrama = {}  # Trigrama -> conjunto de palabras
+
+    @staticmethod
+    def trigramas(palabra):
+        marcada = f"${palabra}$"
+        return {marcada[i:i + 3] for i in range(len(marcada) - 2)}
+
+    def agregar(self, palabra):
+        for trigrama in self.trigramas(palabra):
+            palabras = self._palabras_por_trigrama.get(trigrama)
+            if palabras is None:
+                palabras = self._palabras_por_trigrama[trigrama] = set()
+            palabras.add(palabra)
+
+    def eliminar(self, palabra):
+        for trigrama in self.trigramas(palabra):
+            palabras = self._palabras_por_trigrama.get(trigrama)
+            if palabras is not None:
+                palabras.discard(palabra)
+                if not palabras:
+                    del self._palabras_por_trigrama[trigrama]
+
+    def con_fragmento(self, fragmento):
+        """
+        Palabras que tienen todos los trigramas de `fragmento` (sin las marcas de comienzo y fin),
+        candidatas a contenerlo; None si el fragmento tiene menos de tres letras.
+        """
+        trigramas = {fragmento[i:i + 3] for i in range(len(fragmento) - 2)}
+        if not trigramas:
+            return None
+        conjuntos = sorted((self._palabras_por_trigrama.get(trigrama, set()) for trigrama in trigramas), key=len)
+        return conjuntos[0].intersection(*conjuntos[1:])
+
+    def parecidas(self, palabra, distancia_maxima):
+        """Pares (palabra, distancia) del vocabulario a distancia de edición <= distancia_maxima."""
+        trigramas = self.trigramas(palabra)
+        minimo = max(1, len(trigramas) - 3 * distancia_maxima)
+        conteo = Counter()
+        for trigrama in trigramas:
+            conteo.update(self._palabras_por_trigrama.get(trigrama, ()))
+        mascaras = mascaras_caracteres(palabra)
+        parecidas = []
+        for candidata, comunes in conteo.items():
+            if comunes >= minimo and abs(len(candidata) - len(palabra)) <= distancia_maxima:
+                distancia = distancia_edicion(palabra, candidata, mascaras)
+                if distancia <= distancia_maxima:
+                    parecidas.append((candidata, distancia))
+        return parecidas
+
+
+class PuntajesPalabra:
+    """
+    Mejor puntaje de cada libro para una palabra de la búsqueda aproximada, a partir de sus
+    palabras candidatas ordenadas de mayor a menor puntaje. Empieza consultando las candidatas
+    libro por libro; si esas consultas llegan a costar más que juntar los libros de todas,
+    los junta una vez en un diccionario ISBN -> puntaje y sigue con él.
+    """
+
+    def __init__(self, candidatas, libros_por_palabra):
+        self.candidatas = [(libros_por_palabra[palabra], puntaje) for palabra, puntaje in candidatas]
+        self.maximo = candidatas[0][1]
+        self._costo_union = sum(len(libros) for libros, _ in self.candidatas)
+        self._consultas = 0
+        self._union = None
+
+    def puntaje(self, isbn):
+        """Puntaje de la mejor candidata que tiene el libro, o None si no tiene ninguna."""
+        if self._union is not None:
+            return self._union.get(isbn)
+        self._consultas += len(self.candidatas)
+        if self._consultas > self._costo_union:
+            self._union = {}
+            for libros, puntaje in reversed(self.candidatas):  # Las mejores se escriben al final
+                self._union.update(dict.fromkeys(libros, puntaje))
+            return self._union.get(isbn)
+        for libros, puntaje in self.candidatas:
+            if isbn in libros:
+                return puntaje
+        return None
+
+
+class IndiceTexto:
+    """
+    Índice invertido de palabras normalizadas a libros, usado para buscar por título y por autor.
+    Cada palabra apunta a un diccionario ISBN -> Libro, así los resultados salen del índice
+    sin volver a buscar cada libro. Las palabras distintas se guardan también en una lista
+    ordenada: las que empiezan con un prefijo forman un rango que se encuentra con búsqueda binaria,
+    y en un índice de trigramas para la búsqueda aproximada y la búsqueda dentro de las palabras.
+    """
+
+    PATRON_PALABRA = re.compile(r"\w+")
+    LIMITE_PREFIJOS = 64  # Palabras más cortas que se consideran para un prefijo en la búsqueda aproximada
+    LIMITE_CANDIDATOS = 50_000  # Libros examinados como máximo por búsqueda aproximada
+
+    def __init__(self):
+        self._libros_por_palabra = {}  # Palabra -> diccionario ISBN -> Libro (conserva el orden)
+        self._palabras_ordenadas = []
+        self._ordenadas_al_dia = True  # False cuando se añadió o eliminó una palabra distinta
+        self.trigramas = IndiceTrigramas()
+        self._coincidencias_recientes = {}  # Palabra buscada -> coincidencias, mientras no cambie el vocabulario
+
+    @classmethod
+    def palabras(cls, texto):
+        """Palabras distintas del texto normalizado."""
+        return set(cls.PATRON_PALABRA.findall(normalizar(texto)))
+
+    def agregar(self, libro, texto):
+        for palabra in self.palabras(texto):
+            libros = self._libros_por_palabra.get(palabra)
+            if libros is None:
+                libros = self._libros_por_palabra[palabra] = {}
+                self._ordenadas_al_dia = False
+                self.trigramas.agregar(palabra)
+            libros[libro.isbn] = libro
+
+    def agregar_lote(self, pares, palabras_por_texto=None):
+        """
+        Añade muchos pares (libro, texto) de una vez. Si se pasa `palabras_por_texto`, se usa
+        como caché: los textos repetidos (autores, por ejemplo) se normalizan una sola vez.
+        """
+        libros_por_palabra = self._libros_por_palabra
+        for libro, texto in pares:
+            if palabras_por_texto is None:
+                palabras = self.palabras(texto)
+            else:
+                palabras = palabras_por_texto.get(texto)
+                if palabras is None:
+                    palabras = palabras_por_texto[texto] = self.palabras(texto)
+            for palabra in palabras:
+                libros = libros_por_palabra.get(palabra)
+                if libros is None:
+                    libros = libros_por_palabra[palabra] = {}
+                    self.trigramas.agregar(palabra)
+                libros[libro.isbn] = libro
+        self._ordenadas_al_dia = False
+
+    def eliminar(self, libro, texto):
+        for palabra in self.palabras(texto):
+            libros = self._libros_por_palabra.get(palabra)
+            if libros is not None:
+                libros.pop(libro.isbn, None)
+                if not libros:
+                    del self._libros_por_palabra[palabra]
+                    self._ordenadas_al_dia = False
+                    self.trigramas.eliminar(palabra)
+
+    def _rango_prefijo(self, prefijo):
+        """Palabras del índice que empiezan con `prefijo`, en orden alfabético."""
+        if not self._ordenadas_al_dia:
+            # La lista se reordena solo cuando se consulta después de cambios en el vocabulario
+            self._palabras_ordenadas = sorted(self._libros_por_palabra)
+            self._ordenadas_al_dia = True
+        inicio = bisect.bisect_left(self._palabras_ordenadas, prefijo)
+        fin = bisect.bisect_left(self._palabras_ordenadas, prefijo + "\U0010ffff")
+        return self._palabras_ordenadas[inicio:fin]
+
+    def _contienen(self, fragmento):
+        """Palabras del índice que contienen `fragmento` en cualquier posición, en orden alfabético."""
+        candidatas = self.trigramas.con_fragmento(fragmento)
+        if candidatas is None:
+            # Con menos de tres letras no hay trigramas que filtren: se recorre el vocabulario
+            candidatas = self._libros_por_palabra
+        return sorted(palabra for palabra in candidatas if fragmento in palabra)
+
+    def _con_palabra(self, palabra):
+        """
+        Libros (ISBN -> Libro) que tienen alguna palabra que empieza con `palabra`; si ninguna
+        empieza así, los que tienen alguna que la contiene ("jote" encuentra "Quijote").
+        """
+        rango = self._rango_prefijo(palabra) or self._contienen(palabra)
+        if len(rango) == 1:
+            return self._libros_por_palabra[rango[0]]
+        libros = {}
+        for palabra in rango:
+            libros.update(self._libros_por_palabra[palabra])
+        return libros
+
+    def buscar(self, consulta):
+        """
+        Libros en los que cada palabra de la consulta es el comienzo de alguna palabra del texto,
+        en cualquier orden ("garc gab" encuentra "Gabriel García Márquez"). Una palabra que no es
+        el comienzo de ninguna se busca dentro de las palabras, con el índice de trigramas.
+        """
+        conjuntos = [self._con_palabra(palabra) for palabra in self.palabras(consulta)]
+        if not conjuntos:
+            return []
+        conjuntos.sort(key=len)
+        if len(conjuntos) == 1:
+            return list(conjuntos[0].values())
+        # La intersección de claves se hace en C; luego se conserva el orden del conjunto más pequeño
+        comunes = conjuntos[0].keys() & conjuntos[1].keys()
+        for libros in conjuntos[2:]:
+            comunes &= libros.keys()
+        return [libro for isbn, libro in conjuntos[0].items() if isbn in comunes]
+
+    @staticmethod
+    def distancia_permitida(palabra):
+        """Errores de escritura tolerados según el largo de la palabra buscada."""
+        if len(palabra) <= 3:
+            return 0
+        return 1 if len(palabra) <= 7 else 2
+
+    def _coincidencias(self, palabra):
+        """
+        Palabras del índice que coinciden con una palabra buscada, con su puntaje:
+        1 si es la misma, entre 0.5 y 1 si la completa (más alto cuanto menos le falta),
+        y 1 - distancia/largo si está mal escrita.
+        """
+        if not self._ordenadas_al_dia or len(self._coincidencias_recientes) > 1024:
+            self._coincidencias_recientes.clear()
+        coincidencias = self._coincidencias_recientes.get(palabra)
+        if coincidencias is not None:
+            # Al buscar en cada pulsación de tecla, las palabras ya escritas se repiten
+            return coincidencias
+        rango = self._rango_prefijo(palabra)
+        if len(rango) > self.LIMITE_PREFIJOS:
+            rango = heapq.nsmallest(self.LIMITE_PREFIJOS, rango, key=len)
+        coincidencias = {candidata: 0.5 + 0.5 * len(palabra) / len(candidata) for candidata in rango}
+        distancia_maxima = self.distancia_permitida(palabra)
+        if distancia_maxima:
+            for candidata, distancia in self.trigramas.parecidas(palabra, distancia_maxima):
+                puntaje = 1 - distancia / len(palabra)
+                if puntaje > coincidencias.get(candidata, 0):
+                    coincidencias[candidata] = puntaje
+        self._coincidencias_recientes[palabra] = coincidencias
+        return coincidencias
+
+    def buscar_difuso(self, consulta, k=10):
+        """
+        Búsqueda tolerante a errores de escritura: devuelve hasta k pares (puntaje, libro),
+        del mayor al menor puntaje. Cada palabra de la consulta debe coincidir (exacta, como
+        comienzo o con pocos errores) con alguna palabra del libro; el puntaje es el promedio.
+        Los libros se recorren desde la palabra con menos candidatos y de la mejor coincidencia
+        a la peor, y el recorrido termina cuando ningún libro restante puede entrar entre los k mejores.
+        """
+        palabras = self.palabras(consulta)
+        coincidencias = [self._coincidencias(palabra) for palabra in palabras]
+        if not coincidencias or not all(coincidencias):
+            return []
+        libros_por_palabra = self._libros_por_palabra
+        coincidencias = sorted(coincidencias, key=lambda c: sum(len(libros_por_palabra[palabra]) for palabra in c))
+        guia = sorted(coincidencias[0].items(), key=lambda par: -par[1])
+        resto = [PuntajesPalabra(sorted(c.items(), key=lambda par: -par[1]), libros_por_palabra)
+                 for c in coincidencias[1:]]
+        maximo_resto = sum(palabra.maximo for palabra in resto)
+
+        mejores = []  # Montículo de (puntaje, -orden, libro) con los k mejores encontrados
+        vistos = set()
+        for palabra, puntaje in guia:
+            cota = puntaje + maximo_resto  # Mejor puntaje posible desde esta palabra en adelante
+            if len(mejores) == k and mejores[0][0] >= cota:
+                break
+            for isbn, libro in libros_por_palabra[palabra].items():
+                if isbn in vistos:
+                    continue
+                vistos.add(isbn)
+                total = puntaje
+                for palabra_resto in resto:
+                    puntaje_resto = palabra_resto.puntaje(isbn)
+                    if puntaje_resto is None:
+                        total = None
+                        break
+                    total += puntaje_resto
+                if total is not None:
+                    entrada = (total, -len(vistos), libro)
+                    if len(mejores) < k:
+                        heapq.heappush(mejores, entrada)
+                    elif total > mejores[0][0]:
+                        heapq.heapreplace(mejores, entrada)
+                if len(vistos) >= self.LIMITE_CANDIDATOS or (len(mejores) == k and mejores[0][0] >= cota):
+                    break
+            if len(vistos) >= self.LIMITE_CANDIDATOS:
+                break
+        return [(total / len(palabras), libro) for total, _, libro in sorted(mejores, reverse=True)]
+
+
 class Usuario:
     """
     Clase que representa a un usuario de la biblioteca digital.
-    Mantiene un registro de los libros actualmente prestados al usuario.
+    Mantiene un registro de los libros actualmente prestados al usuario,
+    indexado por ISBN para prestar y devolver en tiempo constante.
     """
 
     def __init__(self, nombre, id_usuario):
         self.nombre = nombre
         self.id_usuario = id_usuario
-        self.libros_prestados = []  # Lista para almacenar los libros prestados
+        self.libros_prestados = {}  # Diccionario con ISBN como clave y el Libro prestado como valor
 
     def prestar_libro(self, libro):
-        """Añade un libro a la lista de libros prestados del usuario."""
-        self.libros_prestados.append(libro)
+        """Añade un libro a los libros prestados del usuario."""
+        self.libros_prestados[libro.isbn] = libro
 
     def devolver_libro(self, isbn):
-        """Elimina un libro de la lista de libros prestados del usuario."""
-        for i, libro in enumerate(self.libros_prestados):
-            if libro.isbn == isbn:
-                return self.libros_prestados.pop(i)
-        return None
+        """Quita un libro de los libros prestados del usuario y lo devuelve (None si no lo tenía)."""
+        return self.libros_prestados.pop(isbn, None)
 
     def listar_libros_prestados(self):
         """Devuelve una lista de los libros prestados al usuario."""
-        return self.libros_prestados
+        return list(self.libros_prestados.values())
 
     def __str__(self):
         return f"Usuario: {self.nombre} | ID: {self.id_usuario} | Libros prestados: {len(self.libros_prestados)}"
@@ -61,17 +481,40 @@ class Biblioteca:
     """
     Clase principal que gestiona la biblioteca digital.
     Utiliza estructuras de datos eficientes: diccionarios para libros y conjunto para IDs de usuario.
-    Implementa persistencia de datos con archivos JSON.
+    Mantiene índices secundarios por título, autor y categoría para que las búsquedas
+    no recorran todo el catálogo.
+    Implementa persistencia de datos con archivos JSON: un snapshot de libros y otro de
+    usuarios, más un diario donde cada guardado añade solo los registros modificados.
     """
 
+    UMBRAL_COMPACTACION = 1000  # Registros del diario antes de reescribir los snapshots
+    TAMANO_BLOQUE_CARGA = 10_000  # Libros construidos e indexados por bloque al cargar
+
     def __init__(self, cargar_datos=True):
         self.libros = {}  # Diccionario con ISBN como clave y objeto Libro como valor
         self.usuarios = {}  # Diccionario con ID como clave y objeto Usuario como valor
         self.ids_usuario = set()  # Conjunto para asegurar IDs de usuario únicos
+        # Índice inverso de préstamos: ISBN -> (ID del usuario, fecha del préstamo).
+        # Se inserta en orden de fecha, así el diccionario va del préstamo más antiguo al más reciente.
+        self.prestamos = {}
+        self._ultima_fecha_prestamo = 0.0
+        self.reservas = {}  # ISBN -> cola (deque) de IDs de usuario que esperan el libro, en orden de llegada
+
+        # Índices secundarios, actualizados al añadir, quitar y cargar libros
+        self.indice_titulos = IndiceTexto()
+        self.indice_autores = IndiceTexto()
+        self.indice_categorias = {}  # Categoría normalizada -> diccionario ISBN -> Libro
 
         # Archivos para persistencia de datos
         self.archivo_libros = "libros.json"
         self.archivo_usuarios = "usuarios.json"
+        self.archivo_diario = "biblioteca.log"
+        self._registros_diario = 0
+
+        # Seguimiento de cambios: claves de los libros y usuarios modificados desde el último guardado
+        self._libros_modificados = set()
+        self._usuarios_modificados = set()
+        self.tiempos_carga = {}  # Segundos de cada fase de la última carga
 
         # Cargar datos si existen y se solicita
         if cargar_datos:
@@ -82,21 +525,52 @@ class Biblioteca:
         if libro.isbn in self.libros:
             return False
         self.libros[libro.isbn] = libro
+        self._indexar_libro(libro)
+        self._libros_modificados.add(libro.isbn)
         return True
 
     def quitar_libro(self, isbn):
         """Elimina un libro de la biblioteca por su ISBN."""
         if isbn in self.libros and self.libros[isbn].disponible:
-            del self.libros[isbn]
+            self._desindexar_libro(self.libros.pop(isbn))
+            self._libros_modificados.add(isbn)
             return True
         return False
 
+    def _indexar_libro(self, libro):
+        """Añade el libro a los índices de título, autor y categoría."""
+        self.indice_titulos.agregar(libro, libro.titulo)
+        self.indice_autores.agregar(libro, libro.autor)
+        self.indice_categorias.setdefault(normalizar(libro.categoria), {})[libro.isbn] = libro
+
+    def _indexar_lote(self, libros, palabras_por_autor, categorias_normalizadas):
+        """Añade un bloque de libros a los índices; autores y categorías repetidos se normalizan una vez."""
+        self.indice_titulos.agregar_lote((libro, libro.titulo) for libro in libros)
+        self.indice_autores.agregar_lote(((libro, libro.autor) for libro in libros), palabras_por_autor)
+        for libro in libros:
+            categoria = categorias_normalizadas.get(libro.categoria)
+            if categoria is None:
+                categoria = categorias_normalizadas[libro.categoria] = normalizar(libro.categoria)
+            self.indice_categorias.setdefault(categoria, {})[libro.isbn] = libro
+
+    def _desindexar_libro(self, libro):
+        """Quita el libro de los índices de título, autor y categoría."""
+        self.indice_titulos.eliminar(libro, libro.titulo)
+        self.indice_autores.eliminar(libro, libro.autor)
+        categoria = normalizar(libro.categoria)
+        libros = self.indice_categorias.get(categoria)
+        if libros is not None:
+            libros.pop(libro.isbn, None)
+            if not libros:
+                del self.indice_categorias[categoria]
+
     def registrar_usuario(self, usuario):
         """Registra un nuevo usuario en la biblioteca."""
         if usuario.id_usuario in self.ids_usuario:
             return False
         self.ids_usuario.add(usuario.id_usuario)
         self.usuarios[usuario.id_usuario] = usuario
+        self._usuarios_modificados.add(usuario.id_usuario)
         return True
 
     def dar_baja_usuario(self, id_usuario):
@@ -106,6 +580,14 @@ class Biblioteca:
             if len(self.usuarios[id_usuario].libros_prestados) == 0:
                 self.ids_usuario.remove(id_usuario)
                 del self.usuarios[id_usuario]
+                self._usuarios_modificados.add(id_usuario)
+                # Sacarlo de las colas de reservas en las que esperaba
+                for isbn, cola in list(self.reservas.items()):
+                    if id_usuario in cola:
+                        cola.remove(id_usuario)
+                        self._libros_modificados.add(isbn)
+                        if not cola:
+                            del self.reservas[isbn]
                 return True
         return False
 
@@ -116,29 +598,154 @@ class Biblioteca:
             if libro.disponible:
                 libro.disponible = False
                 self.usuarios[id_usuario].prestar_libro(libro)
+                self._registrar_prestamo(isbn, id_usuario, time.time())
+                self._libros_modificados.add(isbn)
+                self._usuarios_modificados.add(id_usuario)
                 return True
         return False
 
+    def _registrar_prestamo(self, isbn, id_usuario, fecha):
+        """Añade el préstamo al índice inverso sin romper el orden por fecha (aunque el reloj retroceda)."""
+        fecha = max(fecha, self._ultima_fecha_prestamo)
+        self._ultima_fecha_prestamo = fecha
+        self.prestamos[isbn] = (id_usuario, fecha)
+
     def devolver_libro(self, isbn, id_usuario):
-        """Procesa la devolución de un libro."""
+        """
+        Procesa la devolución de un libro. Si alguien lo tenía reservado, se presta
+        en el mismo paso al primero de la cola.
+        """
         if id_usuario in self.ids_usuario:
             libro_devuelto = self.usuarios[id_usuario].devolver_libro(isbn)
             if libro_devuelto:
                 libro_devuelto.disponible = True
+                del self.prestamos[isbn]
+                self._libros_modificados.add(isbn)
+                self._usuarios_modificados.add(id_usuario)
+                self._asignar_reserva(isbn)
+                return True
+        return False
+
+    def reservar_libro(self, isbn, id_usuario):
+        """
+        Pone al usuario al final de la cola de reservas de un libro prestado.
+        Cuando el libro se devuelva, se prestará automáticamente al primero de la cola.
+        """
+        if isbn in self.libros and id_usuario in self.ids_usuario and not self.libros[isbn].disponible:
+            cola = self.reservas.get(isbn, ())
+            if id_usuario not in cola and self.prestamos.get(isbn, (None,))[0] != id_usuario:
+                self.reservas.setdefault(isbn, deque()).append(id_usuario)
+                self._libros_modificados.add(isbn)
                 return True
         return False
 
+    def cola_reservas(self, isbn):
+        """Devuelve los IDs de usuario que esperan el libro, en orden."""
+        return list(self.reservas.get(isbn, ()))
+
+    def _asignar_reserva(self, isbn):
+        """Presta el libro recién devuelto al primero de su cola de reservas (None si no hay cola)."""
+        cola = self.reservas.get(isbn)
+        if cola is None:
+            return None
+        siguiente = cola.popleft()
+        if not cola:
+            del self.reservas[isbn]
+        self.prestar_libro(isbn, siguiente)  # Los usuarios dados de baja ya se quitaron de la cola
+        return siguiente
+
+    def prestar_lote(self, solicitudes, reservar=False, guardar=True):
+        """
+        Procesa muchos préstamos de una vez. `solicitudes` son pares (isbn, id_usuario).
+        Devuelve el resultado de cada solicitud, en el mismo orden: "prestado", "reservado"
+        (con reservar=True, si el libro ya estaba prestado) o el motivo del rechazo:
+        "libro inexistente", "usuario inexistente" o "no disponible".
+        Los cambios se guardan una sola vez, al final.
+        """
+        resultados = []
+        for isbn, id_usuario in solicitudes:
+            if isbn not in self.libros:
+                resultados.append("libro inexistente")
+            elif id_usuario not in self.ids_usuario:
+                resultados.append("usuario inexistente")
+            elif self.prestar_libro(isbn, id_usuario):
+                resultados.append("prestado")
+            elif reservar and self.reservar_libro(isbn, id_usuario):
+                resultados.append("reservado")
+            else:
+                resultados.append("no disponible")
+        if guardar:
+            self.guardar_datos()
+        return resultados
+
+    def devolver_lote(self, devoluciones, guardar=True):
+        """
+        Procesa muchas devoluciones de una vez. `devoluciones` son pares (isbn, id_usuario).
+        Devuelve el resultado de cada una, en el mismo orden: "devuelto", "reasignado"
+        (se prestó al primero de su cola de reservas), "usuario inexistente" o "no prestado"
+        (el usuario no tenía ese libro). Los cambios se guardan una sola vez, al final.
+        """
+        resultados = []
+        for isbn, id_usuario in devoluciones:
+            if id_usuario not in self.ids_usuario:
+                resultados.append("usuario inexistente")
+            elif self.devolver_libro(isbn, id_usuario):
+                resultados.append("devuelto" if self.libros[isbn].disponible else "reasignado")
+            else:
+                resultados.append("no prestado")
+        if guardar:
+            self.guardar_datos()
+        return resultados
+
+    def quien_tiene(self, isbn):
+        """Devuelve el usuario que tiene prestado el libro, o None si no está prestado."""
+        prestamo = self.prestamos.get(isbn)
+        return self.usuarios[prestamo[0]] if prestamo else None
+
+    def prestamos_con_mas_de(self, dias):
+        """
+        Devuelve (libro, usuario, fecha) de los préstamos hechos hace más de `dias` días,
+        del más antiguo al más reciente. Como el índice está ordenado por fecha, el recorrido
+        termina en el primer préstamo más reciente que el límite.
+        """
+        limite = time.time() - dias * 86400
+        resultado = []
+        for isbn, (id_usuario, fecha) in self.prestamos.items():
+            if fecha > limite:
+                break
+            resultado.append((self.libros[isbn], self.usuarios[id_usuario], fecha))
+        return resultado
+
     def buscar_por_titulo(self, titulo):
-        """Busca libros por título."""
-        return [libro for libro in self.libros.values() if titulo.lower() in libro.titulo.lower()]
+        """
+        Busca libros por título usando el índice de palabras: cada palabra buscada debe ser
+        el comienzo de una palabra del título o, si no es el comienzo de ninguna, estar dentro
+        de una, sin distinguir mayúsculas ni tildes.
+        """
+        return self.indice_titulos.buscar(titulo)
 
     def buscar_por_autor(self, autor):
-        """Busca libros por autor."""
-        return [libro for libro in self.libros.values() if autor.lower() in libro.autor.lower()]
+        """Busca libros por autor usando el índice de palabras (igual que buscar_por_titulo)."""
+        return self.indice_autores.buscar(autor)
+
+    def buscar_difuso(self, consulta, k=10, campo=None):
+        """
+        Búsqueda aproximada por título y autor, tolerante a errores de escritura y ordenada por
+        puntaje (entre 0 y 1). Devuelve hasta k pares (puntaje, libro). `campo` puede ser "titulo",
+        "autor" o None para ambos; en ese caso cada libro queda con su mejor puntaje.
+        """
+        indices = {"titulo": [self.indice_titulos], "autor": [self.indice_autores],
+                   None: [self.indice_titulos, self.indice_autores]}[campo]
+        mejores = {}
+        for indice in indices:
+            for puntaje, libro in indice.buscar_difuso(consulta, k):
+                if puntaje > mejores.get(libro.isbn, (0, None))[0]:
+                    mejores[libro.isbn] = (puntaje, libro)
+        return heapq.nlargest(k, mejores.values(), key=lambda par: par[0])
 
     def buscar_por_categoria(self, categoria):
-        """Busca libros por categoría."""
-        return [libro for libro in self.libros.values() if categoria.lower() == libro.categoria.lower()]
+        """Busca libros por categoría exacta, sin distinguir mayúsculas ni tildes, con el índice de categorías."""
+        return list(self.indice_categorias.get(normalizar(categoria), {}).values())
 
     def listar_libros_usuario(self, id_usuario):
         """Lista los libros prestados a un usuario específico."""
@@ -146,73 +753,219 @@ class Biblioteca:
             return self.usuarios[id_usuario].listar_libros_prestados()
         return []
 
-    def listar_todos_libros(self):
+    def iterar_libros(self, orden=None, cursor=None):
+        """
+        Generador que recorre los libros uno a uno.
+        `orden` puede ser "isbn", "titulo", "autor" o "categoria" (None = orden en que se añadieron)
+        y `cursor`, obtenido de pagina_libros, continúa el recorrido desde ese punto.
+        """
+        if orden is None and cursor is None:
+            yield from list(self.libros.values())
+            return
+        clave = clave_orden_libro(orden or "isbn")
+        libros = self.libros.values()
+        if cursor is not None:
+            libros = (libro for libro in libros if clave(libro) > cursor)
+        yield from sorted(libros, key=clave)
+
+    def pagina_libros(self, tamano=50, cursor=None, orden="isbn"):
+        """
+        Devuelve una página de `tamano` libros y el cursor para pedir la siguiente (None si es la última).
+        El cursor es la clave del último libro de la página, así las páginas siguen siendo
+        correctas aunque entre una y otra se añadan o quiten libros.
+        """
+        return paginar(self.libros.values(), clave_orden_libro(orden), tamano, cursor)
+
+    def listar_todos_libros(self, orden=None):
         """Lista todos los libros de la biblioteca."""
-        return list(self.libros.values())
+        return list(self.iterar_libros(orden))
+
+    def mostrar_libros(self, orden=None, salida=None):
+        """Muestra el catálogo escribiendo las líneas en bloques. Devuelve cuántos libros mostró."""
+        return escribir_en_bloques(map(str, self.iterar_libros(orden)), salida)
 
     def listar_todos_usuarios(self):
         """Lista todos los usuarios registrados."""
         return list(self.usuarios.values())
 
+    def _datos_libro(self, libro):
+        """Devuelve el registro JSON de un libro."""
+        return {
+            "titulo": libro.titulo,
+            "autor": libro.autor,
+            "categoria": libro.categoria,
+            "isbn": libro.isbn,
+            "disponible": libro.disponible,
+            "reservas": list(self.reservas.get(libro.isbn, ()))
+        }
+
+    def _datos_usuario(self, usuario):
+        """Devuelve el registro JSON de un usuario, con sus préstamos y las fechas de cada uno."""
+        libros_prestados_ids = list(usuario.libros_prestados)
+        return {
+            "nombre": usuario.nombre,
+            "id_usuario": usuario.id_usuario,
+            "libros_prestados": libros_prestados_ids,
+            "fechas_prestamo": {isbn: self.prestamos[isbn][1] for isbn in libros_prestados_ids}
+        }
+
     def guardar_datos(self):
-        """Guarda los datos de la biblioteca en archivos JSON."""
-        # Guardar libros
-        libros_data = {}
-        for isbn, libro in self.libros.items():
-            libros_data[isbn] = {
-                "titulo": libro.titulo,
-                "autor": libro.autor,
-                "categoria": libro.categoria,
-                "isbn": libro.isbn,
-                "disponible": libro.disponible
-            }
+        """
+        Guarda los cambios pendientes de la biblioteca.
+        Añade al diario un registro por cada libro o usuario modificado desde el último
+        guardado (o su baja), así el costo depende de los cambios y no del tamaño del catálogo.
+        Al alcanzar UMBRAL_COMPACTACION registros, reescribe los snapshots completos.
+        """
+        if not self._libros_modificados and not self._usuarios_modificados:
+            print("✓ Datos guardados correctamente.")
+            return True
 
-        try:
-            with open(self.archivo_libros, 'w') as f:
-                json.dump(libros_data, f, indent=4)
-        except Exception as e:
-            print(f"Error al guardar libros: {e}")
-
-        # Guardar usuarios
-        usuarios_data = {}
-        for id_usuario, usuario in self.usuarios.items():
-            libros_prestados_ids = [libro.isbn for libro in usuario.libros_prestados]
-            usuarios_data[id_usuario] = {
-                "nombre": usuario.nombre,
-                "id_usuario": usuario.id_usuario,
-                "libros_prestados": libros_prestados_ids
-            }
+        lineas = []
+        for isbn in self._libros_modificados:
+            libro = self.libros.get(isbn)
+            datos = self._datos_libro(libro) if libro else None
+            lineas.append(json.dumps({"tipo": "libro", "clave": isbn, "datos": datos}, ensure_ascii=False))
+        for id_usuario in self._usuarios_modificados:
+            usuario = self.usuarios.get(id_usuario)
+            datos = self._datos_usuario(usuario) if usuario else None
+            lineas.append(json.dumps({"tipo": "usuario", "clave": id_usuario, "datos": datos}, ensure_ascii=False))
 
         try:
-            with open(self.archivo_usuarios, 'w') as f:
-                json.dump(usuarios_data, f, indent=4)
+            with open(self.archivo_diario, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lineas) + "\n")
         except Exception as e:
-            print(f"Error al guardar usuarios: {e}")
+            print(f"Error al guardar los cambios: {e}")
+            return False
 
+        self._libros_modificados.clear()
+        self._usuarios_modificados.clear()
+        self._registros_diario += len(lineas)
+        if self._registros_diario >= self.UMBRAL_COMPACTACION:
+            return self.compactar()
         print("✓ Datos guardados correctamente.")
+        return True
 
-    def cargar_datos(self):
-        """Carga los datos de la biblioteca desde archivos JSON."""
-        # Cargar libros
-        if os.path.exists(self.archivo_libros):
-            with open(self.archivo_libros, 'r', encoding='utf-8') as f:
-                libros_data = json.load(f)
-
-            for isbn, libro_data in libros_data.items():
-                libro = Libro(
-                    libro_data["titulo"],
-                    libro_data["autor"],
-                    libro_data["categoria"],
-                    libro_data["isbn"]
-                )
-                libro.disponible = libro_data["disponible"]
-                self.libros[isbn] = libro
+    def compactar(self):
+        """Reescribe los snapshots de libros y usuarios completos y vacía el diario."""
+        try:
+            escribir_json_atomico(self.archivo_libros,
+                                  {isbn: self._datos_libro(libro) for isbn, libro in self.libros.items()})
+            escribir_json_atomico(self.archivo_usuarios,
+                                  {id_usuario: self._datos_usuario(usuario)
+                                   for id_usuario, usuario in self.usuarios.items()})
+            # El diario se vacía solo después de escribir ambos snapshots
+            open(self.archivo_diario, 'w', encoding='utf-8').close()
+        except Exception as e:
+            print(f"Error al guardar datos: {e}")
+            return False
 
-        # Cargar usuarios
-        if os.path.exists(self.archivo_usuarios):
-            with open(self.archivo_usuarios, 'r', encoding='utf-8') as f:
-                usuarios_data = json.load(f)
+        self._libros_modificados.clear()
+        self._usuarios_modificados.clear()
+        self._registros_diario = 0
+        print("✓ Datos guardados correctamente.")
+        return True
 
+    def _reproducir_diario(self, libros_data, usuarios_data):
+        """
+        Aplica sobre los datos leídos de los snapshots los registros del diario, en orden.
+        Una última línea sin salto de línea que no se puede leer es una escritura interrumpida:
+        se descarta y se recorta del archivo. Cualquier otro registro ilegible o mal formado
+        se salta con una advertencia, sin tocar los que le siguen.
+        """
+        if not os.path.exists(self.archivo_diario):
+            return
+        with open(self.archivo_diario, 'rb+') as f:
+            posicion = 0
+            linea = b"\n"
+            for linea in f:
+                inicio_linea = posicion
+                posicion += len(linea)
+                try:
+                    registro = json.loads(linea)
+                    datos = {"libro": libros_data, "usuario": usuarios_data}[registro["tipo"]]
+                    clave, valor = registro["clave"], registro["datos"]
+                except (ValueError, KeyError, TypeError):  # ValueError incluye JSONDecodeError
+                    if not linea.endswith(b"\n"):
+                        print("Advertencia: Se descartó un registro incompleto al final del diario.")
+                        f.truncate(inicio_linea)
+                        return
+                    print("Advertencia: Se descartó un registro ilegible del diario.")
+                    continue
+                if valor is None:
+                    datos.pop(clave, None)
+                else:
+                    datos[clave] = valor
+                self._registros_diario += 1
+            # Sin salto de línea al final, el próximo registro quedaría pegado al último
+            if not linea.endswith(b"\n"):
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+
+    @staticmethod
+    def _leer_json(ruta):
+        """Lee y analiza un archivo JSON; devuelve un diccionario vacío si no existe."""
+        if not os.path.exists(ruta):
+            return {}
+        with open(ruta, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def cargar_datos(self, progreso=None):
+        """
+        Carga los datos de la biblioteca desde los snapshots JSON y el diario de cambios.
+        Lee libros.json y usuarios.json a la vez en dos hilos, y construye los libros por
+        bloques de TAMANO_BLOQUE_CARGA indexándolos en el mismo paso. `progreso(cargados, total)`
+        se llama después de cada bloque. Devuelve (y guarda en tiempos_carga) los segundos de cada fase.
+        """
+        tiempos = {}
+        # Sin recolección de basura mientras se crean millones de objetos que quedarán vivos:
+        # cada pasada recorrería todo lo ya cargado sin liberar nada
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=2) as ejecutor:
+                lectura_libros = ejecutor.submit(self._leer_json, self.archivo_libros)
+                lectura_usuarios = ejecutor.submit(self._leer_json, self.archivo_usuarios)
+                libros_data = lectura_libros.result()
+                usuarios_data = lectura_usuarios.result()
+            # Los archivos anteriores no guardaban la fecha del préstamo: se usa la del archivo
+            if os.path.exists(self.archivo_usuarios):
+                fecha_archivo = os.path.getmtime(self.archivo_usuarios)
+            else:
+                fecha_archivo = time.time()
+            tiempos["lectura"] = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            self._reproducir_diario(libros_data, usuarios_data)
+            tiempos["diario"] = time.perf_counter() - inicio
+
+            # Cargar libros e indexarlos por bloques
+            inicio = time.perf_counter()
+            registros = list(libros_data.values())
+            palabras_por_autor = {}
+            categorias_normalizadas = {}
+            for desde in range(0, len(registros), self.TAMANO_BLOQUE_CARGA):
+                bloque = []
+                for libro_data in registros[desde:desde + self.TAMANO_BLOQUE_CARGA]:
+                    libro = Libro(
+                        libro_data["titulo"],
+                        libro_data["autor"],
+                        libro_data["categoria"],
+                        libro_data["isbn"]
+                    )
+                    libro.disponible = libro_data["disponible"]
+                    if libro_data.get("reservas"):
+                        self.reservas[libro.isbn] = deque(libro_data["reservas"])
+                    bloque.append(libro)
+                self.libros.update((libro.isbn, libro) for libro in bloque)
+                self._indexar_lote(bloque, palabras_por_autor, categorias_normalizadas)
+                if progreso:
+                    progreso(desde + len(bloque), len(registros))
+            tiempos["libros"] = time.perf_counter() - inicio
+
+            # Cargar usuarios
+            inicio = time.perf_counter()
+            prestamos = []
             for id_usuario, usuario_data in usuarios_data.items():
                 usuario = Usuario(
                     usuario_data["nombre"],
@@ -222,10 +975,32 @@ class Biblioteca:
                 self.ids_usuario.add(id_usuario)
 
                 # Asignar libros prestados
+                fechas = usuario_data.get("fechas_prestamo", {})
                 for isbn in usuario_data["libros_prestados"]:
-                    if isbn in self.libros:
-                        usuario.libros_prestados.append(self.libros[isbn])
-                        self.libros[isbn].disponible = False
+                    libro = self.libros.get(isbn)
+                    if libro is not None:
+                        usuario.prestar_libro(libro)
+                        libro.disponible = False
+                        prestamos.append((fechas.get(isbn, fecha_archivo), isbn, id_usuario))
+
+            # Reconstruir el índice inverso en orden de fecha
+            prestamos.sort()
+            for fecha, isbn, id_usuario in prestamos:
+                self._registrar_prestamo(isbn, id_usuario, fecha)
+
+            # Un libro marcado como no disponible sin ningún usuario que lo tenga (archivos
+            # antiguos o inconsistentes) quedaría bloqueado: los préstamos mandan
+            for isbn, libro in self.libros.items():
+                if not libro.disponible and isbn not in self.prestamos:
+                    libro.disponible = True
+            tiempos["usuarios"] = time.perf_counter() - inicio
+        finally:
+            if gc_activo:
+                gc.enable()
+
+        tiempos["total"] = sum(tiempos.values())
+        self.tiempos_carga = tiempos
+        return tiempos
 
 
 def menu_principal():
@@ -265,8 +1040,11 @@ def menu_prestamos():
     print("1. Prestar libro")
     print("2. Devolver libro")
     print("3. Listar libros prestados a usuario")
-    print("4. Volver al menú principal")
-    return input("Seleccione una opción (1-4): ")
+    print("4. Consultar quién tiene un libro")
+    print("5. Listar préstamos con más de N días")
+    print("6. Reservar un libro prestado")
+    print("7. Volver al menú principal")
+    return input("Seleccione una opción (1-7): ")
 
 
 def menu_busquedas():
@@ -275,8 +1053,9 @@ def menu_busquedas():
     print("1. Buscar por título")
     print("2. Buscar por autor")
     print("3. Buscar por categoría")
-    print("4. Volver al menú principal")
-    return input("Seleccione una opción (1-4): ")
+    print("4. Búsqueda aproximada (título o autor)")
+    print("5. Volver al menú principal")
+    return input("Seleccione una opción (1-5): ")
 
 
 def ejecutar_sistema():
@@ -293,6 +1072,8 @@ def ejecutar_sistema():
         biblioteca.guardar_datos()
     else:
         print(f"✓ Datos cargados: {len(biblioteca.libros)} libros y {len(biblioteca.usuarios)} usuarios.")
+        fases = ", ".join(f"{fase} {segundos:.2f} s" for fase, segundos in biblioteca.tiempos_carga.items())
+        print(f"  Tiempos de carga: {fases}")
 
     while True:
         opcion = menu_principal()
@@ -323,11 +1104,7 @@ def ejecutar_sistema():
 
                 elif opcion_libros == "3":  # Listar todos los libros
                     print("\n===== CATÁLOGO DE LIBROS =====")
-                    libros = biblioteca.listar_todos_libros()
-                    if libros:
-                        for libro in libros:
-                            print(libro)
-                    else:
+                    if not biblioteca.mostrar_libros():
                         print("No hay libros en la biblioteca.")
 
                 elif opcion_libros == "4":  # Volver al menú principal
@@ -391,6 +1168,10 @@ def ejecutar_sistema():
                     id_usuario = input("ID del usuario: ")
                     if biblioteca.devolver_libro(isbn, id_usuario):
                         print("✓ Libro devuelto correctamente.")
+                        siguiente = biblioteca.quien_tiene(isbn)
+                        if siguiente:
+                            print(f"✓ El libro se prestó a {siguiente.nombre} ({siguiente.id_usuario}), "
+                                  f"que lo tenía reservado.")
                         biblioteca.guardar_datos()
                     else:
                         print("✗ Error: El usuario no tiene este libro prestado.")
@@ -405,7 +1186,41 @@ def ejecutar_sistema():
                     else:
                         print(f"El usuario {id_usuario} no tiene libros prestados o no existe.")
 
-                elif opcion_prestamos == "4":  # Volver al menú principal
+                elif opcion_prestamos == "4":  # Consultar quién tiene un libro
+                    isbn = input("ISBN del libro: ")
+                    usuario = biblioteca.quien_tiene(isbn)
+                    if usuario:
+                        print(f"El libro {isbn} está prestado a: {usuario}")
+                    else:
+                        print(f"El libro {isbn} no está prestado o no existe.")
+
+                elif opcion_prestamos == "5":  # Listar préstamos con más de N días
+                    try:
+                        dias = float(input("Cantidad de días: "))
+                    except ValueError:
+                        print("✗ Error: Ingrese un número de días válido.")
+                        continue
+                    print(f"\n===== PRÉSTAMOS CON MÁS DE {dias:g} DÍAS =====")
+                    prestamos = biblioteca.prestamos_con_mas_de(dias)
+                    if prestamos:
+                        for libro, usuario, fecha in prestamos:
+                            print(f"{time.strftime('%Y-%m-%d', time.localtime(fecha))} | "
+                                  f"{libro.titulo} (ISBN {libro.isbn}) | {usuario.nombre} ({usuario.id_usuario})")
+                    else:
+                        print("No hay préstamos con esa antigüedad.")
+
+                elif opcion_prestamos == "6":  # Reservar un libro prestado
+                    isbn = input("ISBN del libro a reservar: ")
+                    id_usuario = input("ID del usuario: ")
+                    if biblioteca.reservar_libro(isbn, id_usuario):
+                        posicion = len(biblioteca.cola_reservas(isbn))
+                        print(f"✓ Reserva registrada. Posición en la cola: {posicion}.")
+                        biblioteca.guardar_datos()
+                    else:
+                        print("✗ Error: Libro o usuario no encontrado, el libro está disponible "
+                              "o el usuario ya lo tiene o lo reservó.")
+
+                elif opcion_prestamos == "7":  # Volver al menú principal
                     break
 
                 else:
@@ -445,14 +1260,24 @@ def ejecutar_sistema():
                     else:
                         print("No se encontraron libros en esa categoría.")
 
-                elif opcion_busquedas == "4":  # Volver al menú principal
+                elif opcion_busquedas == "4":  # Búsqueda aproximada
+                    consulta = input("Título o autor (se toleran errores de escritura): ")
+                    print(f"\n===== RESULTADOS APROXIMADOS: '{consulta}' =====")
+                    resultados = biblioteca.buscar_difuso(consulta)
+                    if resultados:
+                        for puntaje, libro in resultados:
+                            print(f"[{puntaje:.2f}] {libro}")
+                    else:
+                        print("No se encontraron libros parecidos.")
+
+                elif opcion_busquedas == "5":  # Volver al menú principal
                     break
 
                 else:
                     print("Opción no válida. Intente de nuevo.")
 
         elif opcion == "5":  # Salir
-            biblioteca.guardar_datos()
+            biblioteca.compactar()  # Al salir se pliega el diario en los snapshots
             print("¡Gracias por usar el Sistema de Gestión de Biblioteca Digital!")
             break
 
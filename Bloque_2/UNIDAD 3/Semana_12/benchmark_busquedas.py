@@ -0,0 +1,87 @@
+"""
+Benchmark de búsquedas de la biblioteca de la Semana 12.
+Genera un catálogo sintético de 1M libros y compara las búsquedas por título, autor y
+categoría recorriendo todo el catálogo (la implementación anterior) contra los índices
+secundarios de la Biblioteca.
+
+Uso: python benchmark_busquedas.py
+"""
+import importlib.util
+import os
+import random
+import time
+
+# El nombre del módulo tiene dos puntos seguidos, así que se carga desde su ruta
+_ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Gestor_Biblioteca_colecciones..py")
+_spec = importlib.util.spec_from_file_location("gestor_biblioteca", _ruta)
+gestor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gestor)
+
+LIBROS = 1_000_000
+REPETICIONES = 5  # Consultas medidas por búsqueda y modo
+
+PALABRAS = ["amor", "guerra", "noche", "ciudad", "sombra", "tiempo", "mar", "luz", "viaje", "memoria",
+            "silencio", "fuego", "camino", "jardín", "río", "historia", "sueño", "montaña", "reino", "voz"]
+NOMBRES = ["Gabriel", "Isabel", "Jorge", "Julio", "Laura", "Mario", "Pablo", "Rosa", "Elena", "Carlos"]
+APELLIDOS = ["García", "Allende", "Borges", "Cortázar", "Esquivel", "Vargas", "Neruda", "Montero",
+             "Garro", "Fuentes", "Márquez", "Pérez", "Sábato", "Rulfo", "Onetti", "Bolaño"]
+CATEGORIAS = ["Novela", "Ficción", "Clásico", "Poesía", "Ensayo", "Historia", "Ciencia", "Infantil"]
+
+CONSULTAS = [("título", "sombra mar 437"), ("título", "memo"), ("título", "moria"), ("autor", "cortázar"),
+             ("autor", "isabel allende borges"), ("categoría", "Poesía")]
+
+
+def generar_biblioteca():
+    """Crea una biblioteca con LIBROS libros sintéticos."""
+    generador = random.Random(14)
+    biblioteca = gestor.Biblioteca(cargar_datos=False)
+    for i in range(LIBROS):
+        titulo = " ".join(generador.sample(PALABRAS, 3)) + f" {i % 1000}"
+        autor = f"{generador.choice(NOMBRES)} {generador.choice(APELLIDOS)} {generador.choice(APELLIDOS)}"
+        biblioteca.agregar_libro(gestor.Libro(titulo, autor, generador.choice(CATEGORIAS), f"978{i:010d}"))
+    return biblioteca
+
+
+def buscar_recorriendo(biblioteca, campo, consulta):
+    """Búsqueda anterior: recorre todo el catálogo comparando cada libro."""
+    if campo == "título":
+        return [libro for libro in biblioteca.libros.values() if consulta.lower() in libro.titulo.lower()]
+    if campo == "autor":
+        return [libro for libro in biblioteca.libros.values() if consulta.lower() in libro.autor.lower()]
+    return [libro for libro in biblioteca.libros.values() if consulta.lower() == libro.categoria.lower()]
+
+
+def buscar_con_indices(biblioteca, campo, consulta):
+    """Búsqueda con los índices secundarios de la Biblioteca."""
+    if campo == "título":
+        return biblioteca.buscar_por_titulo(consulta)
+    if campo == "autor":
+        return biblioteca.buscar_por_autor(consulta)
+    return biblioteca.buscar_por_categoria(consulta)
+
+
+def medir(buscar, biblioteca, campo, consulta):
+    """Devuelve los milisegundos promedio por consulta y la cantidad de resultados."""
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        resultados = buscar(biblioteca, campo, consulta)
+    return (time.perf_counter() - inicio) / REPETICIONES * 1000, len(resultados)
+
+
+def ejecutar_benchmark():
+    """Genera el catálogo y compara ambos modos de búsqueda."""
+    inicio = time.perf_counter()
+    biblioteca = generar_biblioteca()
+    print(f"Catálogo de {LIBROS:,} libros generado e indexado en {time.perf_counter() - inicio:.1f} s")
+    biblioteca.buscar_por_titulo("a")  # Ordena la lista de palabras antes de medir
+    print(f"{'Búsqueda':>30} | {'recorrido ms':>12} | {'resultados':>10} | {'índice ms':>10} | {'resultados':>10}")
+    print("-" * 84)
+    for campo, consulta in CONSULTAS:
+        t_recorrido, n_recorrido = medir(buscar_recorriendo, biblioteca, campo, consulta)
+        t_indice, n_indice = medir(buscar_con_indices, biblioteca, campo, consulta)
+        print(f"{campo + ': ' + repr(consulta):>30} | {t_recorrido:>12.1f} | {n_recorrido:>10} | "
+              f"{t_indice:>10.2f} | {n_indice:>10}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
@@ -0,0 +1,140 @@
+"""
+Benchmark de arranque en frío de la biblioteca de la Semana 12.
+Genera libros.json y usuarios.json con 10k, 100k y 1M libros y compara la carga anterior
+(un archivo después del otro, un libro a la vez, con la recolección de basura activa) contra
+Biblioteca.cargar_datos, mostrando los tiempos de cada fase.
+Cada carga se ejecuta en un proceso aparte para que sea realmente en frío.
+
+Uso: python benchmark_carga.py
+"""
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# El nombre del módulo tiene dos puntos seguidos, así que se carga desde su ruta
+_ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Gestor_Biblioteca_colecciones..py")
+_spec = importlib.util.spec_from_file_location("gestor_biblioteca", _ruta)
+gestor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gestor)
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+LIBROS_POR_USUARIO = 100  # Un usuario cada 100 libros
+PRESTADOS = 10  # Se presta uno de cada 10 libros
+
+PALABRAS = ["amor", "guerra", "noche", "ciudad", "sombra", "tiempo", "mar", "luz", "viaje", "memoria",
+            "silencio", "fuego", "camino", "jardín", "río", "historia", "sueño", "montaña", "reino", "voz"]
+NOMBRES = ["Gabriel", "Isabel", "Jorge", "Julio", "Laura", "Mario", "Pablo", "Rosa", "Elena", "Carlos"]
+APELLIDOS = ["García", "Allende", "Borges", "Cortázar", "Esquivel", "Vargas", "Neruda", "Montero",
+             "Garro", "Fuentes", "Márquez", "Pérez", "Sábato", "Rulfo", "Onetti", "Bolaño"]
+CATEGORIAS = ["Novela", "Ficción", "Clásico", "Poesía", "Ensayo", "Historia", "Ciencia", "Infantil"]
+
+
+def generar_archivos(tamano):
+    """Escribe libros.json y usuarios.json con `tamano` libros en el directorio actual."""
+    generador = random.Random(17)
+    usuarios = max(1, tamano // LIBROS_POR_USUARIO)
+    libros_data = {}
+    usuarios_data = {f"U{u}": {"nombre": f"Usuario {u}", "id_usuario": f"U{u}",
+                               "libros_prestados": [], "fechas_prestamo": {}} for u in range(usuarios)}
+    fecha = time.time() - 365 * 86400
+    for i in range(tamano):
+        isbn = f"978{i:010d}"
+        prestado = i % PRESTADOS == 0
+        libros_data[isbn] = {
+            "titulo": " ".join(generador.sample(PALABRAS, 3)) + f" {i % 1000}",
+            "autor": f"{generador.choice(NOMBRES)} {generador.choice(APELLIDOS)} {generador.choice(APELLIDOS)}",
+            "categoria": generador.choice(CATEGORIAS),
+            "isbn": isbn,
+            "disponible": not prestado
+        }
+        if prestado:
+            usuario = usuarios_data[f"U{generador.randrange(usuarios)}"]
+            usuario["libros_prestados"].append(isbn)
+            usuario["fechas_prestamo"][isbn] = fecha + i
+    for ruta, datos in [("libros.json", libros_data), ("usuarios.json", usuarios_data)]:
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, indent=4)
+
+
+def cargar_anterior():
+    """Carga anterior: un archivo después del otro y un libro a la vez."""
+    tiempos = {}
+    biblioteca = gestor.Biblioteca(cargar_datos=False)
+    inicio = time.perf_counter()
+    with open(biblioteca.archivo_libros, 'r', encoding='utf-8') as f:
+        libros_data = json.load(f)
+    with open(biblioteca.archivo_usuarios, 'r', encoding='utf-8') as f:
+        usuarios_data = json.load(f)
+    tiempos["lectura"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for isbn, libro_data in libros_data.items():
+        libro = gestor.Libro(libro_data["titulo"], libro_data["autor"], libro_data["categoria"], libro_data["isbn"])
+        libro.disponible = libro_data["disponible"]
+        biblioteca.libros[isbn] = libro
+        biblioteca._indexar_libro(libro)
+    tiempos["libros"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    prestamos = []
+    for id_usuario, usuario_data in usuarios_data.items():
+        usuario = gestor.Usuario(usuario_data["nombre"], usuario_data["id_usuario"])
+        biblioteca.usuarios[id_usuario] = usuario
+        biblioteca.ids_usuario.add(id_usuario)
+        for isbn in usuario_data["libros_prestados"]:
+            if isbn in biblioteca.libros:
+                usuario.prestar_libro(biblioteca.libros[isbn])
+                biblioteca.libros[isbn].disponible = False
+                prestamos.append((usuario_data["fechas_prestamo"][isbn], isbn, id_usuario))
+    prestamos.sort()
+    for fecha, isbn, id_usuario in prestamos:
+        biblioteca._registrar_prestamo(isbn, id_usuario, fecha)
+    tiempos["usuarios"] = time.perf_counter() - inicio
+    tiempos["total"] = sum(tiempos.values())
+    return tiempos
+
+
+def medir(modo):
+    """Carga la biblioteca del directorio actual e imprime los tiempos por fase (proceso hijo)."""
+    if modo == "anterior":
+        tiempos = cargar_anterior()
+    else:
+        tiempos = gestor.Biblioteca(cargar_datos=False).cargar_datos()
+    print(json.dumps(tiempos))
+
+
+def ejecutar_hijo(modo, directorio):
+    """Ejecuta una carga en un proceso aparte dentro de `directorio` y devuelve sus tiempos."""
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--medir", modo],
+                            capture_output=True, text=True, check=True, cwd=directorio)
+    return json.loads(salida.stdout)
+
+
+def ejecutar_benchmark():
+    """Genera cada catálogo en un directorio temporal y compara ambas cargas."""
+    print(f"{'Libros':>10} | {'Carga':>8} | {'lectura s':>9} | {'libros s':>8} | {'usuarios s':>10} | {'total s':>7}")
+    print("-" * 68)
+    for tamano in TAMANOS:
+        with tempfile.TemporaryDirectory() as directorio:
+            directorio_actual = os.getcwd()
+            os.chdir(directorio)
+            try:
+                generar_archivos(tamano)
+            finally:
+                os.chdir(directorio_actual)
+            for modo in ["anterior", "actual"]:
+                tiempos = ejecutar_hijo(modo, directorio)
+                print(f"{tamano:>10} | {modo:>8} | {tiempos['lectura']:>9.2f} | {tiempos['libros']:>8.2f} | "
+                      f"{tiempos['usuarios']:>10.2f} | {tiempos['total']:>7.2f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--medir":
+        medir(sys.argv[2])
+    else:
+        ejecutar_benchmark()
@@ -0,0 +1,96 @@
+"""
+Benchmark de la búsqueda aproximada de la biblioteca de la Semana 12.
+Genera un catálogo sintético de 1M libros con un vocabulario de palabras inventadas
+(repartidas como en un catálogo real: pocas muy frecuentes y muchas raras) y mide la
+latencia p50/p99 de Biblioteca.buscar_difuso con palabras exactas, con un error de
+escritura y simulando cada pulsación de tecla mientras se escribe la consulta.
+
+Uso: python benchmark_difuso.py
+"""
+import importlib.util
+import itertools
+import os
+import random
+import time
+
+# El nombre del módulo tiene dos puntos seguidos, así que se carga desde su ruta
+_ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Gestor_Biblioteca_colecciones..py")
+_spec = importlib.util.spec_from_file_location("gestor_biblioteca", _ruta)
+gestor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gestor)
+
+LIBROS = 1_000_000
+VOCABULARIO = 30_000
+CONSULTAS = 300  # Consultas medidas por tipo
+
+SILABAS = ["ma", "ra", "so", "le", "ti", "ca", "no", "de", "lu", "pe", "ro", "ba", "sa", "gu", "vi",
+           "cha", "mon", "tra", "ber", "quil", "for", "cas", "dor", "es", "an", "ol", "ñu", "jé", "ri", "to"]
+
+
+def generar_biblioteca(generador):
+    """Crea una biblioteca con LIBROS libros sintéticos y devuelve (biblioteca, vocabulario)."""
+    vocabulario = list({"".join(generador.choices(SILABAS, k=generador.randint(2, 4)))
+                        for _ in range(VOCABULARIO * 2)})[:VOCABULARIO]
+    pesos = list(itertools.accumulate(1 / rango for rango in range(1, len(vocabulario) + 1)))  # Zipf
+    nombres = vocabulario[:300]
+    apellidos = vocabulario[300:3300]
+    biblioteca = gestor.Biblioteca(cargar_datos=False)
+    for i in range(LIBROS):
+        titulo = " ".join(generador.choices(vocabulario, cum_weights=pesos, k=generador.randint(2, 5)))
+        autor = f"{generador.choice(nombres)} {generador.choice(apellidos)}"
+        biblioteca.agregar_libro(gestor.Libro(titulo.capitalize(), autor.title(), "Novela", f"978{i:010d}"))
+    return biblioteca
+
+
+def con_error(palabra, generador):
+    """Cambia una letra de la palabra (un error de escritura)."""
+    posicion = generador.randrange(len(palabra))
+    return palabra[:posicion] + generador.choice("aeioulnrst") + palabra[posicion + 1:]
+
+
+def generar_consultas(biblioteca, generador):
+    """Consultas de cada tipo a partir de títulos y autores del catálogo."""
+    libros = generador.sample(list(biblioteca.libros.values()), CONSULTAS)
+    exactas = []
+    errores = []
+    teclas = []
+    for libro in libros:
+        palabras = libro.titulo.split()[:2] if generador.random() < 0.7 else libro.autor.split()
+        exactas.append(" ".join(palabras))
+        largas = [p for p in palabras if len(p) >= 4]
+        if largas:
+            errores.append(" ".join(con_error(p, generador) if p == largas[0] else p for p in palabras))
+    # Cada prefijo de la consulta, como si se buscara en cada pulsación de tecla
+    for consulta in exactas[:CONSULTAS // 10]:
+        teclas.extend(consulta[:fin] for fin in range(1, len(consulta) + 1) if not consulta[:fin].endswith(" "))
+    return [("exacta", exactas), ("con un error", errores), ("por tecla", teclas)]
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def ejecutar_benchmark():
+    """Genera el catálogo y mide la latencia de cada tipo de consulta."""
+    generador = random.Random(18)
+    inicio = time.perf_counter()
+    biblioteca = generar_biblioteca(generador)
+    print(f"Catálogo de {LIBROS:,} libros generado e indexado en {time.perf_counter() - inicio:.1f} s")
+    biblioteca.buscar_difuso("a")  # Ordena la lista de palabras antes de medir
+    print(f"{'Consulta':>14} | {'cantidad':>8} | {'p50 ms':>7} | {'p99 ms':>7} | {'máx ms':>7} | {'con resultados':>14}")
+    print("-" * 72)
+    for tipo, consultas in generar_consultas(biblioteca, generador):
+        latencias = []
+        encontradas = 0
+        for consulta in consultas:
+            inicio = time.perf_counter()
+            resultados = biblioteca.buscar_difuso(consulta, k=10)
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            encontradas += bool(resultados)
+        print(f"{tipo:>14} | {len(consultas):>8} | {percentil(latencias, 50):>7.2f} | "
+              f"{percentil(latencias, 99):>7.2f} | {max(latencias):>7.2f} | {encontradas:>14}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
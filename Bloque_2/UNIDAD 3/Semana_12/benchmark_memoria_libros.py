@@ -0,0 +1,86 @@
+"""
+Benchmark de memoria por libro de la biblioteca de la Semana 12.
+Carga 1M registros desde JSON (como cargar_datos) y compara el Libro anterior
+(__dict__ por instancia, tupla para título y autor, una cadena de autor y de categoría
+por libro) contra el Libro compacto (__slots__, autor y categoría internados).
+Mide con tracemalloc la memoria que queda ocupada por libro (libros, sus cadenas y el
+diccionario ISBN -> Libro, sin los índices de búsqueda) y el pico durante la carga.
+
+Uso: python benchmark_memoria_libros.py
+"""
+import importlib.util
+import json
+import os
+import random
+import tracemalloc
+
+# El nombre del módulo tiene dos puntos seguidos, así que se carga desde su ruta
+_ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Gestor_Biblioteca_colecciones..py")
+_spec = importlib.util.spec_from_file_location("gestor_biblioteca", _ruta)
+gestor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gestor)
+
+LIBROS = 1_000_000
+AUTORES = 5_000
+CATEGORIAS = ["Novela", "Ficción", "Clásico", "Poesía", "Ensayo", "Historia", "Ciencia", "Infantil"]
+
+
+class LibroAnterior:
+    """Representación anterior de Libro: __dict__ por instancia y tupla para título y autor."""
+
+    def __init__(self, titulo, autor, categoria, isbn):
+        self.datos = (titulo, autor)
+        self.categoria = categoria
+        self.isbn = isbn
+        self.disponible = True
+
+    @property
+    def titulo(self):
+        return self.datos[0]
+
+    @property
+    def autor(self):
+        return self.datos[1]
+
+
+def generar_json():
+    """Texto JSON con LIBROS registros de libros, como el de libros.json."""
+    generador = random.Random(20)
+    autores = [f"Autor{a} Apellido{a % 97} Segundo{a % 13}" for a in range(AUTORES)]
+    return json.dumps([{
+        "titulo": f"Título del libro número {i}",
+        "autor": generador.choice(autores),
+        "categoria": generador.choice(CATEGORIAS),
+        "isbn": f"978{i:010d}",
+        "disponible": True
+    } for i in range(LIBROS)])
+
+
+def medir(clase_libro, texto):
+    """Carga los registros con la clase indicada y devuelve (bytes por libro, pico por libro)."""
+    tracemalloc.start()
+    registros = json.loads(texto)
+    libros = {}
+    for registro in registros:
+        libro = clase_libro(registro["titulo"], registro["autor"], registro["categoria"], registro["isbn"])
+        libro.disponible = registro["disponible"]
+        libros[libro.isbn] = libro
+    del registros
+    memoria, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memoria / LIBROS, pico / LIBROS
+
+
+def ejecutar_benchmark():
+    """Mide cada representación e imprime los bytes por libro."""
+    texto = generar_json()  # El texto se genera antes de medir: es igual para ambas representaciones
+    print(f"Memoria por libro con {LIBROS:,} libros, {AUTORES:,} autores y {len(CATEGORIAS)} categorías")
+    print(f"{'Representación':<22} | {'bytes/libro':>11} | {'pico bytes/libro':>16}")
+    print("-" * 56)
+    for nombre, clase in [("Libro anterior", LibroAnterior), ("Libro compacto", gestor.Libro)]:
+        memoria, pico = medir(clase, texto)
+        print(f"{nombre:<22} | {memoria:>11.1f} | {pico:>16.1f}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
@@ -0,0 +1,90 @@
+"""
+Benchmark de préstamos masivos de la biblioteca de la Semana 12.
+Simula el comienzo de un semestre sobre un catálogo guardado en disco: primero procesa
+SOLICITUDES préstamos (con reserva si el libro ya está prestado) y después las devoluciones.
+Compara el camino de a uno (prestar_libro + guardar_datos por cada operación, como el menú)
+contra prestar_lote / devolver_lote, que guardan una sola vez.
+
+Uso: python benchmark_prestamos.py
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import tempfile
+import time
+
+# El nombre del módulo tiene dos puntos seguidos, así que se carga desde su ruta
+_ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Gestor_Biblioteca_colecciones..py")
+_spec = importlib.util.spec_from_file_location("gestor_biblioteca", _ruta)
+gestor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gestor)
+
+LIBROS = 50_000
+USUARIOS = 5_000
+SOLICITUDES = 20_000
+
+
+def crear_biblioteca():
+    """Crea y guarda en el directorio actual una biblioteca con LIBROS libros y USUARIOS usuarios."""
+    biblioteca = gestor.Biblioteca(cargar_datos=False)
+    for i in range(LIBROS):
+        biblioteca.agregar_libro(gestor.Libro(f"Título {i}", f"Autor {i % 997}", "Novela", f"978{i:010d}"))
+    for u in range(USUARIOS):
+        biblioteca.registrar_usuario(gestor.Usuario(f"Usuario {u}", f"U{u}"))
+    biblioteca.compactar()
+
+
+def generar_solicitudes():
+    """Pares (isbn, id_usuario); los libros se repiten para que haya reservas."""
+    generador = random.Random(19)
+    return [(f"978{generador.randrange(LIBROS // 4):010d}", f"U{generador.randrange(USUARIOS)}")
+            for _ in range(SOLICITUDES)]
+
+
+def de_a_uno(biblioteca, solicitudes):
+    """Una operación y un guardado por solicitud, como en el menú interactivo."""
+    for isbn, id_usuario in solicitudes:
+        if not biblioteca.prestar_libro(isbn, id_usuario):
+            biblioteca.reservar_libro(isbn, id_usuario)
+        biblioteca.guardar_datos()
+    # Las devoluciones que reasignan un libro generan préstamos nuevos: se repite hasta vaciar
+    while biblioteca.prestamos:
+        for isbn, (id_usuario, _) in list(biblioteca.prestamos.items()):
+            biblioteca.devolver_libro(isbn, id_usuario)
+            biblioteca.guardar_datos()
+
+
+def en_lote(biblioteca, solicitudes):
+    """Las solicitudes en un lote y las devoluciones en lotes, con un solo guardado por lote."""
+    biblioteca.prestar_lote(solicitudes, reservar=True)
+    # Las devoluciones que reasignan un libro generan préstamos nuevos: se repite hasta vaciar
+    while biblioteca.prestamos:
+        biblioteca.devolver_lote([(isbn, id_usuario) for isbn, (id_usuario, _) in biblioteca.prestamos.items()])
+
+
+def ejecutar_benchmark():
+    """Mide ambos caminos sobre la misma biblioteca guardada y compara el rendimiento."""
+    solicitudes = generar_solicitudes()
+    print(f"{LIBROS:,} libros, {USUARIOS:,} usuarios, {SOLICITUDES:,} solicitudes de préstamo y sus devoluciones")
+    print(f"{'Camino':>10} | {'Segundos':>8} | {'Solicitudes/s':>13} | {'Prestados al final':>18}")
+    print("-" * 60)
+    for nombre, procesar in [("de a uno", de_a_uno), ("en lote", en_lote)]:
+        with tempfile.TemporaryDirectory() as directorio:
+            directorio_actual = os.getcwd()
+            os.chdir(directorio)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):  # Silenciar los mensajes de guardado
+                    crear_biblioteca()
+                    biblioteca = gestor.Biblioteca()
+                    inicio = time.perf_counter()
+                    procesar(biblioteca, solicitudes)
+                    segundos = time.perf_counter() - inicio
+            finally:
+                os.chdir(directorio_actual)
+        print(f"{nombre:>10} | {segundos:>8.2f} | {SOLICITUDES / segundos:>13.0f} | {len(biblioteca.prestamos):>18}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
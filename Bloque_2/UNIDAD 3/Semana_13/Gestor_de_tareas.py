@@ -2,6 +2,71 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 import uuid
+import os
+import sys
+
+# ListaVirtual es compartida por los gestores de tareas y vive en la raíz del repositorio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+from lista_virtual import ListaVirtual
+
+
+class RepositorioTareas:
+    """
+    Repositorio de tareas indexado por ID.
+    Guarda las tareas en un diccionario (ID -> tarea) que conserva el orden en que se
+    agregaron, así registrar, buscar o eliminar una tarea cuesta O(1) y eliminar k
+    tareas cuesta O(k), sin recorrer las demás.
+    """
+
+    def __init__(self):
+        """Inicializa el repositorio vacío."""
+        self._tareas = {}
+
+    def nuevo_id(self):
+        """
+        Genera un ID corto para una tarea nueva.
+
+        Returns:
+            Los primeros 8 caracteres de un UUID que ninguna tarea usa todavía
+            (con decenas de miles de tareas, dos IDs de 8 caracteres pueden coincidir).
+        """
+        id_tarea = str(uuid.uuid4())[:8]
+        while id_tarea in self._tareas:
+            id_tarea = str(uuid.uuid4())[:8]
+        return id_tarea
+
+    def agregar(self, tarea):
+        """
+        Registra una tarea con su ID.
+
+        Args:
+            tarea: Diccionario con las claves "id", "titulo" y "descripcion".
+        """
+        self._tareas[tarea["id"]] = tarea
+
+    def obtener(self, id_tarea):
+        """Devuelve la tarea con ese ID, o None si no existe."""
+        return self._tareas.get(id_tarea)
+
+    def eliminar(self, ids_tareas):
+        """
+        Elimina varias tareas a la vez en O(k).
+
+        Args:
+            ids_tareas: IDs de las tareas a eliminar; los que no existen se ignoran.
+        """
+        for id_tarea in ids_tareas:
+            self._tareas.pop(id_tarea, None)
+
+    def __contains__(self, id_tarea):
+        return id_tarea in self._tareas
+
+    def __len__(self):
+        return len(self._tareas)
+
+    def __iter__(self):
+        """Recorre las tareas en el orden en que se agregaron."""
+        return iter(self._tareas.values())
 
 
 class GestorTareas:
@@ -33,8 +98,8 @@ class GestorTareas:
         # Crear y configurar el marco principal
         self.crear_widgets()
 
-        # Lista para almacenar las tareas (para futuras funcionalidades)
-        self.tareas = []
+        # Repositorio de tareas indexado por ID (el mismo ID identifica su fila en la tabla)
+        self.tareas = RepositorioTareas()
 
     def crear_widgets(self):
         """Crea y configura todos los widgets de la interfaz."""
@@ -73,11 +138,13 @@ class GestorTareas:
         table_frame = ttk.LabelFrame(self.root, text="Mis Tareas")
         table_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-        # Crear tabla de tareas (Treeview)
-        self.tabla_tareas = ttk.Treeview(
+        # Crear tabla de tareas (lista virtualizada con la interfaz de Treeview y su propia
+        # barra de desplazamiento: solo existen en Tk las filas que entran en pantalla)
+        self.tabla_tareas = ListaVirtual(
             table_frame,
             columns=("id", "titulo", "descripcion"),
-            show="headings"
+            show="headings",
+            selectmode="extended"
         )
 
         # Configurar las columnas
@@ -90,12 +157,11 @@ class GestorTareas:
         self.tabla_tareas.column("titulo", width=200)
         self.tabla_tareas.column("descripcion", width=400)
 
-        # Agregar scrollbar vertical
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tabla_tareas.yview)
-        self.tabla_tareas.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.tabla_tareas.pack(fill="both", expand=True)
 
+        # Atajo de teclado: Supr elimina las tareas seleccionadas
+        self.tabla_tareas.bind("<Delete>", lambda event: self.eliminar_tarea())
+
         # Marco para los botones de gestión de tareas
         manage_frame = ttk.Frame(self.root)
         manage_frame.pack(fill="x", padx=20, pady=10)
@@ -118,13 +184,13 @@ class GestorTareas:
             return
 
         # Generar un ID único para la tarea
-        id_tarea = str(uuid.uuid4())[:8]
+        id_tarea = self.tareas.nuevo_id()
 
-        # Insertar la tarea en la tabla
-        self.tabla_tareas.insert("", tk.END, values=(id_tarea, titulo, descripcion))
+        # Insertar la tarea en la tabla, con su ID como ID de la fila
+        self.tabla_tareas.insert("", tk.END, iid=id_tarea, values=(id_tarea, titulo, descripcion))
 
-        # Guardar la tarea en la lista (para futuras funcionalidades)
-        self.tareas.append({
+        # Registrar la tarea en el repositorio por su ID
+        self.tareas.agregar({
             "id": id_tarea,
             "titulo": titulo,
             "descripcion": descripcion
@@ -140,8 +206,8 @@ class GestorTareas:
         self.descripcion_var.set("")
 
     def eliminar_tarea(self):
-        """Elimina la tarea seleccionada de la tabla."""
-        # Obtener el ítem seleccionado
+        """Elimina las tareas seleccionadas de la tabla y del repositorio."""
+        # Obtener los ítems seleccionados (sus IDs son los de las tareas)
         seleccionado = self.tabla_tareas.selection()
 
         if not seleccionado:
@@ -150,13 +216,11 @@ class GestorTareas:
 
         # Confirmar la eliminación
         if messagebox.askyesno("Confirmar", "¿Estás seguro de eliminar esta tarea?"):
-            # Eliminar de la tabla
-            for item in seleccionado:
-                item_id = self.tabla_tareas.item(item, "values")[0]
-                self.tabla_tareas.delete(item)
+            # Eliminar del repositorio por ID, en O(k) para k tareas seleccionadas
+            self.tareas.eliminar(seleccionado)
 
-                # Eliminar de la lista de tareas (búsqueda por ID)
-                self.tareas = [tarea for tarea in self.tareas if tarea["id"] != item_id]
+            # Eliminar de la tabla en una sola llamada
+            self.tabla_tareas.delete(*seleccionado)
 
             messagebox.showinfo("Éxito", "Tarea(s) eliminada(s) correctamente.")
 
@@ -0,0 +1,163 @@
+"""
+Benchmark de "seleccionar todo y eliminar" en GestorTareas (Semana 13).
+Compara la versión anterior, que por cada tarea seleccionada reconstruía la lista de
+tareas completa y borraba su fila de la tabla de a una (O(k·n)), contra el repositorio
+indexado por ID, que elimina las k tareas en O(k) y borra las filas en una sola llamada.
+Usa la ListaVirtual real con su tabla interna simulada y diálogos simulados, así se
+puede ejecutar sin pantalla y se mide el trabajo de la aplicación y no el del dibujo de Tk.
+
+Uso: python benchmark_eliminar.py
+"""
+import time
+
+import Gestor_de_tareas as gestor
+
+TAMANOS = [1_000, 10_000, 50_000]
+
+
+class TreeviewSimulado:
+    """Imitación en memoria de la tabla interna de ListaVirtual (solo las filas del grupo)."""
+
+    def __init__(self):
+        self.filas = {}
+        self.hijos = []
+        self.seleccion = ()
+        self.contador = 0
+
+    def insert(self, padre, indice):
+        self.contador += 1
+        fila = f"I{self.contador:03X}"
+        self.filas[fila] = {}
+        self.hijos.append(fila)
+        return fila
+
+    def delete(self, *filas):
+        for fila in filas:
+            del self.filas[fila]
+            if fila in self.hijos:
+                self.hijos.remove(fila)
+
+    def detach(self, *filas):
+        for fila in filas:
+            self.hijos.remove(fila)
+
+    def move(self, fila, padre, indice):
+        self.hijos.insert(indice, fila)
+
+    def item(self, fila, **opciones):
+        self.filas[fila].update(opciones)
+
+    def selection_set(self, filas):
+        self.seleccion = tuple(filas)
+
+    def bbox(self, fila):
+        return ""
+
+
+class BarraSimulada:
+    def set(self, primero, ultimo):
+        pass
+
+
+class ListaSinPantalla(gestor.ListaVirtual):
+    """ListaVirtual real con la tabla interna y la barra simuladas, que dibuja en cada cambio."""
+
+    def __init__(self):
+        self._arbol = TreeviewSimulado()
+        self._barra = BarraSimulada()
+        self._iniciar("extended", 20)
+
+    def after_idle(self, funcion):
+        funcion()
+
+
+class VariableSimulada:
+    """Imitación de tk.StringVar."""
+
+    def __init__(self):
+        self.valor = ""
+
+    def get(self):
+        return self.valor
+
+    def set(self, valor):
+        self.valor = valor
+
+
+class MensajesSimulados:
+    """Imitación de messagebox: no muestra nada y confirma siempre."""
+
+    @staticmethod
+    def showinfo(titulo, mensaje):
+        pass
+
+    showwarning = showerror = showinfo
+
+    @staticmethod
+    def askyesno(titulo, mensaje):
+        return True
+
+
+class GestorTareasAnterior:
+    """Versión anterior: lista de tareas reconstruida por cada tarea eliminada."""
+
+    def __init__(self):
+        self.tabla_tareas = ListaSinPantalla()
+        self.tareas = []
+
+    def agregar(self, id_tarea, titulo, descripcion):
+        self.tabla_tareas.insert("", "end", values=(id_tarea, titulo, descripcion))
+        self.tareas.append({"id": id_tarea, "titulo": titulo, "descripcion": descripcion})
+
+    def eliminar_tarea(self):
+        seleccionado = self.tabla_tareas.selection()
+        for item in seleccionado:
+            item_id = self.tabla_tareas.item(item, "values")[0]
+            self.tabla_tareas.delete(item)
+            self.tareas = [tarea for tarea in self.tareas if tarea["id"] != item_id]
+
+
+def crear_actual():
+    """GestorTareas real sin ventana: se reemplazan los widgets por los simulados."""
+    app = gestor.GestorTareas.__new__(gestor.GestorTareas)
+    app.titulo_var = VariableSimulada()
+    app.descripcion_var = VariableSimulada()
+    app.tabla_tareas = ListaSinPantalla()
+    app.tareas = gestor.RepositorioTareas()
+    return app
+
+
+def llenar(app, tamano):
+    """Agrega `tamano` tareas por el mismo camino que el botón "Agregar Tarea"."""
+    for i in range(tamano):
+        if isinstance(app, GestorTareasAnterior):
+            app.agregar(f"{i:08x}", f"Tarea {i}", f"Descripción de la tarea {i}")
+        else:
+            app.titulo_var.set(f"Tarea {i}")
+            app.descripcion_var.set(f"Descripción de la tarea {i}")
+            app.agregar_tarea()
+
+
+def seleccionar_todo_y_eliminar(app):
+    """Selecciona todas las filas, elimina y devuelve los milisegundos que tomó."""
+    inicio = time.perf_counter()
+    app.tabla_tareas.selection_set(app.tabla_tareas.get_children())
+    app.eliminar_tarea()
+    milisegundos = (time.perf_counter() - inicio) * 1000
+    assert not app.tabla_tareas.get_children() and not len(app.tareas)
+    return milisegundos
+
+
+def ejecutar_benchmark():
+    """Mide ambas versiones con cada cantidad de tareas."""
+    gestor.messagebox = MensajesSimulados
+    print(f"{'Tareas':>7} | {'Versión':>8} | {'seleccionar todo y eliminar ms':>30}")
+    print("-" * 52)
+    for tamano in TAMANOS:
+        for nombre, app in [("anterior", GestorTareasAnterior()), ("actual", crear_actual())]:
+            llenar(app, tamano)
+            print(f"{tamano:>7} | {nombre:>8} | {seleccionar_todo_y_eliminar(app):>30.1f}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
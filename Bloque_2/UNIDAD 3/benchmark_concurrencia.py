@@ -0,0 +1,72 @@
+"""
+Benchmark de concurrencia del inventario de la Semana 9.
+Varias cajas (hilos) venden al mismo tiempo sobre un Inventario(concurrente=True) y una
+Caja compartidos. Se piden más unidades de las que hay en stock, y al final se comprueba
+que no se vendió de más y que el dinero en caja coincide con lo vendido.
+
+Uso: python benchmark_concurrencia.py
+"""
+import contextlib
+import io
+import random
+import threading
+import time
+
+from Semana9_Inventario import Caja, Inventario, Producto
+
+CAJAS = [1, 2, 4, 8, 16, 32]
+PRODUCTOS = 1_000
+STOCK_POR_PRODUCTO = 50
+INTENTOS_TOTALES = 100_000  # Mayor que el stock total (50k unidades) para agotar productos
+
+
+def ejecutar_ronda(numero_cajas):
+    """Ejecuta una ronda con `numero_cajas` hilos y devuelve (segundos, ventas, errores)."""
+    inventario = Inventario(concurrente=True)
+    caja = Caja()
+    for i in range(PRODUCTOS):
+        inventario.anadir_producto(Producto(str(i), f"Producto {i}", STOCK_POR_PRODUCTO, 1.0))
+    ventas = [0] * numero_cajas
+
+    def terminal(numero):
+        generador = random.Random(numero)
+        for _ in range(INTENTOS_TOTALES // numero_cajas):
+            total = inventario.vender_producto(str(generador.randrange(PRODUCTOS)), 1)
+            if total > 0:
+                caja.agregar_dinero(total)
+                ventas[numero] += 1
+
+    hilos = [threading.Thread(target=terminal, args=(n,)) for n in range(numero_cajas)]
+    with contextlib.redirect_stdout(io.StringIO()):  # Silenciar los avisos de stock insuficiente
+        inicio = time.perf_counter()
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        segundos = time.perf_counter() - inicio
+
+    # Comprobaciones: ningún stock negativo, unidades descontadas == vendidas == dinero en caja
+    restante = 0
+    errores = 0
+    for i in range(PRODUCTOS):
+        cantidad = inventario._productos.obtener(str(i)).get_cantidad()
+        errores += cantidad < 0
+        restante += cantidad
+    vendidas = sum(ventas)
+    errores += (PRODUCTOS * STOCK_POR_PRODUCTO - restante) != vendidas
+    errores += caja.get_dinero() != vendidas * 1.0
+    return segundos, vendidas, errores
+
+
+def ejecutar_benchmark():
+    """Ejecuta una ronda por cada número de cajas e imprime una tabla de resultados."""
+    print(f"{'Cajas':>5} | {'Segundos':>8} | {'Intentos/s':>10} | {'Vendidas':>8} | {'Errores':>7}")
+    print("-" * 52)
+    for numero_cajas in CAJAS:
+        segundos, vendidas, errores = ejecutar_ronda(numero_cajas)
+        intentos = INTENTOS_TOTALES // numero_cajas * numero_cajas
+        print(f"{numero_cajas:>5} | {segundos:>8.3f} | {intentos / segundos:>10.0f} | {vendidas:>8} | {errores:>7}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
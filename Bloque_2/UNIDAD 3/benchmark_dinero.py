@@ -0,0 +1,71 @@
+"""
+Benchmark del manejo de dinero de la Caja de la Semana 9.
+Suma los mismos importes de venta (precio * cantidad) con tres representaciones:
+float acumulado con +=, Decimal, y centavos enteros (Caja.agregar_dinero y Caja.agregar_lote),
+y muestra el tiempo de cada una y cuánto se aleja el resultado del total exacto.
+
+Uso: python benchmark_dinero.py
+"""
+import random
+import time
+from decimal import Decimal
+
+from Semana9_Inventario import Caja, a_centavos
+
+VENTAS = 1_000_000
+
+
+def generar_ventas():
+    """Devuelve VENTAS pares (precio, cantidad) con precios de dos decimales."""
+    generador = random.Random(10)
+    return [(generador.randrange(1, 100_000) / 100, generador.randrange(1, 10)) for _ in range(VENTAS)]
+
+
+def con_float(ventas):
+    total = 0.0
+    for precio, cantidad in ventas:
+        total += precio * cantidad
+    return total
+
+
+def con_decimal(ventas):
+    total = Decimal(0)
+    for precio, cantidad in ventas:
+        total += Decimal(str(precio)) * cantidad
+    return total
+
+
+def con_centavos(ventas):
+    caja = Caja()
+    for precio, cantidad in ventas:
+        caja.agregar_dinero(precio * cantidad)
+    return caja.get_centavos()
+
+
+def con_centavos_lote(ventas):
+    caja = Caja()
+    caja.agregar_lote(precio * cantidad for precio, cantidad in ventas)
+    return caja.get_centavos()
+
+
+def ejecutar_benchmark():
+    """Mide cada representación e imprime el tiempo y la diferencia con el total exacto."""
+    ventas = generar_ventas()
+    exacto = sum(a_centavos(precio) * cantidad for precio, cantidad in ventas)
+    print(f"Suma de {VENTAS:,} importes de venta (total exacto: {exacto / 100:.2f})")
+    print(f"{'Modo':>24} | {'Segundos':>8} | {'Diferencia (centavos)':>21}")
+    print("-" * 60)
+    for nombre, sumar, a_centavos_resultado in [
+            ("float +=", con_float, lambda total: total * 100),
+            ("Decimal", con_decimal, lambda total: total * 100),
+            ("centavos (uno a uno)", con_centavos, lambda total: total),
+            ("centavos (agregar_lote)", con_centavos_lote, lambda total: total)]:
+        inicio = time.perf_counter()
+        total = sumar(ventas)
+        segundos = time.perf_counter() - inicio
+        diferencia = float(a_centavos_resultado(total) - exacto)
+        print(f"{nombre:>24} | {segundos:>8.3f} | {diferencia:>21.6f}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
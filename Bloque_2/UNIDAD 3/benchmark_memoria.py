@@ -0,0 +1,63 @@
+"""
+Benchmark de memoria por producto del inventario de la Semana 9.
+Compara un Producto con __dict__ (la representación anterior), el Producto con
+__slots__ y el AlmacenColumnar, midiendo con tracemalloc los bytes por producto
+del almacén completo (incluido el índice por ID, sin el índice de búsqueda por nombre).
+
+Uso: python benchmark_memoria.py
+"""
+import tracemalloc
+
+from Semana9_Inventario import AlmacenColumnar, AlmacenProductos, Producto
+
+TAMANO = 1_000_000
+
+
+class ProductoConDict:
+    """Representación anterior de Producto: atributos en el __dict__ de cada instancia."""
+
+    def __init__(self, id_producto, nombre, cantidad, precio):
+        self._id = id_producto
+        self._nombre = nombre
+        self._cantidad = cantidad
+        self._precio = precio
+
+    def get_id(self):
+        return self._id
+
+    def get_nombre(self):
+        return self._nombre
+
+    def get_cantidad(self):
+        return self._cantidad
+
+    def get_precio(self):
+        return self._precio
+
+
+def medir(crear_almacen, clase_producto):
+    """Llena un almacén con TAMANO productos y devuelve los bytes por producto."""
+    # Los IDs y nombres se crean antes de medir: son iguales en todas las representaciones
+    ids = [str(i) for i in range(TAMANO)]
+    nombres = [f"Producto {i}" for i in range(TAMANO)]
+    tracemalloc.start()
+    almacen = crear_almacen()
+    for i in range(TAMANO):
+        almacen.agregar(clase_producto(ids[i], nombres[i], i % 500 + 1000, 1.5 + i))
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memoria / TAMANO
+
+
+def ejecutar_benchmark():
+    """Mide cada representación e imprime los bytes por producto."""
+    print(f"Memoria por producto con {TAMANO:,} productos (incluye el índice por ID)")
+    print("-" * 56)
+    for nombre, almacen, clase in [("Producto con __dict__", AlmacenProductos, ProductoConDict),
+                                   ("Producto con __slots__", AlmacenProductos, Producto),
+                                   ("AlmacenColumnar", AlmacenColumnar, Producto)]:
+        print(f"{nombre:<24} {medir(almacen, clase):>8.1f} bytes/producto")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
@@ -0,0 +1,44 @@
+"""
+Benchmark del inventario de la Semana 9.
+Mide el costo promedio de añadir, actualizar, vender y eliminar productos
+a medida que el catálogo crece de 1k a 1M de productos.
+
+Uso: python benchmark_semana9.py
+"""
+import random
+import time
+
+from Semana9_Inventario import Inventario, Producto
+
+TAMANOS = [1_000, 10_000, 100_000, 1_000_000]
+OPERACIONES = 10_000  # Operaciones medidas por tamaño
+
+
+def medir(funcion, argumentos):
+    """Ejecuta la función con cada argumento y devuelve los microsegundos promedio por llamada."""
+    inicio = time.perf_counter()
+    for args in argumentos:
+        funcion(*args)
+    return (time.perf_counter() - inicio) / len(argumentos) * 1_000_000
+
+
+def ejecutar_benchmark():
+    """Ejecuta el benchmark para cada tamaño de catálogo e imprime una tabla de resultados."""
+    print(f"{'Productos':>10} | {'añadir':>9} | {'actualizar':>10} | {'vender':>9} | {'eliminar':>9}  (µs/op)")
+    print("-" * 62)
+    for tamano in TAMANOS:
+        inventario = Inventario()
+        productos = [Producto(str(i), f"Producto {i}", 1_000, 1.5) for i in range(tamano)]
+        t_anadir = medir(inventario.anadir_producto, [(p,) for p in productos])
+
+        ids = [str(random.randrange(tamano)) for _ in range(OPERACIONES)]
+        t_actualizar = medir(inventario.actualizar_producto, [(i, 500, 2.0) for i in ids])
+        t_vender = medir(inventario.vender_producto, [(i, 1) for i in ids])
+        a_eliminar = random.sample(range(tamano), min(OPERACIONES, tamano))
+        t_eliminar = medir(inventario.eliminar_producto, [(str(i),) for i in a_eliminar])
+
+        print(f"{tamano:>10} | {t_anadir:>9.3f} | {t_actualizar:>10.3f} | {t_vender:>9.3f} | {t_eliminar:>9.3f}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
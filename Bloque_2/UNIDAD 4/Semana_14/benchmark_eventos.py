@@ -0,0 +1,103 @@
+"""
+Benchmark del guardado de eventos del gestor de calendario (Semana 14).
+Compara el guardado anterior, que por cada evento nuevo leía y analizaba eventos.json
+completo y lo reescribía con indent=4, contra AlmacenEventos, que añade una línea al
+diario JSON Lines y compacta de vez en cuando.
+Primero mide cuánto tarda agregar un evento cuando ya hay 1k, 10k y 100k guardados;
+después inserta 100k eventos con AlmacenEventos y mide el total, el peor evento (el que
+dispara una compactación) y la carga de los 100k eventos al iniciar.
+El guardado anterior no se ejecuta para los 100k eventos completos: es O(n) por evento.
+
+Uso: python benchmark_eventos.py
+"""
+import json
+import os
+import tempfile
+import time
+
+from gestor_calendario import AlmacenEventos, escribir_json_atomico
+
+TAMANOS = [1_000, 10_000, 100_000]
+EVENTOS = 100_000
+MEDIDOS = 20  # Eventos agregados para medir el tiempo por evento
+
+
+def crear_evento(id_evento):
+    return {
+        "id": id_evento,
+        "fecha": f"{id_evento % 28 + 1:02d}/{id_evento % 12 + 1:02d}/2025",
+        "hora": f"{id_evento % 24:02d}:{id_evento % 60:02d}",
+        "descripcion": f"Reunión de seguimiento número {id_evento}"
+    }
+
+
+def guardar_anterior(evento, ruta):
+    """Guardado anterior: leer todos los eventos, añadir uno y reescribir el archivo."""
+    try:
+        with open(ruta, "r") as archivo:
+            eventos = json.load(archivo)
+    except (FileNotFoundError, json.JSONDecodeError):
+        eventos = []
+    eventos.append(evento)
+    with open(ruta, "w") as archivo:
+        json.dump(eventos, archivo, indent=4)
+
+
+def ms_por_evento(directorio, tamano):
+    """Milisegundos promedio por evento nuevo con `tamano` eventos ya guardados, con cada versión."""
+    ruta_anterior = os.path.join(directorio, f"anterior_{tamano}.json")
+    ruta_actual = os.path.join(directorio, f"actual_{tamano}.json")
+    guardados = [crear_evento(i) for i in range(1, tamano + 1)]
+    escribir_json_atomico(ruta_anterior, guardados)
+    escribir_json_atomico(ruta_actual, guardados)
+
+    inicio = time.perf_counter()
+    for id_evento in range(tamano + 1, tamano + MEDIDOS + 1):
+        guardar_anterior(crear_evento(id_evento), ruta_anterior)
+    anterior = (time.perf_counter() - inicio) / MEDIDOS * 1000
+
+    almacen = AlmacenEventos(ruta_actual, ruta_actual + ".log")
+    almacen.cargar()
+    inicio = time.perf_counter()
+    for id_evento in range(tamano + 1, tamano + MEDIDOS + 1):
+        almacen.agregar(crear_evento(id_evento))
+    actual = (time.perf_counter() - inicio) / MEDIDOS * 1000
+    return anterior, actual
+
+
+def insertar_todos(directorio):
+    """Inserta EVENTOS eventos con AlmacenEventos; devuelve (segundos, peor ms, carga s)."""
+    ruta = os.path.join(directorio, "eventos.json")
+    almacen = AlmacenEventos(ruta, os.path.join(directorio, "eventos.log"))
+    almacen.cargar()
+    peor = 0
+    inicio = time.perf_counter()
+    for id_evento in range(1, EVENTOS + 1):
+        antes = time.perf_counter()
+        almacen.agregar(crear_evento(id_evento))
+        peor = max(peor, time.perf_counter() - antes)
+    total = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    cargados = AlmacenEventos(ruta, os.path.join(directorio, "eventos.log")).cargar()
+    carga = time.perf_counter() - inicio
+    assert [evento["id"] for evento in cargados] == list(range(1, EVENTOS + 1))
+    return total, peor * 1000, carga
+
+
+def ejecutar_benchmark():
+    """Mide el costo por evento de ambas versiones y la inserción de EVENTOS eventos."""
+    with tempfile.TemporaryDirectory() as directorio:
+        print(f"{'Guardados':>9} | {'anterior ms/evento':>18} | {'actual ms/evento':>16}")
+        print("-" * 50)
+        for tamano in TAMANOS:
+            anterior, actual = ms_por_evento(directorio, tamano)
+            print(f"{tamano:>9} | {anterior:>18.2f} | {actual:>16.3f}")
+
+        total, peor, carga = insertar_todos(directorio)
+        print(f"\n{EVENTOS:,} eventos con AlmacenEventos: {total:.2f} s ({EVENTOS / total:,.0f} eventos/s), "
+              f"peor evento {peor:.1f} ms, carga al iniciar {carga:.2f} s")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
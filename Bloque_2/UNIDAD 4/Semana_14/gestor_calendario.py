@@ -3,6 +3,218 @@ from tkinter import ttk, messagebox
 from tkcalendar import DateEntry  # Módulo para DatePicker
 import datetime
 import json  # Módulo para trabajar con archivos JSON
+import os
+from collections import Counter
+
+
+def escribir_json_atomico(ruta, datos):
+    """
+    Escribe `datos` como JSON en `ruta` sin riesgo de dejar el archivo truncado:
+    escribe en un archivo temporal, lo sincroniza y lo renombra sobre `ruta`.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=4)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+class AlmacenEventos:
+    """
+    Almacén persistente de eventos: un snapshot JSON con la lista de eventos más un
+    diario en formato JSON Lines, donde cada evento nuevo (o eliminado) añade una línea.
+    Agregar un evento cuesta O(1); el snapshot se reescribe (compacta) cuando el diario
+    tiene tantos registros como eventos había en el snapshot, así el costo de compactar
+    se reparte y sigue siendo O(1) amortizado por evento.
+    """
+
+    UMBRAL_COMPACTACION = 1000  # Registros mínimos del diario antes de reescribir el snapshot
+    CAMPOS_EVENTO = ("fecha", "hora", "descripcion")
+
+    def __init__(self, archivo_eventos="eventos.json", archivo_diario="eventos.log"):
+        """
+        Inicializa el almacén vacío; los eventos guardados se leen con cargar().
+
+        Args:
+            archivo_eventos: Ruta del snapshot JSON con la lista de eventos.
+            archivo_diario: Ruta del diario JSON Lines.
+        """
+        self.archivo_eventos = archivo_eventos
+        self.archivo_diario = archivo_diario
+        self.eventos = {}  # ID -> evento, en el orden en que se agregaron
+        self._registros_diario = 0
+        self._eventos_snapshot = 0  # Eventos escritos en el snapshot la última vez
+        self._cargado = False  # No se escribe nada hasta haber leído lo guardado
+        self._ultimo_id = 0  # Mayor ID visto, incluidos los de registros descartados
+        # False si el snapshot tenía registros que no se pudieron leer: entonces no se
+        # reescribe, para no perderlos, y los cambios siguen yendo al diario
+        self.snapshot_completo = True
+        self.advertencias = []  # Problemas encontrados en la última carga, para mostrarlos al usuario
+
+    def cargar(self):
+        """
+        Lee el snapshot y le aplica los registros del diario, en orden.
+        Los registros mal formados se descartan y se anotan en `advertencias` en lugar
+        de interrumpir la carga.
+
+        Returns:
+            La lista de eventos guardados.
+        """
+        self.advertencias = []
+        guardados = self._leer_snapshot()
+        self._eventos_snapshot = len(guardados)
+
+        # Las versiones anteriores reiniciaban los IDs en cada ejecución: los repetidos se renumeran
+        repetidos = []
+        for evento in guardados:
+            if not self._es_evento(evento):
+                self.advertencias.append("Se descartó un evento mal formado de eventos.json.")
+                self.snapshot_completo = False
+                self._anotar_id(evento)
+            elif not isinstance(evento.get("id"), int) or evento["id"] in self.eventos:
+                repetidos.append(evento)
+            else:
+                self.eventos[evento["id"]] = evento
+                self._anotar_id(evento)
+        for id_evento, evento in enumerate(repetidos, start=self.siguiente_id()):
+            evento["id"] = id_evento
+            self.eventos[id_evento] = evento
+            self._ultimo_id = id_evento
+
+        self._reproducir_diario()
+        self._cargado = True
+        if repetidos:
+            self.compactar()
+        return list(self.eventos.values())
+
+    def _leer_snapshot(self):
+        """Devuelve la lista de eventos del snapshot (vacía si no existe o está vacío)."""
+        try:
+            with open(self.archivo_eventos, "r", encoding="utf-8") as archivo:
+                contenido = archivo.read()
+        except FileNotFoundError:
+            return []
+        if not contenido.strip():
+            return []
+        try:
+            guardados = json.loads(contenido)
+        except json.JSONDecodeError:
+            guardados = None
+        if not isinstance(guardados, list):
+            self.advertencias.append("No se pudo leer eventos.json; no se reescribirá hasta revisarlo.")
+            self.snapshot_completo = False
+            return []
+        return guardados
+
+    @classmethod
+    def _es_evento(cls, registro):
+        """Indica si el registro tiene los campos de un evento."""
+        return isinstance(registro, dict) and all(isinstance(registro.get(campo), str)
+                                                  for campo in cls.CAMPOS_EVENTO)
+
+    def _anotar_id(self, registro):
+        """Recuerda el ID del registro para no volver a usarlo en un evento nuevo."""
+        if isinstance(registro, dict) and isinstance(registro.get("id"), int):
+            self._ultimo_id = max(self._ultimo_id, registro["id"])
+
+    def _reproducir_diario(self):
+        """
+        Aplica los registros del diario sobre los eventos del snapshot.
+        Una última línea sin salto de línea que no se puede leer es una escritura
+        interrumpida: se descarta y se recorta del archivo. Cualquier otro registro
+        ilegible se salta con una advertencia, sin tocar los que le siguen.
+        """
+        if not os.path.exists(self.archivo_diario):
+            return
+        with open(self.archivo_diario, "rb+") as archivo:
+            posicion = 0
+            linea = b"\n"
+            for linea in archivo:
+                inicio_linea = posicion
+                posicion += len(linea)
+                try:
+                    registro = json.loads(linea)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    registro = None
+                if isinstance(registro, dict) and isinstance(registro.get("id"), int):
+                    if registro.get("eliminado"):
+                        self.eventos.pop(registro["id"], None)
+                    elif self._es_evento(registro):
+                        self.eventos[registro["id"]] = registro
+                    else:
+                        self.advertencias.append("Se descartó un registro mal formado del diario de eventos.")
+                        continue
+                    self._anotar_id(registro)
+                    self._registros_diario += 1
+                elif not linea.endswith(b"\n"):
+                    self.advertencias.append("Se descartó un registro incompleto al final del diario de eventos.")
+                    archivo.truncate(inicio_linea)
+                    return
+                else:
+                    self.advertencias.append("Se descartó un registro ilegible del diario de eventos.")
+            # Sin salto de línea al final, el próximo registro quedaría pegado al último
+            if not linea.endswith(b"\n"):
+                archivo.seek(0, os.SEEK_END)
+                archivo.write(b"\n")
+
+    def siguiente_id(self):
+        """Devuelve el ID que le corresponde al próximo evento."""
+        return max(max(self.eventos, default=0), self._ultimo_id) + 1
+
+    def agregar(self, evento):
+        """
+        Guarda un evento nuevo añadiendo una línea al diario.
+
+        Args:
+            evento: Diccionario con las claves "id", "fecha", "hora" y "descripcion".
+        """
+        self._comprobar_cargado()
+        self.eventos[evento["id"]] = evento
+        self._ultimo_id = max(self._ultimo_id, evento["id"])
+        self._escribir_diario([evento])
+
+    def eliminar(self, ids_eventos):
+        """
+        Elimina varios eventos añadiendo al diario un registro de baja por cada uno.
+
+        Args:
+            ids_eventos: IDs de los eventos a eliminar.
+        """
+        self._comprobar_cargado()
+        ids_eventos = [id_evento for id_evento in ids_eventos if self.eventos.pop(id_evento, None)]
+        if ids_eventos:
+            self._escribir_diario([{"id": id_evento, "eliminado": True} for id_evento in ids_eventos])
+
+    def _comprobar_cargado(self):
+        """Impide escribir antes de cargar lo guardado, que podría pisar eventos existentes."""
+        if not self._cargado:
+            raise RuntimeError("Los eventos guardados no se cargaron; no se puede escribir en el almacén.")
+
+    def _escribir_diario(self, registros):
+        """Añade los registros al final del diario y compacta cuando el diario ya es muy largo."""
+        with open(self.archivo_diario, "a", encoding="utf-8") as archivo:
+            archivo.write("".join(json.dumps(registro, ensure_ascii=False) + "\n" for registro in registros))
+        self._registros_diario += len(registros)
+        if self._registros_diario >= max(self.UMBRAL_COMPACTACION, self._eventos_snapshot):
+            self.compactar()
+
+    def compactar(self):
+        """
+        Reescribe el snapshot con todos los eventos y vacía el diario.
+        No hace nada si la carga no terminó o si el snapshot tenía registros ilegibles.
+
+        Returns:
+            True si se reescribió el snapshot.
+        """
+        if not self._cargado or not self.snapshot_completo:
+            return False
+        escribir_json_atomico(self.archivo_eventos, list(self.eventos.values()))
+        # El diario se vacía solo después de escribir el snapshot
+        open(self.archivo_diario, "w", encoding="utf-8").close()
+        self._registros_diario = 0
+        self._eventos_snapshot = len(self.eventos)
+        return True
 
 
 class AplicacionGestionEventos:
@@ -39,6 +251,13 @@ class AplicacionGestionEventos:
         # Inicializar con la fecha y hora actuales
         self.inicializar_valores_predeterminados()
 
+        # Cargar los eventos guardados en la lista
+        self.almacen = AlmacenEventos()
+        self.cargar_eventos()
+
+        # Compactar el almacén al cerrar la ventana
+        self.root.protocol("WM_DELETE_WINDOW", self.salir)
+
     def crear_frames(self):
         """Crea los frames para organizar la interfaz."""
         # Frame para la lista de eventos
@@ -132,7 +351,7 @@ class AplicacionGestionEventos:
         self.btn_eliminar.pack(side="left", padx=5, pady=5)
 
         # Botón para salir
-        self.btn_salir = ttk.Button(self.frame_acciones, text="Salir", command=self.root.destroy)
+        self.btn_salir = ttk.Button(self.frame_acciones, text="Salir", command=self.salir)
         self.btn_salir.pack(side="right", padx=5, pady=5)
 
     def inicializar_valores_predeterminados(self):
@@ -148,6 +367,33 @@ class AplicacionGestionEventos:
         # Contador para los IDs de los eventos
         self.contador_id = 1
 
+    def cargar_eventos(self):
+        """Carga los eventos guardados en el TreeView y continúa la numeración de IDs."""
+        try:
+            eventos = self.almacen.cargar()
+        except OSError as e:
+            # El almacén queda sin cargar y no escribe nada, así no se pisan los eventos guardados
+            messagebox.showerror("Error", f"No se pudieron cargar los eventos guardados: {e}")
+            return
+
+        for evento in eventos:
+            self.tree.insert("", "end", iid=str(evento["id"]),
+                             values=(evento["id"], evento["fecha"], evento["hora"], evento["descripcion"]))
+        self.contador_id = self.almacen.siguiente_id()
+
+        # Las advertencias de la carga se muestran juntas, una vez que la ventana está en pantalla
+        if self.almacen.advertencias:
+            self.root.after_idle(self.mostrar_advertencias_carga)
+
+    def mostrar_advertencias_carga(self):
+        """Muestra en un solo mensaje los problemas encontrados al cargar los eventos guardados."""
+        lineas = [mensaje if veces == 1 else f"{mensaje} ({veces} veces)"
+                  for mensaje, veces in Counter(self.almacen.advertencias).items()]
+        if not self.almacen.snapshot_completo:
+            lineas.append("Los cambios se guardarán sin reescribir eventos.json.")
+        messagebox.showwarning("Advertencia",
+                               "Algunos eventos guardados no se pudieron leer:\n\n" + "\n".join(lineas))
+
     def agregar_evento(self):
         """Agrega un nuevo evento a la lista y lo guarda en un archivo JSON."""
         # Obtener valores de los campos
@@ -160,8 +406,8 @@ class AplicacionGestionEventos:
             messagebox.showerror("Error", "La descripción no puede estar vacía.")
             return
 
-        # Insertar evento en el TreeView
-        self.tree.insert("", "end", values=(self.contador_id, fecha, hora, descripcion))
+        # Insertar evento en el TreeView (el ID del ítem es el del evento)
+        self.tree.insert("", "end", iid=str(self.contador_id), values=(self.contador_id, fecha, hora, descripcion))
 
         # Guardar evento en un archivo JSON
         self.guardar_evento_json(self.contador_id, fecha, hora, descripcion)
@@ -176,27 +422,17 @@ class AplicacionGestionEventos:
         messagebox.showinfo("Éxito", "Evento agregado correctamente.")
 
     def guardar_evento_json(self, id_evento, fecha, hora, descripcion):
-        """Guarda el evento en un archivo JSON."""
+        """Guarda el evento añadiendo una línea al diario del almacén, sin reescribir los demás."""
         evento = {
             "id": id_evento,
             "fecha": fecha,
             "hora": hora,
             "descripcion": descripcion
         }
-
-        # Intentar abrir el archivo JSON existente y cargar los eventos
         try:
-            with open("eventos.json", "r") as archivo:
-                eventos = json.load(archivo)
-        except (FileNotFoundError, json.JSONDecodeError):
-            eventos = []  # Si el archivo no existe o está vacío, inicializar lista vacía
-
-        # Añadir el nuevo evento a la lista
-        eventos.append(evento)
-
-        # Guardar la lista actualizada de eventos en el archivo JSON
-        with open("eventos.json", "w") as archivo:
-            json.dump(eventos, archivo, indent=4)
+            self.almacen.agregar(evento)
+        except (OSError, RuntimeError) as e:
+            messagebox.showerror("Error", f"No se pudo guardar el evento: {e}")
 
     def eliminar_evento(self):
         """Elimina el evento seleccionado de la lista."""
@@ -209,12 +445,24 @@ class AplicacionGestionEventos:
 
         # Solicitar confirmación
         if messagebox.askyesno("Confirmar eliminación", "¿Está seguro que desea eliminar el evento seleccionado?"):
-            # Eliminar evento seleccionado
-            for item in seleccionado:
-                self.tree.delete(item)
+            # Eliminar los eventos seleccionados de la lista y del almacén
+            self.tree.delete(*seleccionado)
+            try:
+                self.almacen.eliminar([int(item) for item in seleccionado])
+            except (OSError, RuntimeError) as e:
+                messagebox.showerror("Error", f"No se pudo guardar la eliminación: {e}")
+                return
 
             messagebox.showinfo("Éxito", "Evento eliminado correctamente.")
 
+    def salir(self):
+        """Compacta el almacén de eventos y cierra la aplicación."""
+        try:
+            self.almacen.compactar()
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudieron guardar los eventos: {e}")
+        self.root.destroy()
+
 
 def main():
     """Función principal que inicia la aplicación."""
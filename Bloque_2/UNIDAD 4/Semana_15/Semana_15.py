@@ -1,6 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+import os
+import sys
+
+# ListaVirtual es compartida por los gestores de tareas y vive en la raíz del repositorio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+from lista_virtual import ListaVirtual
 
 
 class TaskManagerApp:
@@ -21,8 +27,9 @@ class TaskManagerApp:
         self.root.geometry("500x400")
         self.root.resizable(True, True)
 
-        # Lista para almacenar las tareas (tuplas de (tarea, completada))
-        self.tasks = []
+        # Tareas por ID de ítem de la lista: ID -> (tarea, completada), en el orden de la lista.
+        # Con el ID de la selección se llega a la tarea en O(1), sin buscar su posición
+        self.tasks = {}
 
         # Configuración de la interfaz
         self._setup_ui()
@@ -51,18 +58,10 @@ class TaskManagerApp:
         # Botón para añadir tareas
         ttk.Button(input_frame, text="Añadir Tarea", command=self.add_task).pack(side=tk.LEFT)
 
-        # Frame para la lista de tareas y su barra de desplazamiento
-        list_frame = ttk.Frame(main_frame)
-        list_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Barra de desplazamiento para la lista de tareas
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Lista de tareas (Treeview para mejor visualización)
+        # Lista de tareas virtualizada (con su propia barra de desplazamiento): solo
+        # existen en Tk las filas visibles, aunque haya decenas de miles de tareas
         columns = ("tarea", "estado")
-        self.task_list = ttk.Treeview(list_frame, columns=columns, show="headings",
-                                      yscrollcommand=scrollbar.set, selectmode="browse")
+        self.task_list = ListaVirtual(main_frame, columns=columns, show="headings", selectmode="extended")
 
         # Configurar las columnas
         self.task_list.heading("tarea", text="Tarea")
@@ -70,20 +69,27 @@ class TaskManagerApp:
         self.task_list.column("tarea", width=350)
         self.task_list.column("estado", width=100, anchor=tk.CENTER)
 
-        self.task_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.task_list.yview)
+        # Estilo visual para tareas completadas
+        self.task_list.tag_configure("completada", foreground="gray")
+
+        self.task_list.pack(fill=tk.BOTH, expand=True)
 
         # Vinculación de doble clic para marcar/desmarcar tarea como completada
         self.task_list.bind("<Double-1>", self.toggle_task_status)
 
+        # Atajos de teclado sobre la lista: Espacio alterna el estado y Supr elimina
+        # (con Ctrl o Shift se seleccionan varias tareas y se aplican en un solo lote)
+        self.task_list.bind("<space>", self.toggle_task_status)
+        self.task_list.bind("<Delete>", lambda event: self.delete_task())
+
         # Frame para botones de acción
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
         # Botones para marcar como completada y eliminar tarea
-        ttk.Button(button_frame, text="Marcar como Completada",
+        ttk.Button(button_frame, text="Marcar como Completadas",
                    command=self.mark_task_completed).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="Eliminar Tarea",
+        ttk.Button(button_frame, text="Eliminar Tareas",
                    command=self.delete_task).pack(side=tk.LEFT)
 
     def add_task(self, event=None):
@@ -96,11 +102,9 @@ class TaskManagerApp:
         task_text = self.task_entry.get().strip()
 
         if task_text:  # Verificar que la tarea no esté vacía
-            # Añadir a la lista interna de tareas
-            self.tasks.append((task_text, False))  # (tarea, completada=False)
-
-            # Añadir a la vista de árbol
-            self.task_list.insert("", tk.END, values=(task_text, "Pendiente"))
+            # Añadir a la vista de árbol y guardar la tarea con el ID de su ítem
+            item_id = self.task_list.insert("", tk.END, values=(task_text, "Pendiente"))
+            self.tasks[item_id] = (task_text, False)  # (tarea, completada=False)
 
             # Limpiar el campo de entrada
             self.task_entry.delete(0, tk.END)
@@ -110,68 +114,57 @@ class TaskManagerApp:
         # Devolver el foco al campo de entrada
         self.task_entry.focus()
 
-    def mark_task_completed(self):
-        """Marca la tarea seleccionada como completada."""
-        # Obtener el ítem seleccionado
-        selected_item = self.task_list.selection()
-
-        if selected_item:  # Si hay un ítem seleccionado
-            item_id = selected_item[0]
-            item_index = self.task_list.index(item_id)
-
-            # Actualizar el estado en la lista interna
-            task_text, is_completed = self.tasks[item_index]
+    def _set_task_status(self, item_id, is_completed):
+        """
+        Cambia el estado de una tarea en el almacén y en la lista.
 
-            if not is_completed:  # Solo si no está completada
-                self.tasks[item_index] = (task_text, True)
+        Args:
+            item_id: ID del ítem de la tarea
+            is_completed: Nuevo estado de la tarea
+        """
+        task_text = self.tasks[item_id][0]
+        self.tasks[item_id] = (task_text, is_completed)
 
-                # Actualizar la visualización en la lista
-                self.task_list.item(item_id, values=(task_text, "Completada"))
+        # Actualizar la visualización en la lista, con el estilo de completada si corresponde
+        status_text = "Completada" if is_completed else "Pendiente"
+        tags = ("completada",) if is_completed else ()
+        self.task_list.item(item_id, values=(task_text, status_text), tags=tags)
 
-                # Opcional: Añadir un estilo visual para tareas completadas (por ejemplo, texto tachado)
-                # Esto requeriría configuración adicional de etiquetas
+    def mark_task_completed(self):
+        """Marca las tareas seleccionadas como completadas."""
+        # Obtener los ítems seleccionados
+        selected_items = self.task_list.selection()
+
+        if selected_items:  # Si hay ítems seleccionados
+            for item_id in selected_items:
+                if not self.tasks[item_id][1]:  # Solo si no está completada
+                    self._set_task_status(item_id, True)
         else:
             messagebox.showinfo("Selección", "Por favor seleccione una tarea.")
 
     def toggle_task_status(self, event=None):
         """
-        Alterna el estado de una tarea entre completada y pendiente con doble clic.
+        Alterna el estado de las tareas seleccionadas entre completada y pendiente.
 
         Args:
-            event: Evento de doble clic
+            event: Evento de doble clic o de la tecla Espacio
         """
-        # Obtener el ítem seleccionado
-        selected_item = self.task_list.selection()
-
-        if selected_item:  # Si hay un ítem seleccionado
-            item_id = selected_item[0]
-            item_index = self.task_list.index(item_id)
-
-            # Obtener el estado actual y cambiarlo
-            task_text, is_completed = self.tasks[item_index]
-            new_status = not is_completed
-
-            # Actualizar en la lista interna
-            self.tasks[item_index] = (task_text, new_status)
-
-            # Actualizar la visualización en la lista
-            status_text = "Completada" if new_status else "Pendiente"
-            self.task_list.item(item_id, values=(task_text, status_text))
+        # Obtener los ítems seleccionados y cambiar el estado de cada uno
+        for item_id in self.task_list.selection():
+            self._set_task_status(item_id, not self.tasks[item_id][1])
 
     def delete_task(self):
-        """Elimina la tarea seleccionada de la lista."""
-        # Obtener el ítem seleccionado
-        selected_item = self.task_list.selection()
-
-        if selected_item:  # Si hay un ítem seleccionado
-            item_id = selected_item[0]
-            item_index = self.task_list.index(item_id)
+        """Elimina las tareas seleccionadas de la lista."""
+        # Obtener los ítems seleccionados
+        selected_items = self.task_list.selection()
 
-            # Eliminar de la lista interna
-            del self.tasks[item_index]
+        if selected_items:  # Si hay ítems seleccionados
+            # Eliminar del almacén por ID
+            for item_id in selected_items:
+                del self.tasks[item_id]
 
-            # Eliminar de la vista de árbol
-            self.task_list.delete(item_id)
+            # Eliminar de la vista de árbol en una sola llamada
+            self.task_list.delete(*selected_items)
         else:
             messagebox.showinfo("Selección", "Por favor seleccione una tarea.")
 
@@ -0,0 +1,127 @@
+"""
+Benchmark de dibujo y memoria de las listas de tareas (Semanas 13, 15 y 16).
+Compara los widgets anteriores, ttk.Treeview (Semanas 13 y 15) y tk.Listbox (Semana 16),
+contra ListaVirtual, que solo crea en Tk las filas que entran en pantalla.
+Para cada cantidad de tareas mide el tiempo de cargarlas y dibujar la ventana, el tiempo
+medio de saltar a una posición al azar y redibujar, y cuánto crece la memoria residente
+del proceso (Tk reserva su memoria fuera de Python, así que no sirve tracemalloc).
+Cada medición se ejecuta en un proceso aparte. Necesita pantalla (Linux o macOS).
+
+Uso: python benchmark_lista_virtual.py
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from Semana_15 import ListaVirtual
+
+TAMANOS = [10_000, 50_000, 100_000]
+WIDGETS = ["Treeview", "Listbox", "ListaVirtual"]
+COMPLETADAS = 10  # Una de cada 10 tareas está completada (con el estilo gris)
+SALTOS = 50  # Desplazamientos medidos
+
+
+def memoria_residente():
+    """Pico de memoria residente del proceso en bytes."""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def crear_widget(tipo, root):
+    """Crea la lista del tipo indicado como la crean las aplicaciones."""
+    if tipo == "Listbox":
+        widget = tk.Listbox(root, height=12)
+    else:
+        clase = ttk.Treeview if tipo == "Treeview" else ListaVirtual
+        widget = clase(root, columns=("tarea", "estado"), show="headings")
+        widget.heading("tarea", text="Tarea")
+        widget.heading("estado", text="Estado")
+        widget.tag_configure("completada", foreground="gray")
+    widget.pack(fill=tk.BOTH, expand=True)
+    return widget
+
+
+def llenar(tipo, widget, tamano):
+    """Agrega las tareas de a una, como al añadirlas en la aplicación."""
+    for i in range(tamano):
+        completada = i % COMPLETADAS == 0
+        if tipo == "Listbox":
+            widget.insert(tk.END, f"✓ Tarea {i}" if completada else f"Tarea {i}")
+            if completada:
+                widget.itemconfig(i, fg="gray")
+        else:
+            widget.insert("", tk.END, values=(f"Tarea {i}", "Completada" if completada else "Pendiente"),
+                          tags=("completada",) if completada else ())
+
+
+def medir(tipo, tamano):
+    """Mide un widget con `tamano` tareas e imprime los resultados (proceso hijo)."""
+    root = tk.Tk()
+    root.geometry("500x400")
+    widget = crear_widget(tipo, root)
+    root.update()
+    memoria = memoria_residente()
+
+    inicio = time.perf_counter()
+    llenar(tipo, widget, tamano)
+    root.update()
+    carga = time.perf_counter() - inicio
+
+    generador = random.Random(22)
+    inicio = time.perf_counter()
+    for _ in range(SALTOS):
+        widget.yview_moveto(generador.random())
+        root.update()
+    salto = (time.perf_counter() - inicio) / SALTOS
+
+    resultado = {"carga": carga, "salto": salto, "memoria": memoria_residente() - memoria}
+    root.destroy()
+    print(json.dumps(resultado))
+
+
+def hay_pantalla():
+    """True si Tk puede abrir una ventana en este entorno."""
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def ejecutar_hijo(tipo, tamano):
+    """Ejecuta una medición en un proceso aparte y devuelve sus resultados."""
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--medir", tipo, str(tamano)],
+                            capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout)
+
+
+def ejecutar_benchmark():
+    """Mide cada widget con cada cantidad de tareas e imprime la comparación."""
+    if not hay_pantalla():
+        print("Este benchmark necesita pantalla: Tk no pudo abrir una ventana (revise $DISPLAY).")
+        return
+    print(f"{'Tareas':>7} | {'Widget':>12} | {'carga y dibujo s':>16} | {'salto ms':>8} | {'memoria MB':>10}")
+    print("-" * 66)
+    for tamano in TAMANOS:
+        for tipo in WIDGETS:
+            try:
+                resultado = ejecutar_hijo(tipo, tamano)
+            except subprocess.CalledProcessError as error:
+                ultima = error.stderr.strip().splitlines()[-1] if error.stderr.strip() else error
+                print(f"No se pudo medir {tipo}: {ultima}")
+                return
+            print(f"{tamano:>7} | {tipo:>12} | {resultado['carga']:>16.3f} | {resultado['salto'] * 1000:>8.2f} | "
+                  f"{resultado['memoria'] / 1024 ** 2:>10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--medir":
+        medir(sys.argv[2], int(sys.argv[3]))
+    else:
+        ejecutar_benchmark()
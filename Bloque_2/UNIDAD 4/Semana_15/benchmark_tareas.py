@@ -0,0 +1,277 @@
+"""
+Benchmark de las operaciones sobre tareas de TaskManagerApp (Semana 15).
+Compara la versión anterior, que buscaba la posición del ítem seleccionado con index()
+(lineal en el tamaño de la lista) y guardaba las tareas en una lista de tuplas, contra
+el almacén por ID de ítem, que llega a cada tarea en O(1).
+Sobre listas de distintos tamaños ejecuta OPERACIONES operaciones mezcladas (añadir,
+completar, alternar y eliminar una tarea seleccionada) y después completa y elimina
+LOTE tareas seleccionadas a la vez (la versión anterior solo atendía la primera de la
+selección, así que allí se hacen de a una).
+La versión anterior usa una imitación en memoria de ttk.Treeview cuyo index() recorre las
+filas hasta llegar al ítem, como Tk (sin el viaje de ida y vuelta a Tcl, así que sus tiempos
+son una cota inferior). La actual usa la ListaVirtual real con su tabla interna simulada y
+deja los dibujos pendientes para después de cada medición: se puede ejecutar sin pantalla y
+ninguna de las dos mide el dibujo, solo el trabajo de la aplicación.
+
+Uso: python benchmark_tareas.py
+"""
+import operator
+import random
+import time
+
+from Semana_15 import ListaVirtual, TaskManagerApp
+
+TAMANOS = [1_000, 10_000, 50_000]
+OPERACIONES = 10_000
+LOTE = 1_000
+
+
+class TreeviewSimulado:
+    """Imitación en memoria de la tabla interna de ListaVirtual (solo las filas del grupo)."""
+
+    def __init__(self):
+        self.filas = {}
+        self.hijos = []
+        self.seleccion = ()
+        self.contador = 0
+
+    def insert(self, padre, indice):
+        self.contador += 1
+        fila = f"I{self.contador:03X}"
+        self.filas[fila] = {}
+        self.hijos.append(fila)
+        return fila
+
+    def delete(self, *filas):
+        for fila in filas:
+            del self.filas[fila]
+            if fila in self.hijos:
+                self.hijos.remove(fila)
+
+    def detach(self, *filas):
+        for fila in filas:
+            self.hijos.remove(fila)
+
+    def move(self, fila, padre, indice):
+        self.hijos.insert(indice, fila)
+
+    def item(self, fila, **opciones):
+        self.filas[fila].update(opciones)
+
+    def selection_set(self, filas):
+        self.seleccion = tuple(filas)
+
+    def bbox(self, fila):
+        return ""
+
+
+class BarraSimulada:
+    def set(self, primero, ultimo):
+        pass
+
+
+class ListaSinPantalla(ListaVirtual):
+    """ListaVirtual real con la tabla interna y la barra simuladas; dibuja cuando se llama a dibujar()."""
+
+    def __init__(self):
+        self._arbol = TreeviewSimulado()
+        self._barra = BarraSimulada()
+        self._pendientes = []
+        self._iniciar("extended", 12)
+
+    def after_idle(self, funcion):
+        self._pendientes.append(funcion)
+
+    def dibujar(self):
+        """Hace los dibujos pendientes, como Tk cuando queda libre (fuera de la medición)."""
+        while self._pendientes:
+            self._pendientes.pop(0)()
+
+
+class TreeviewAnterior:
+    """
+    Imitación en memoria de la ttk.Treeview de la versión anterior. Como Tk, guarda las filas
+    en orden y las elimina sin mover las demás, e index() recorre las filas desde la primera
+    hasta llegar al ítem, así su costo crece con la posición.
+    """
+
+    def __init__(self):
+        self.filas = {}  # ID -> {"values": ..., "tags": ...}, en el orden de la lista
+        self.seleccion = ()
+        self.contador = 0
+
+    def insert(self, padre, indice, values=(), tags=()):
+        self.contador += 1
+        item_id = f"I{self.contador:03X}"
+        self.filas[item_id] = {"values": tuple(values), "tags": tuple(tags)}
+        return item_id
+
+    def index(self, item_id):
+        return operator.indexOf(self.filas, item_id)
+
+    def item(self, item_id, option=None, **opciones):
+        if opciones:
+            self.filas[item_id].update(opciones)
+            return None
+        return self.filas[item_id][option] if option else self.filas[item_id]
+
+    def delete(self, *items):
+        for item_id in items:
+            del self.filas[item_id]
+        self.seleccion = tuple(item_id for item_id in self.seleccion if item_id not in items)
+
+    def selection(self):
+        return self.seleccion
+
+    def selection_set(self, *items):
+        self.seleccion = items[0] if len(items) == 1 and isinstance(items[0], (tuple, list)) else items
+
+    def get_children(self):
+        return tuple(self.filas)
+
+    def dibujar(self):
+        pass
+
+
+class EntrySimulado:
+    """Imitación de ttk.Entry que siempre devuelve el mismo texto."""
+
+    def __init__(self):
+        self.texto = ""
+
+    def get(self):
+        return self.texto
+
+    def delete(self, primero, ultimo):
+        pass
+
+    def focus(self):
+        pass
+
+
+class TaskManagerAppAnterior:
+    """Versión anterior: lista de tuplas indexada por la posición del ítem en la lista."""
+
+    def __init__(self):
+        self.tasks = []
+        self.task_list = TreeviewAnterior()
+        self.task_entry = EntrySimulado()
+
+    def add_task(self):
+        task_text = self.task_entry.get().strip()
+        self.tasks.append((task_text, False))
+        self.task_list.insert("", "end", values=(task_text, "Pendiente"))
+
+    def mark_task_completed(self):
+        item_id = self.task_list.selection()[0]
+        item_index = self.task_list.index(item_id)
+        task_text, is_completed = self.tasks[item_index]
+        if not is_completed:
+            self.tasks[item_index] = (task_text, True)
+            self.task_list.item(item_id, values=(task_text, "Completada"), tags=("completada",))
+
+    def toggle_task_status(self):
+        item_id = self.task_list.selection()[0]
+        item_index = self.task_list.index(item_id)
+        task_text, is_completed = self.tasks[item_index]
+        self.tasks[item_index] = (task_text, not is_completed)
+        status_text = "Completada" if not is_completed else "Pendiente"
+        tags = ("completada",) if not is_completed else ()
+        self.task_list.item(item_id, values=(task_text, status_text), tags=tags)
+
+    def delete_task(self):
+        item_id = self.task_list.selection()[0]
+        item_index = self.task_list.index(item_id)
+        del self.tasks[item_index]
+        self.task_list.delete(item_id)
+
+
+def crear_actual():
+    """TaskManagerApp real sin ventana: se reemplazan los widgets por los simulados."""
+    app = TaskManagerApp.__new__(TaskManagerApp)
+    app.tasks = {}
+    app.task_list = ListaSinPantalla()
+    app.task_entry = EntrySimulado()
+    return app
+
+
+def operaciones_mezcladas(app, ids, generador):
+    """Ejecuta OPERACIONES operaciones al azar y devuelve los segundos que tomaron."""
+    total = 0
+    for i in range(OPERACIONES):
+        operacion = generador.choice(["añadir", "completar", "alternar", "eliminar"])
+        if operacion == "añadir":
+            app.task_entry.texto = f"Nueva {i}"
+            inicio = time.perf_counter()
+            app.add_task()
+            total += time.perf_counter() - inicio
+            app.task_list.dibujar()  # Fuera de la medición
+            ids.append(app.task_list.get_children()[-1])
+            continue
+        # Seleccionar una tarea al azar (fuera de la medición)
+        posicion = generador.randrange(len(ids))
+        app.task_list.selection_set(ids[posicion])
+        app.task_list.dibujar()
+        inicio = time.perf_counter()
+        if operacion == "completar":
+            app.mark_task_completed()
+        elif operacion == "alternar":
+            app.toggle_task_status()
+        else:
+            app.delete_task()
+        total += time.perf_counter() - inicio
+        app.task_list.dibujar()
+        if operacion == "eliminar":
+            ids[posicion] = ids[-1]
+            ids.pop()
+    return total
+
+
+def operaciones_en_lote(app, ids, generador):
+    """Completa y elimina LOTE tareas seleccionadas; devuelve los segundos que tomaron."""
+    seleccion = generador.sample(ids, LOTE)
+    inicio = time.perf_counter()
+    if isinstance(app, TaskManagerAppAnterior):
+        for operacion in [app.mark_task_completed, app.delete_task]:
+            for item_id in seleccion:
+                app.task_list.selection_set(item_id)
+                operacion()
+    else:
+        for operacion in [app.mark_task_completed, app.delete_task]:
+            app.task_list.selection_set(seleccion)
+            operacion()
+    total = time.perf_counter() - inicio
+    app.task_list.dibujar()
+    return total
+
+
+def estado(app):
+    """Tareas y filas de la lista, para comprobar que ambas versiones terminan iguales."""
+    tareas = app.tasks if isinstance(app, TaskManagerAppAnterior) else list(app.tasks.values())
+    filas = [app.task_list.item(item_id, "values") for item_id in app.task_list.get_children()]
+    return tareas, filas
+
+
+def ejecutar_benchmark():
+    """Mide ambas versiones con cada tamaño inicial de la lista."""
+    print(f"{OPERACIONES:,} operaciones mezcladas y un lote de {LOTE:,} tareas completadas y eliminadas")
+    print(f"{'Tareas':>7} | {'Versión':>8} | {'mezcladas s':>11} | {'ops/s':>8} | {'lote s':>7}")
+    print("-" * 56)
+    for tamano in TAMANOS:
+        estados = []
+        for nombre, app in [("anterior", TaskManagerAppAnterior()), ("actual", crear_actual())]:
+            for i in range(tamano):
+                app.task_entry.texto = f"Tarea {i}"
+                app.add_task()
+            app.task_list.dibujar()
+            ids = list(app.task_list.get_children())
+            generador = random.Random(23)
+            mezcladas = operaciones_mezcladas(app, ids, generador)
+            lote = operaciones_en_lote(app, ids, generador)
+            estados.append(estado(app))
+            print(f"{tamano:>7} | {nombre:>8} | {mezcladas:>11.3f} | {OPERACIONES / mezcladas:>8.0f} | {lote:>7.3f}")
+        assert estados[0] == estados[1]
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
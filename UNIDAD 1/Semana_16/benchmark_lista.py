@@ -0,0 +1,241 @@
+"""
+Benchmark de actualización de la lista de tareas de TodoApp (Semana 16).
+Compara la versión anterior, que borraba y reinsertaba toda la lista en cada cambio
+(con búsquedas en listas), contra TodoApp con TaskModel, que solo toca la fila afectada.
+Usa un Listbox simulado en memoria en lugar de Tk para la versión anterior y la
+ListaVirtual real con su tabla interna simulada para la actual, así se puede ejecutar
+sin pantalla y se mide el trabajo de la aplicación y no el del dibujo de Tk.
+
+Uso: python benchmark_lista.py
+"""
+import time
+
+from gestordeeventos import ListaVirtual, TaskModel, TodoApp
+
+TAMANOS = [1_000, 10_000, 50_000]
+COMPLETADAS = 0.1  # Fracción de las tareas iniciales que ya están completadas
+OPERACIONES = 3  # Operaciones medidas de cada tipo
+
+
+class ListboxSimulado:
+    """Imitación en memoria de tk.Listbox con lo que usa TodoApp."""
+
+    def __init__(self):
+        self.filas = []
+        self.colores = {}
+        self.seleccion = 0
+
+    def _indice(self, indice):
+        return len(self.filas) if indice == "end" else indice
+
+    def insert(self, indice, *elementos):
+        indice = self._indice(indice)
+        self.filas[indice:indice] = elementos
+
+    def delete(self, primero, ultimo=None):
+        primero = self._indice(primero)
+        ultimo = primero if ultimo is None else self._indice(ultimo)
+        del self.filas[primero:ultimo + 1]
+
+    def itemconfig(self, indice, **opciones):
+        self.colores[self._indice(indice)] = opciones.get("fg")
+
+    def get(self, indice):
+        return self.filas[indice]
+
+    def size(self):
+        return len(self.filas)
+
+    def curselection(self):
+        return (self.seleccion,)
+
+
+class TreeviewSimulado:
+    """Imitación en memoria de la tabla interna de ListaVirtual (solo las filas del grupo)."""
+
+    def __init__(self):
+        self.filas = {}
+        self.hijos = []
+        self.seleccion = ()
+        self.contador = 0
+
+    def insert(self, padre, indice):
+        self.contador += 1
+        fila = f"I{self.contador:03X}"
+        self.filas[fila] = {}
+        self.hijos.append(fila)
+        return fila
+
+    def delete(self, *filas):
+        for fila in filas:
+            del self.filas[fila]
+            if fila in self.hijos:
+                self.hijos.remove(fila)
+
+    def detach(self, *filas):
+        for fila in filas:
+            self.hijos.remove(fila)
+
+    def move(self, fila, padre, indice):
+        self.hijos.insert(indice, fila)
+
+    def item(self, fila, **opciones):
+        self.filas[fila].update(opciones)
+
+    def selection_set(self, filas):
+        self.seleccion = tuple(filas)
+
+    def bbox(self, fila):
+        return ""
+
+
+class BarraSimulada:
+    def set(self, primero, ultimo):
+        pass
+
+
+class ListaSinPantalla(ListaVirtual):
+    """ListaVirtual real con la tabla interna y la barra simuladas, que dibuja en cada cambio."""
+
+    def __init__(self):
+        self._arbol = TreeviewSimulado()
+        self._barra = BarraSimulada()
+        self._iniciar("browse", 12)
+
+    def after_idle(self, funcion):
+        funcion()
+
+
+class EntrySimulado:
+    """Imitación de ttk.Entry que siempre devuelve el mismo texto."""
+
+    def __init__(self):
+        self.texto = ""
+
+    def get(self):
+        return self.texto
+
+    def delete(self, primero, ultimo):
+        pass
+
+
+class TodoAppAnterior:
+    """Versión anterior de TodoApp: listas de textos y redibujado completo en cada cambio."""
+
+    def __init__(self):
+        self.tasks = []
+        self.completed_tasks = []
+        self.task_listbox = ListboxSimulado()
+        self.task_entry = EntrySimulado()
+
+    def add_task(self):
+        self.tasks.append(self.task_entry.get().strip())
+        self.update_listbox()
+
+    def complete_task(self):
+        index = self.task_listbox.curselection()[0]
+        if self.task_listbox.get(index).startswith("✓ "):
+            return
+        self.completed_tasks.append(self.tasks[index])
+        self.update_listbox()
+
+    def delete_task(self):
+        index = self.task_listbox.curselection()[0]
+        task = self.task_listbox.get(index)
+        if task.startswith("✓ "):
+            if task[2:].strip() in self.completed_tasks:
+                self.completed_tasks.remove(task[2:].strip())
+        else:
+            self.tasks.remove(task)
+        self.update_listbox()
+
+    def update_listbox(self):
+        self.task_listbox.delete(0, "end")
+        for task in self.tasks:
+            if task not in self.completed_tasks:
+                self.task_listbox.insert("end", task)
+        for task in self.completed_tasks:
+            if task in self.tasks:
+                self.task_listbox.insert("end", f"✓ {task}")
+                self.task_listbox.itemconfig(self.task_listbox.size() - 1, fg="gray")
+
+
+def crear_actual():
+    """TodoApp real sin ventana: se reemplazan los widgets por los simulados."""
+    app = TodoApp.__new__(TodoApp)
+    app.model = TaskModel()
+    app.task_list = ListaSinPantalla()
+    app.task_entry = EntrySimulado()
+    return app
+
+
+def seleccionar(app, fila):
+    """Seleccionar una fila de la lista, sea cual sea la versión."""
+    if isinstance(app, TodoAppAnterior):
+        app.task_listbox.seleccion = fila
+    else:
+        app.task_list.selection_set(app.task_list.get_children()[fila])
+
+
+def filas(app):
+    """Textos de las filas de la lista, sea cual sea la versión."""
+    if isinstance(app, TodoAppAnterior):
+        return app.task_listbox.filas
+    return [app.task_list.item(task_id, "values")[0] for task_id in app.task_list.get_children()]
+
+
+def preparar(app, tamano):
+    """Añade `tamano` tareas y completa una fracción de ellas."""
+    for i in range(tamano):
+        app.task_entry.texto = f"Tarea {i}"
+        app.add_task()
+    for _ in range(int(tamano * COMPLETADAS)):
+        seleccionar(app, 0)  # La primera pendiente
+        app.complete_task()
+
+
+def medir(app, tamano):
+    """Devuelve los milisegundos promedio de añadir, completar y eliminar una tarea."""
+    tiempos = {}
+    for nombre in ["añadir", "completar", "eliminar"]:
+        total = 0
+        for i in range(OPERACIONES):
+            seleccionar(app, tamano // 3 + i)  # Una fila pendiente del medio (fuera de la medición)
+            app.task_entry.texto = f"Nueva {i}"
+            inicio = time.perf_counter()
+            if nombre == "añadir":
+                app.add_task()
+            elif nombre == "completar":
+                app.complete_task()
+            else:
+                app.delete_task()
+            total += time.perf_counter() - inicio
+        tiempos[nombre] = total / OPERACIONES * 1000
+    return tiempos
+
+
+def preparar_anterior(app, tamano):
+    """Igual que preparar, pero sin pagar el redibujado completo de cada paso previo."""
+    app.tasks = [f"Tarea {i}" for i in range(tamano)]
+    app.completed_tasks = app.tasks[:int(tamano * COMPLETADAS)]
+    app.update_listbox()
+
+
+def ejecutar_benchmark():
+    """Mide ambas versiones con cada tamaño e imprime los milisegundos por operación."""
+    print(f"{'Tareas':>7} | {'Versión':>8} | {'añadir ms':>10} | {'completar ms':>12} | {'eliminar ms':>11}")
+    print("-" * 62)
+    for tamano in TAMANOS:
+        anterior = TodoAppAnterior()
+        preparar_anterior(anterior, tamano)
+        actual = crear_actual()
+        preparar(actual, tamano)
+        assert filas(actual) == filas(anterior)
+        for nombre, app in [("anterior", anterior), ("actual", actual)]:
+            tiempos = medir(app, tamano)
+            print(f"{tamano:>7} | {nombre:>8} | {tiempos['añadir']:>10.3f} | "
+                  f"{tiempos['completar']:>12.3f} | {tiempos['eliminar']:>11.3f}")
+
+
+if __name__ == "__main__":
+    ejecutar_benchmark()
@@ -1,6 +1,55 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import itertools
 import os
+import sys
+
+# ListaVirtual es compartida por los gestores de tareas y vive en la raíz del repositorio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from lista_virtual import ListaVirtual
+
+
+class TaskModel:
+    """Modelo de tareas con IDs estables y estado de completado en un conjunto ordenado.
+    Las filas se muestran con las pendientes primero (por orden de creación) y después
+    las completadas (por orden de completado); cada cambio indica en qué fila de la
+    vista va la tarea, así la vista solo toca esa fila."""
+
+    def __init__(self):
+        self.texts = {}  # ID -> texto de la tarea, por orden de creación
+        self.completed = {}  # IDs completados, por orden de completado (diccionario como conjunto ordenado)
+        self._next_id = itertools.count(1)
+
+    @property
+    def pending_count(self):
+        return len(self.texts) - len(self.completed)
+
+    def add(self, text):
+        """Añadir una tarea pendiente; devuelve (ID, fila donde se muestra)"""
+        task_id = next(self._next_id)
+        row = self.pending_count
+        self.texts[task_id] = text
+        return task_id, row
+
+    def complete(self, task_id):
+        """Completar una tarea; devuelve su nueva fila, o None si ya estaba completada"""
+        if task_id in self.completed:
+            return None
+        self.completed[task_id] = None
+        return len(self.texts) - 1
+
+    def delete(self, task_id):
+        """Eliminar una tarea"""
+        del self.texts[task_id]
+        self.completed.pop(task_id, None)
+
+    def label(self, task_id):
+        """Texto de la fila de una tarea"""
+        text = self.texts[task_id]
+        return f"✓ {text}" if task_id in self.completed else text
+
+    def __len__(self):
+        return len(self.texts)
 
 
 class TodoApp:
@@ -13,9 +62,8 @@ class TodoApp:
         # Configuración del tema y estilo
         self.configure_styles()
 
-        # Variables
-        self.tasks = []
-        self.completed_tasks = []
+        # Modelo de tareas
+        self.model = TaskModel()
 
         # Crear widgets
         self.create_widgets()
@@ -78,17 +126,12 @@ class TodoApp:
         tasks_frame = ttk.LabelFrame(main_frame, text="Lista de Tareas")
         tasks_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        # Scrollbar para la lista
-        scrollbar = ttk.Scrollbar(tasks_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Lista de tareas
-        self.task_listbox = tk.Listbox(tasks_frame, height=12, selectmode=tk.SINGLE)
-        self.task_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Lista de tareas virtualizada (con su propia scrollbar): solo existen en Tk las filas visibles
+        self.task_list = ListaVirtual(tasks_frame, columns=("task",), show="", selectmode="browse", height=12)
+        self.task_list.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Configurar scrollbar
-        self.task_listbox.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=self.task_listbox.yview)
+        # Estilo visual para tareas completadas
+        self.task_list.tag_configure("completed", foreground="gray")
 
         # Frame para botones de acción
         button_frame = ttk.Frame(main_frame)
@@ -139,8 +182,9 @@ class TodoApp:
         """Añadir una nueva tarea a la lista"""
         task = self.task_entry.get().strip()
         if task:
-            self.tasks.append(task)
-            self.update_listbox()
+            # Solo se inserta la fila nueva, al final de las pendientes
+            task_id, row = self.model.add(task)
+            self.task_list.insert("", row, iid=task_id, values=(task,))
             self.task_entry.delete(0, tk.END)
         else:
             messagebox.showwarning("Advertencia", "Por favor, ingrese una tarea.")
@@ -148,16 +192,17 @@ class TodoApp:
     def complete_task(self):
         """Marcar tarea seleccionada como completada"""
         try:
-            index = self.task_listbox.curselection()[0]
-            task = self.task_listbox.get(index)
+            task_id = self.task_list.selection()[0]
 
-            # Verificar si la tarea ya está completada
-            if task.startswith("✓ "):
+            # Marcar como completada (None si ya lo estaba)
+            new_row = self.model.complete(task_id)
+            if new_row is None:
                 return
 
-            # Marcar como completada
-            self.completed_tasks.append(self.tasks[index])
-            self.update_listbox()
+            # Mover solo esa fila al final, con el estilo de completada
+            self.task_list.delete(task_id)
+            self.task_list.insert("", new_row, iid=task_id, values=(self.model.label(task_id),),
+                                  tags=("completed",))
 
         except IndexError:
             messagebox.showinfo("Información", "Por favor, seleccione una tarea para completar.")
@@ -165,43 +210,15 @@ class TodoApp:
     def delete_task(self):
         """Eliminar tarea seleccionada"""
         try:
-            index = self.task_listbox.curselection()[0]
-            task = self.task_listbox.get(index)
+            task_id = self.task_list.selection()[0]
 
-            # Determinar si la tarea está completada
-            is_completed = task.startswith("✓ ")
-
-            # Eliminar de la lista correspondiente
-            if is_completed:
-                # Extraer el texto real de la tarea (sin el prefijo)
-                task_text = task[2:].strip()
-                if task_text in self.completed_tasks:
-                    self.completed_tasks.remove(task_text)
-            else:
-                self.tasks.remove(task)
-
-            self.update_listbox()
+            # Eliminar la tarea del modelo y solo su fila de la lista
+            self.model.delete(task_id)
+            self.task_list.delete(task_id)
 
         except IndexError:
             messagebox.showinfo("Información", "Por favor, seleccione una tarea para eliminar.")
 
-    def update_listbox(self):
-        """Actualizar la visualización de la lista de tareas"""
-        self.task_listbox.delete(0, tk.END)
-
-        # Añadir tareas pendientes
-        for task in self.tasks:
-            if task not in self.completed_tasks:
-                self.task_listbox.insert(tk.END, task)
-
-        # Añadir tareas completadas
-        for task in self.completed_tasks:
-            if task in self.tasks:
-                self.task_listbox.insert(tk.END, f"✓ {task}")
-                # Configurar estilo visual para tareas completadas
-                index = self.task_listbox.size() - 1
-                self.task_listbox.itemconfig(index, fg="gray")
-
 
 def main():
     root = tk.Tk()
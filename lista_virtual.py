@@ -0,0 +1,396 @@
+"""
+Lista virtualizada compartida por los gestores de tareas de Semana_13, Semana_15 y
+Semana_16. Cada aplicación la importa desde aquí (agregando la raíz del repositorio a
+sys.path), así hay una sola copia del widget.
+"""
+import tkinter as tk
+from tkinter import ttk
+import bisect
+import itertools
+
+
+class ListaVirtual(ttk.Frame):
+    """
+    Lista virtualizada con la misma interfaz de ttk.Treeview que usa la aplicación.
+    Las filas se guardan en un diccionario (ID -> valores y etiquetas) y su orden en una
+    lista de bloques cortos de IDs, con el bloque de cada ID: insertar en medio, eliminar
+    o buscar la posición de una fila solo recorre un bloque y la lista de bloques, no
+    todas las filas. En Tk solo existe un grupo fijo de filas, las que entran en pantalla:
+    al desplazarse se rellenan con los datos de la nueva posición. La selección se guarda
+    por ID, así se conserva aunque la fila salga de la pantalla.
+    """
+
+    TAMANO_BLOQUE = 256  # IDs por bloque; un bloque que llega al doble se parte en dos
+
+    def __init__(self, master, columns=(), show="headings", selectmode="browse", height=10):
+        """
+        Crea la tabla interna, su barra de desplazamiento y los eventos de ratón y teclado.
+
+        Args:
+            master: Widget contenedor
+            columns: Columnas de la tabla, como en ttk.Treeview
+            show: Qué partes mostrar, como en ttk.Treeview
+            selectmode: "browse" (una fila) o "extended" (varias, con Ctrl y Shift)
+            height: Filas visibles hasta que se conozca el tamaño real de la tabla
+        """
+        super().__init__(master)
+        # La tabla interna no selecciona por su cuenta: la selección la lleva la lista
+        self._arbol = ttk.Treeview(self, columns=columns, show=show, selectmode="none", height=height)
+        self._barra = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self._barra.pack(side=tk.RIGHT, fill=tk.Y)
+        self._arbol.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._iniciar(selectmode, height)
+
+        # Eventos propios en una etiqueta aparte, antes de los que agregue la aplicación con bind
+        etiqueta = f"ListaVirtual{id(self)}"
+        self._arbol.bindtags((etiqueta,) + self._arbol.bindtags())
+        eventos = {
+            "<Button-1>": lambda event: self._al_hacer_clic(event, "reemplazar"),
+            "<Control-Button-1>": lambda event: self._al_hacer_clic(event, "alternar"),
+            "<Shift-Button-1>": lambda event: self._al_hacer_clic(event, "rango"),
+            "<Up>": lambda event: self._mover_cursor(-1),
+            "<Down>": lambda event: self._mover_cursor(1),
+            "<Shift-Up>": lambda event: self._mover_cursor(-1, rango=True),
+            "<Shift-Down>": lambda event: self._mover_cursor(1, rango=True),
+            "<Prior>": lambda event: self._mover_cursor(-len(self._grupo)),
+            "<Next>": lambda event: self._mover_cursor(len(self._grupo)),
+            "<Home>": lambda event: self._mover_cursor(-len(self._filas)),
+            "<End>": lambda event: self._mover_cursor(len(self._filas)),
+            "<Control-a>": self._seleccionar_todo,
+            "<Control-A>": self._seleccionar_todo,
+            "<MouseWheel>": self._al_girar_rueda,
+            "<Button-4>": self._al_girar_rueda,
+            "<Button-5>": self._al_girar_rueda,
+            "<Configure>": self._al_cambiar_tamano,
+        }
+        for secuencia, funcion in eventos.items():
+            self._arbol.bind_class(etiqueta, secuencia, funcion)
+
+    def _iniciar(self, selectmode, filas):
+        """Estado inicial de la lista, con un grupo de `filas` filas reales."""
+        self._filas = {}  # ID -> (valores, etiquetas)
+        self._bloques = [[]]  # Orden de la lista: IDs repartidos en bloques consecutivos
+        self._bloque_de = {}  # ID -> bloque que lo contiene
+        self._comienzos = None  # Posición de la primera fila de cada bloque (None: recalcular)
+        self._numero_bloque = {}  # id(bloque) -> número de bloque, junto con _comienzos
+        self._seleccion = {}  # IDs seleccionados (diccionario como conjunto ordenado)
+        self._modo = selectmode
+        self._ancla = None  # ID desde el que se extiende la selección con Shift
+        self._cursor = None  # ID de la fila activa para el teclado
+        self._inicio = 0  # Posición de la primera fila visible
+        self._visibles = []  # IDs que se muestran ahora, uno por fila del grupo
+        self._grupo = []  # Filas reales de la tabla interna, que se reutilizan
+        self._adjuntas = 0  # Filas del grupo que están en la tabla
+        self._alto_fila = None  # Se mide con la primera fila en pantalla
+        self._cabecera = 0
+        self._dibujo_pendiente = False
+        self._contador = itertools.count(1)
+        self._ajustar_grupo(filas)
+
+    # Interfaz compatible con ttk.Treeview
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        """Agregar una fila como Treeview.insert (la lista es plana: parent siempre es ""); devuelve su ID."""
+        if iid is None:
+            iid = f"I{next(self._contador):03X}"
+            while iid in self._filas:
+                iid = f"I{next(self._contador):03X}"
+        elif iid in self._filas:
+            raise tk.TclError(f"Item {iid} already exists")
+        if index == tk.END or index >= len(self._filas):
+            # Al final: los bloques anteriores no se mueven y sus comienzos siguen valiendo
+            numero, bloque = len(self._bloques) - 1, self._bloques[-1]
+            bloque.append(iid)
+        else:
+            numero, desplazamiento = self._ubicar(max(0, index))
+            bloque = self._bloques[numero]
+            bloque.insert(desplazamiento, iid)
+            self._comienzos = None
+        self._filas[iid] = (tuple(values), (tags,) if isinstance(tags, str) else tuple(tags))
+        self._bloque_de[iid] = bloque
+        if len(bloque) >= 2 * self.TAMANO_BLOQUE:
+            # Partir el bloque: la segunda mitad pasa a un bloque nuevo a continuación
+            nuevo = bloque[self.TAMANO_BLOQUE:]
+            del bloque[self.TAMANO_BLOQUE:]
+            self._bloques.insert(numero + 1, nuevo)
+            self._bloque_de.update(dict.fromkeys(nuevo, nuevo))
+            self._comienzos = None
+        self._programar_dibujo()
+        return iid
+
+    def delete(self, *items):
+        """Eliminar filas como Treeview.delete; cada bloque afectado se filtra y se dibuja una sola vez."""
+        for item in items:
+            self._comprobar(item)
+        afectados = {}
+        for item in items:
+            if self._filas.pop(item, None) is not None:
+                bloque = self._bloque_de.pop(item)
+                afectados[id(bloque)] = bloque
+            self._seleccion.pop(item, None)
+        for bloque in afectados.values():
+            bloque[:] = [item for item in bloque if item in self._filas]
+        if afectados:
+            self._bloques = [bloque for bloque in self._bloques if bloque] or [[]]
+            if len(self._bloques) > 2 * len(self._filas) // self.TAMANO_BLOQUE + 1:
+                # Quedaron muchos bloques casi vacíos: volver a repartir las filas
+                self._repartir(list(itertools.chain.from_iterable(self._bloques)))
+            self._comienzos = None
+        self._programar_dibujo()
+
+    def item(self, item, option=None, **kw):
+        """Consultar o cambiar los valores y etiquetas de una fila como Treeview.item."""
+        valores, etiquetas = self._comprobar(item)
+        if kw:
+            if "values" in kw:
+                valores = tuple(kw["values"])
+            if "tags" in kw:
+                etiquetas = (kw["tags"],) if isinstance(kw["tags"], str) else tuple(kw["tags"])
+            self._filas[item] = (valores, etiquetas)
+            if item in self._visibles:
+                self._programar_dibujo()
+            return None
+        datos = {"values": valores, "tags": etiquetas}
+        return datos[option] if option else datos
+
+    def selection(self):
+        """IDs seleccionados, en el orden en que se seleccionaron."""
+        return tuple(self._seleccion)
+
+    def selection_set(self, *items):
+        self._seleccion = dict.fromkeys(self._aplanar(items))
+        self._programar_dibujo()
+
+    def selection_add(self, *items):
+        self._seleccion.update(dict.fromkeys(self._aplanar(items)))
+        self._programar_dibujo()
+
+    def selection_remove(self, *items):
+        for item in self._aplanar(items):
+            self._seleccion.pop(item, None)
+        self._programar_dibujo()
+
+    def index(self, item):
+        """Posición de una fila: comienzo de su bloque más su lugar dentro del bloque."""
+        self._comprobar(item)
+        bloque = self._bloque_de[item]
+        comienzos = self._calcular_comienzos()
+        return comienzos[self._numero_bloque[id(bloque)]] + bloque.index(item)
+
+    def exists(self, item):
+        return item in self._filas
+
+    def get_children(self, item=""):
+        return tuple(itertools.chain.from_iterable(self._bloques))
+
+    def see(self, item):
+        """Desplazar la lista lo justo para que se vea la fila."""
+        self._mostrar_posicion(self.index(item))
+
+    def heading(self, column, option=None, **kw):
+        return self._arbol.heading(column, option, **kw)
+
+    def column(self, column, option=None, **kw):
+        return self._arbol.column(column, option, **kw)
+
+    def tag_configure(self, tagname, option=None, **kw):
+        return self._arbol.tag_configure(tagname, option, **kw)
+
+    def bind(self, sequence=None, func=None, add=None):
+        """Los eventos llegan a la tabla interna, salvo los virtuales como <<TreeviewSelect>>."""
+        if sequence and sequence.startswith("<<"):
+            return super().bind(sequence, func, add)
+        return self._arbol.bind(sequence, func, add)
+
+    def focus_set(self):
+        self._arbol.focus_set()
+
+    def yview(self, *args):
+        """Desplazar como Treeview.yview (lo llama la barra); sin argumentos devuelve la fracción visible."""
+        total = len(self._filas)
+        if not args:
+            if not total:
+                return 0.0, 1.0
+            return self._inicio / total, min(1.0, (self._inicio + len(self._grupo)) / total)
+        if args[0] == tk.MOVETO:
+            inicio = round(float(args[1]) * total)
+        else:
+            paso = int(args[1]) * (len(self._grupo) if args[2] == tk.PAGES else 1)
+            inicio = self._inicio + paso
+        self._desplazar(inicio)
+        return None
+
+    def yview_moveto(self, fraction):
+        self.yview(tk.MOVETO, fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview(tk.SCROLL, number, what)
+
+    # Orden de las filas
+
+    def _calcular_comienzos(self):
+        """Posición de la primera fila de cada bloque, recalculada solo si cambió (O(bloques))."""
+        if self._comienzos is None:
+            self._comienzos = list(itertools.accumulate(map(len, self._bloques[:-1]), initial=0))
+            self._numero_bloque = {id(bloque): numero for numero, bloque in enumerate(self._bloques)}
+        return self._comienzos
+
+    def _ubicar(self, posicion):
+        """Número de bloque y lugar dentro de él de la fila en `posicion`."""
+        comienzos = self._calcular_comienzos()
+        numero = bisect.bisect_right(comienzos, posicion) - 1
+        return numero, posicion - comienzos[numero]
+
+    def _desde(self, posicion):
+        """IDs en orden a partir de `posicion`, sin recorrer las filas anteriores."""
+        numero, desplazamiento = self._ubicar(posicion)
+        return itertools.chain(self._bloques[numero][desplazamiento:],
+                               itertools.chain.from_iterable(self._bloques[numero + 1:]))
+
+    def _repartir(self, orden):
+        """Repartir los IDs de `orden` en bloques nuevos de TAMANO_BLOQUE IDs."""
+        tamano = self.TAMANO_BLOQUE
+        self._bloques = [orden[inicio:inicio + tamano] for inicio in range(0, len(orden), tamano)] or [[]]
+        self._bloque_de = {item: bloque for bloque in self._bloques for item in bloque}
+        self._comienzos = None
+
+    # Dibujo
+
+    def _comprobar(self, item):
+        """Datos de una fila; error de Tk si no existe, como en Treeview."""
+        try:
+            return self._filas[item]
+        except KeyError:
+            raise tk.TclError(f"Item {item} not found") from None
+
+    @staticmethod
+    def _aplanar(items):
+        """Aceptar tanto f(a, b) como f((a, b)), como Treeview."""
+        if len(items) == 1 and isinstance(items[0], (tuple, list)):
+            return items[0]
+        return items
+
+    def _programar_dibujo(self):
+        """Juntar los cambios seguidos en un solo dibujo cuando Tk esté libre."""
+        if not self._dibujo_pendiente:
+            self._dibujo_pendiente = True
+            self.after_idle(self._dibujar)
+
+    def _dibujar(self):
+        """Rellenar las filas del grupo con las filas de datos desde la posición actual."""
+        self._dibujo_pendiente = False
+        self._inicio = max(0, min(self._inicio, len(self._filas) - len(self._grupo)))
+        self._visibles = list(itertools.islice(self._desde(self._inicio), len(self._grupo)))
+
+        # Quitar o volver a poner las filas del grupo que sobran o faltan al final
+        cantidad = len(self._visibles)
+        if cantidad < self._adjuntas:
+            self._arbol.detach(*self._grupo[cantidad:self._adjuntas])
+        for posicion in range(self._adjuntas, cantidad):
+            self._arbol.move(self._grupo[posicion], "", posicion)
+        self._adjuntas = cantidad
+
+        seleccionadas = []
+        for fila, item in zip(self._grupo, self._visibles):
+            valores, etiquetas = self._filas[item]
+            self._arbol.item(fila, values=valores, tags=etiquetas)
+            if item in self._seleccion:
+                seleccionadas.append(fila)
+        self._arbol.selection_set(seleccionadas)
+        self._barra.set(*self.yview())
+
+        # Con la primera fila en pantalla se conoce su alto y cuántas filas caben
+        if self._alto_fila is None and self._adjuntas:
+            caja = self._arbol.bbox(self._grupo[0])
+            if caja:
+                self._cabecera, self._alto_fila = caja[1], caja[3]
+                self._al_cambiar_tamano()
+
+    def _ajustar_grupo(self, filas):
+        """Crear o eliminar filas reales para que el grupo tenga `filas` filas."""
+        if filas > len(self._grupo):
+            # Las nuevas se quitan de la tabla y el próximo dibujo pone las que hagan falta
+            nuevas = [self._arbol.insert("", tk.END) for _ in range(filas - len(self._grupo))]
+            self._arbol.detach(*nuevas)
+            self._grupo.extend(nuevas)
+        elif filas < len(self._grupo):
+            self._arbol.delete(*self._grupo[filas:])
+            del self._grupo[filas:]
+            self._adjuntas = min(self._adjuntas, filas)
+        self._programar_dibujo()
+
+    def _al_cambiar_tamano(self, event=None):
+        if self._alto_fila:
+            filas = max(1, (self._arbol.winfo_height() - self._cabecera) // self._alto_fila)
+            if filas != len(self._grupo):
+                self._ajustar_grupo(filas)
+
+    def _desplazar(self, inicio):
+        inicio = max(0, min(inicio, len(self._filas) - len(self._grupo)))
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._programar_dibujo()
+
+    def _mostrar_posicion(self, posicion):
+        if posicion < self._inicio:
+            self._desplazar(posicion)
+        elif posicion >= self._inicio + len(self._grupo):
+            self._desplazar(posicion - len(self._grupo) + 1)
+
+    # Ratón y teclado
+
+    def _al_hacer_clic(self, event, modo):
+        """Seleccionar la fila bajo el ratón (Ctrl alterna y Shift extiende en modo extended)."""
+        if self._arbol.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return
+        fila = self._arbol.identify_row(event.y)
+        posicion = self._grupo.index(fila) if fila in self._grupo else len(self._visibles)
+        if posicion < len(self._visibles):
+            self._seleccionar(self._visibles[posicion], modo)
+
+    def _mover_cursor(self, paso, rango=False):
+        """Mover la fila activa con las flechas, Re Pág, Av Pág, Inicio y Fin."""
+        if self._filas:
+            if self._cursor in self._filas:
+                posicion = self.index(self._cursor) + paso
+            else:
+                # Sin fila activa, el primer paso cuenta desde la primera fila visible
+                posicion = self._inicio + paso - (1 if paso > 0 else -1)
+            posicion = max(0, min(posicion, len(self._filas) - 1))
+            item = next(self._desde(posicion))
+            self._seleccionar(item, "rango" if rango else "reemplazar", posicion)
+        return "break"  # Que la tabla interna no se mueva por su cuenta
+
+    def _seleccionar(self, item, modo, posicion=None):
+        """Cambiar la selección por una acción del usuario y avisar con <<TreeviewSelect>>."""
+        if self._modo == "extended" and modo == "alternar":
+            if item in self._seleccion:
+                del self._seleccion[item]
+            else:
+                self._seleccion[item] = None
+            self._ancla = item
+        elif self._modo == "extended" and modo == "rango" and self._ancla in self._filas:
+            desde = self.index(self._ancla)
+            hasta = self.index(item) if posicion is None else posicion
+            desde, hasta = min(desde, hasta), max(desde, hasta)
+            self._seleccion = dict.fromkeys(itertools.islice(self._desde(desde), hasta - desde + 1))
+        else:
+            self._seleccion = {item: None}
+            self._ancla = item
+        self._cursor = item
+        if posicion is not None:
+            self._mostrar_posicion(posicion)
+        self._programar_dibujo()
+        self.event_generate("<<TreeviewSelect>>")
+
+    def _seleccionar_todo(self, event=None):
+        if self._modo == "extended":
+            self._seleccion = dict.fromkeys(self.get_children())
+            self._programar_dibujo()
+            self.event_generate("<<TreeviewSelect>>")
+        return "break"
+
+    def _al_girar_rueda(self, event):
+        arriba = event.num == 4 or event.delta > 0
+        self._desplazar(self._inicio + (-3 if arriba else 3))
+        return "break"